@@ -56,6 +56,10 @@ class ImageDownloader:
         
         # Mapping: post_id -> local_filename
         self.image_mapping = {}
+        
+        # One session for all downloads: keeps the CDN connection alive
+        # instead of a new TCP/TLS handshake per image
+        self.http = requests.Session()
     
     def get_opportunities_with_images(self) -> List[Dict]:
         """
@@ -145,7 +149,7 @@ class ImageDownloader:
             }
             
             # Download with timeout
-            response = requests.get(
+            response = self.http.get(
                 image_url,
                 headers=headers,
                 timeout=30,
@@ -62,6 +62,10 @@ class R2ImageMigrator:
             region_name='auto'
         )
         
+        # Shared by the download workers so Instagram CDN connections are
+        # reused (the default pool keeps up to 10 per host)
+        self.http = requests.Session()
+        
         # Statistics
         self.stats = {
             'total_opportunities': 0,
@@ -149,7 +153,7 @@ class R2ImageMigrator:
                 'Referer': 'https://www.instagram.com/'
             }
             
-            response = requests.get(image_url, headers=headers, timeout=30)
+            response = self.http.get(image_url, headers=headers, timeout=30)
             
             if response.status_code != 200:
                 return False, b'', f"HTTP {response.status_code}"
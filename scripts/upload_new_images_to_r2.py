@@ -73,6 +73,9 @@ class NewImageUploader:
             region_name='auto'
         )
         
+        # Pooled HTTP session for image downloads (thread-safe for GETs)
+        self.http = requests.Session()
+        
         # Statistics
         self.stats = {
             'total_opportunities': 0,
@@ -182,7 +185,7 @@ class NewImageUploader:
             }
             
             # Download with timeout
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.http.get(url, headers=headers, timeout=30)
             
             # Check status
             if response.status_code != 200:
@@ -20,11 +20,11 @@ Usage:
 
 import os
 import sys
-import json
 import io
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 from PIL import Image
 import boto3
@@ -34,6 +34,7 @@ from botocore.exceptions import ClientError
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.extraction.utils.config import config
+from src.extraction.checkpoint_manager import CheckpointManager
 from src.extraction.utils.logger import setup_logger
 
 logger = setup_logger('r2_upload')
@@ -189,31 +190,27 @@ class R2Uploader:
         logger.info(f"Input: {input_file.name}")
         
         # Load data
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = CheckpointManager.read_results(input_file)
         
         self.stats['total_records'] = len(data)
         logger.info(f"Total records: {len(data)}")
         logger.info(f"Parallel workers: {max_workers}")
         
-        # Process with parallel workers
-        modified_data = []
+        # Process with parallel workers. process_single updates each record
+        # in place and returns it, so map() yields the records in input order
+        # without a future -> record table or a second list built in
+        # completion order
+        total = len(data)
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self.process_single, record, i+1, len(data)): record
-                for i, record in enumerate(data)
-            }
-            
-            for future in as_completed(futures):
-                modified_record = future.result()
-                modified_data.append(modified_record)
+            modified_data = list(executor.map(
+                self.process_single, data, range(1, total + 1), repeat(total)
+            ))
         
         # Save modified JSON
         output_file = input_file.parent / input_file.name.replace('.json', '_r2.json')
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(modified_data, f, indent=2, ensure_ascii=False)
+        CheckpointManager.write_results(output_file, modified_data)
         
         logger.info(f"\n{'='*60}")
         logger.info("[COMPLETE] R2 Upload Summary")
@@ -127,6 +127,8 @@ def merge_duplicate_group(conn, group):
     merged_tags = set(keep_record.get('tags', []))
     latest_deadline = keep_record.get('deadline_date')
     latest_registration = keep_record.get('registration_date')
+    # One timestamp for the whole merge (every record is merged by the same update)
+    merged_at = datetime.now().isoformat()
     
     for record in merge_records:
         # Add to secondary sources
@@ -134,7 +136,7 @@ def merge_duplicate_group(conn, group):
             'source_account': record['source_account'],
             'post_id': record['post_id'],
             'source_url': record['source_url'],
-            'merged_at': datetime.now().isoformat(),
+            'merged_at': merged_at,
             'original_id': record['id']
         })
         
@@ -7,32 +7,42 @@ Should run daily via GitHub Actions
 import sys
 from pathlib import Path
 from datetime import date
+from typing import Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add parent directory to path for imports. Import as database.* / extraction.*
+# like the rest of this package: mixing in src.* paths loaded the logger module
+# a second time under another name (client.py imports it as extraction.*)
+sys.path.append(str(Path(__file__).parent.parent))
 
-from src.database.client import DatabaseClient
-from src.extraction.utils.logger import setup_logger
-from src.extraction.utils.config import config
+from database.client import DatabaseClient
+from extraction.utils.logger import setup_logger
+from extraction.utils.config import config
 
 logger = setup_logger('cleanup')
 
-def expire_past_deadlines():
+def expire_past_deadlines(db: Optional[DatabaseClient] = None):
     """
     Mark opportunities as expired if deadline_date has passed
     
+    Args:
+        db: Connected client to reuse (a new connection is opened and closed if omitted)
+    
     Returns:
         Number of opportunities expired
     """
-    db = DatabaseClient(config.DATABASE_URL)
+    owns_db = db is None
+    if owns_db:
+        db = DatabaseClient(config.DATABASE_URL)
     
     try:
-        db.connect()  # Explicitly connect
+        if owns_db:
+            db.connect()  # Explicitly connect
         
         current_date = date.today()
         logger.info(f"[CLEANUP] Starting auto-expiration check for date: {current_date}")
         
-        # Find active opportunities with past deadlines
+        # Expire active opportunities with past deadlines (count only -
+        # no RETURNING, so the updated rows never cross the wire)
         query = """
             UPDATE opportunities
             SET 
@@ -44,23 +54,19 @@ def expire_past_deadlines():
                 status = 'active'
                 AND deadline_date IS NOT NULL
                 AND deadline_date < %s
-            RETURNING id, title, deadline_date, post_id
         """
         
         with db.get_cursor() as cursor:
             cursor.execute(query, (current_date,))
-            expired = cursor.fetchall()
+            expired_count = cursor.rowcount
             
-            if expired:
-                logger.info(f"[CLEANUP] Expired {len(expired)} opportunities:")
-                for opp in expired:
-                    opp_id, title, deadline, post_id = opp
-                    logger.info(f"  - {title[:50]} (deadline: {deadline}, post_id: {post_id})")
+            if expired_count:
+                logger.info(f"[CLEANUP] Expired {expired_count} opportunities")
             else:
                 logger.info("[CLEANUP] No opportunities to expire")
         
-        logger.info(f"[SUCCESS] Cleanup complete: {len(expired)} opportunities expired")
-        return len(expired)
+        logger.info(f"[SUCCESS] Cleanup complete: {expired_count} opportunities expired")
+        return expired_count
         
     except Exception as e:
         logger.error(f"[ERROR] Cleanup failed: {e}")
@@ -68,19 +74,26 @@ def expire_past_deadlines():
         traceback.print_exc()
         return 0
     finally:
-        db.close()
+        if owns_db:
+            db.close()
 
-def get_expiration_stats():
+def get_expiration_stats(db: Optional[DatabaseClient] = None):
     """
     Get statistics about expired opportunities
     
+    Args:
+        db: Connected client to reuse (a new connection is opened and closed if omitted)
+    
     Returns:
         Dictionary with expiration statistics
     """
-    db = DatabaseClient(config.DATABASE_URL)
+    owns_db = db is None
+    if owns_db:
+        db = DatabaseClient(config.DATABASE_URL)
     
     try:
-        db.connect()  # Explicitly connect
+        if owns_db:
+            db.connect()  # Explicitly connect
         
         query = """
             SELECT 
@@ -120,7 +133,8 @@ def get_expiration_stats():
         logger.debug(traceback.format_exc())
         return {}
     finally:
-        db.close()
+        if owns_db:
+            db.close()
 
 def main():
     """Main execution function"""
@@ -129,17 +143,22 @@ def main():
     logger.info('[CLEANUP] Auto-Expiration Cleanup Starting...')
     logger.info('='*60 + '\n')
     
+    # One connection for all three steps (each new one is a TLS handshake to the database)
+    db = DatabaseClient(config.DATABASE_URL)
+    
     try:
+        db.connect()
+        
         # Get stats before cleanup
         logger.info("[STATS] Before cleanup:")
-        stats_before = get_expiration_stats()
+        stats_before = get_expiration_stats(db)
         
         # Run cleanup
-        expired_count = expire_past_deadlines()
+        expired_count = expire_past_deadlines(db)
         
         # Get stats after cleanup
         logger.info("\n[STATS] After cleanup:")
-        stats_after = get_expiration_stats()
+        stats_after = get_expiration_stats(db)
         
         logger.info(f"\n{'='*60}")
         logger.info("[COMPLETE] Cleanup Complete!")
@@ -156,6 +175,8 @@ def main():
         import traceback
         logger.debug(traceback.format_exc())
         sys.exit(1)
+    finally:
+        db.close()
 
 if __name__ == '__main__':
     expired_count = main()
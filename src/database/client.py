@@ -3,6 +3,8 @@ PostgreSQL Database Client
 Handles connection to Neon PostgreSQL database
 """
 
+import re
+import time
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from contextlib import contextmanager
@@ -13,9 +15,28 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 from extraction.utils.logger import setup_logger
+from extraction.utils.retry import backoff_delay
 
 logger = setup_logger('database')
 
+# Characters dropped from slugs (everything but a-z, digits, whitespace, hyphen)
+_SLUG_UNSAFE_RE = re.compile(r'[^a-z0-9\s-]')
+
+# Rows per execute_values statement in the bulk_* methods. The default pages
+# of 100 rows each cost a round trip to the database; much larger statements
+# only grow the query text the server has to parse in one go. A normal run
+# fits in a single page. (cursor.rowcount only counts the last page, so
+# bulk_update_opportunities sums it page by page.)
+BULK_PAGE_SIZE = 1000
+
+# Seconds before cached lookup tables are re-read (they rarely change)
+MAPPING_CACHE_TTL = 300
+
+# Read queries are retried this many times when the connection drops
+# (Neon closes idle connections; a fresh one usually succeeds)
+READ_RETRY_ATTEMPTS = 3
+READ_RETRY_MAX_BACKOFF = 5
+
 class DatabaseClient:
     def __init__(self, database_url: str):
         """
@@ -26,6 +47,10 @@ class DatabaseClient:
         """
         self.database_url = database_url
         self.connection = None
+        # Lookup tables rarely change; cached on first read for MAPPING_CACHE_TTL
+        self._audience_mapping = None
+        self._type_mapping = None
+        self._mappings_loaded_at = None
         logger.info("Database client initialized")
     
     def connect(self):
@@ -55,8 +80,18 @@ class DatabaseClient:
         """Close database connection"""
         if self.connection:
             self.connection.close()
+            self.connection = None
             logger.info("Database connection closed")
     
+    def _drop_connection(self):
+        """Discard the current connection (if any); get_cursor opens a new one"""
+        if self.connection:
+            try:
+                self.connection.close()
+            except psycopg2.Error:
+                pass
+            self.connection = None
+    
     @contextmanager
     def get_cursor(self):
         """Context manager for database cursor"""
@@ -85,9 +120,24 @@ class DatabaseClient:
         Returns:
             List of result dictionaries
         """
-        with self.get_cursor() as cursor:
-            cursor.execute(query, params)
-            return cursor.fetchall()
+        for attempt in range(1, READ_RETRY_ATTEMPTS + 1):
+            try:
+                with self.get_cursor() as cursor:
+                    cursor.execute(query, params)
+                    return cursor.fetchall()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                # Only a lost connection (dropped, or connect() itself failed)
+                # is worth retrying - not e.g. a statement timeout, which is
+                # also an OperationalError
+                connection_lost = self.connection is None or self.connection.closed
+                if attempt == READ_RETRY_ATTEMPTS or not connection_lost:
+                    raise
+                wait_time = backoff_delay(attempt, READ_RETRY_MAX_BACKOFF, base=0.25)
+                logger.warning(f"[RETRY] Query failed ({e}); reconnecting in {wait_time:.1f}s (attempt {attempt}/{READ_RETRY_ATTEMPTS})")
+                time.sleep(wait_time)
+                # Reconnect happens in get_cursor on the next attempt, so a
+                # failed reconnect uses up that attempt instead of escaping
+                self._drop_connection()
     
     def execute_insert(self, query: str, params: tuple = None) -> Optional[str]:
         """
@@ -123,9 +173,13 @@ class DatabaseClient:
         Returns:
             Dictionary mapping code -> UUID
         """
-        query = "SELECT code, id FROM audiences"
-        results = self.execute_query(query)
-        return {row['code']: row['id'] for row in results}
+        self._expire_stale_caches()
+        if self._audience_mapping is None:
+            query = "SELECT code, id FROM audiences"
+            results = self.execute_query(query)
+            self._audience_mapping = {row['code']: row['id'] for row in results}
+            self._mappings_loaded_at = self._mappings_loaded_at or time.monotonic()
+        return dict(self._audience_mapping)
     
     def get_opportunity_type_mapping(self) -> Dict[str, str]:
         """
@@ -134,9 +188,25 @@ class DatabaseClient:
         Returns:
             Dictionary mapping code -> UUID
         """
-        query = "SELECT code, id FROM opportunity_types"
-        results = self.execute_query(query)
-        return {row['code']: row['id'] for row in results}
+        self._expire_stale_caches()
+        if self._type_mapping is None:
+            query = "SELECT code, id FROM opportunity_types"
+            results = self.execute_query(query)
+            self._type_mapping = {row['code']: row['id'] for row in results}
+            self._mappings_loaded_at = self._mappings_loaded_at or time.monotonic()
+        return dict(self._type_mapping)
+    
+    def invalidate_caches(self):
+        """Drop cached lookup tables (next call re-reads them from the database)"""
+        self._audience_mapping = None
+        self._type_mapping = None
+        self._mappings_loaded_at = None
+    
+    def _expire_stale_caches(self):
+        """Invalidate cached lookup tables once they are older than MAPPING_CACHE_TTL"""
+        if (self._mappings_loaded_at is not None
+                and time.monotonic() - self._mappings_loaded_at >= MAPPING_CACHE_TTL):
+            self.invalidate_caches()
     
     def check_duplicate_opportunity(self, post_id: Optional[str] = None, title: Optional[str] = None, organizer_name: Optional[str] = None, registration_url: Optional[str] = None) -> Optional[str]:
         """
@@ -214,6 +284,25 @@ class DatabaseClient:
         """
         return self.execute_insert(insert_query, (name, slug))
     
+    def get_organizer_ids_by_names(self, names: List[str]) -> Dict[str, str]:
+        """
+        Bulk lookup of existing organizer IDs by name
+        
+        Args:
+            names: List of organizer names to look up
+            
+        Returns:
+            Dictionary mapping name -> organizer UUID (missing names omitted)
+        """
+        unique_names = list({name for name in names if name})
+        if not unique_names:
+            return {}
+        
+        query = "SELECT name, id FROM organizers WHERE name = ANY(%s)"
+        results = self.execute_query(query, (unique_names,))
+        
+        return {row['name']: row['id'] for row in results}
+    
     def _generate_slug(self, text: str) -> str:
         """
         Generate URL-friendly slug from text (human-readable, SEO-friendly)
@@ -225,7 +314,6 @@ class DatabaseClient:
         Returns:
             URL-friendly slug
         """
-        import re
         from datetime import datetime
         
         if not text:
@@ -236,16 +324,11 @@ class DatabaseClient:
         slug = text.lower()
         
         # Remove special characters
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-        
-        # Replace spaces with hyphens
-        slug = re.sub(r'\s+', '-', slug)
+        slug = _SLUG_UNSAFE_RE.sub('', slug)
         
-        # Remove consecutive hyphens
-        slug = re.sub(r'-+', '-', slug)
-        
-        # Trim hyphens from ends
-        slug = slug.strip('-')
+        # Collapse runs of spaces/hyphens into single hyphens, trimmed from
+        # the ends (plain str.split instead of two more regex passes)
+        slug = '-'.join(slug.replace('-', ' ').split())
         
         # Limit length
         if len(slug) > 80:
@@ -354,6 +437,24 @@ class DatabaseClient:
         
         return {row['post_id'] for row in results if row['post_id']}
     
+    def get_opportunity_ids_by_post_ids(self, post_ids: List[str]) -> Dict[str, str]:
+        """
+        Bulk lookup of opportunity IDs by post_id
+        
+        Args:
+            post_ids: List of post IDs to look up
+            
+        Returns:
+            Dictionary mapping post_id -> opportunity ID
+        """
+        if not post_ids:
+            return {}
+        
+        query = "SELECT post_id, id FROM opportunities WHERE post_id = ANY(%s)"
+        results = self.execute_query(query, (post_ids,))
+        
+        return {row['post_id']: row['id'] for row in results if row['post_id']}
+    
     def bulk_insert_opportunities(self, records: List[Dict]) -> List[str]:
         """
         Bulk insert multiple opportunities at once
@@ -436,6 +537,7 @@ class DatabaseClient:
                 query,
                 values,
                 template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())",
+                page_size=BULK_PAGE_SIZE,
                 fetch=True
             )
             return [row['id'] for row in result]
@@ -512,9 +614,13 @@ class DatabaseClient:
             WHERE o.id = v.id::uuid
         """
         
+        updated = 0
         with self.get_cursor() as cursor:
-            execute_values(cursor, query, values)
-            return cursor.rowcount
+            for start in range(0, len(values), BULK_PAGE_SIZE):
+                page = values[start:start + BULK_PAGE_SIZE]
+                execute_values(cursor, query, page, page_size=BULK_PAGE_SIZE)
+                updated += cursor.rowcount
+        return updated
     
     def bulk_insert_audiences(self, opportunity_audiences: List[tuple]) -> int:
         """
@@ -529,16 +635,18 @@ class DatabaseClient:
         if not opportunity_audiences:
             return 0
         
-        from psycopg2.extras import execute_values
+        # Sent as two parallel arrays and unnested server-side: two bound
+        # parameters instead of a VALUES tuple rendered per relationship
+        opportunity_ids, audience_ids = map(list, zip(*opportunity_audiences))
         
         query = """
             INSERT INTO opportunity_audiences (opportunity_id, audience_id)
-            VALUES %s
+            SELECT * FROM unnest(%s::uuid[], %s::uuid[])
             ON CONFLICT DO NOTHING
         """
         
         with self.get_cursor() as cursor:
-            execute_values(cursor, query, opportunity_audiences)
+            cursor.execute(query, (opportunity_ids, audience_ids))
             return cursor.rowcount
     
     def bulk_get_or_create_organizers(self, organizer_names: List[str]) -> Dict[str, str]:
@@ -561,10 +669,7 @@ class DatabaseClient:
             return {}
         
         # Step 1: Get existing organizers
-        query = "SELECT name, id FROM organizers WHERE name = ANY(%s)"
-        results = self.execute_query(query, (unique_names,))
-        
-        existing = {row['name']: row['id'] for row in results}
+        existing = self.get_organizer_ids_by_names(unique_names)
         
         # Step 2: Create missing organizers
         missing_names = [name for name in unique_names if name not in existing]
@@ -586,6 +691,7 @@ class DatabaseClient:
                     cursor,
                     insert_query,
                     values,
+                    page_size=BULK_PAGE_SIZE,
                     fetch=True
                 )
                 
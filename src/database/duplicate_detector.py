@@ -4,12 +4,41 @@ Detects and scores potential duplicate opportunities across accounts
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from fuzzywuzzy import fuzz
 from datetime import datetime, date
 
 logger = logging.getLogger('duplicate_detector')
 
+# Columns read by scoring and by DataInserter._merge_duplicate. Selecting only
+# these (instead of *) keeps raw_caption and the other unused text columns off
+# the wire for every candidate row
+_MATCH_COLUMNS = (
+    'id', 'post_id', 'title', 'type_id', 'organizer_id', 'description',
+    'contact', 'registration_url', 'deadline_date', 'tags', 'secondary_sources',
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_date(value: str) -> Optional[date]:
+    """Parse an ISO date string (cached - the same deadline is compared against every candidate)"""
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
+
+
+def _to_date(value) -> Optional[date]:
+    """Coerce a deadline value (ISO string, datetime or date) to a date, None if unusable"""
+    if isinstance(value, str):
+        return _parse_iso_date(value)
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
 class DuplicateDetector:
     """Detects duplicate opportunities with confidence scoring"""
     
@@ -21,8 +50,35 @@ class DuplicateDetector:
             db_client: DatabaseClient instance
         """
         self.db = db_client
+        # post_id -> existing row (None = known not to exist), filled by
+        # prime_post_ids so a batch costs one query instead of one per record
+        self._post_id_rows: Dict[str, Optional[Dict]] = {}
         logger.info("Duplicate detector initialized")
     
+    def prime_post_ids(self, post_ids: List[str]):
+        """
+        Look up a whole batch of post_ids in one query (DataLoader-style)
+        
+        Later _get_by_post_id calls for these post_ids are answered from
+        memory. Call forget_post_id after inserting a record so its post_id
+        is looked up again.
+        
+        Args:
+            post_ids: post_ids about to be checked
+        """
+        wanted = list({post_id for post_id in post_ids if post_id and post_id not in self._post_id_rows})
+        if not wanted:
+            return
+        
+        query = f"SELECT {', '.join(_MATCH_COLUMNS)} FROM opportunities WHERE post_id = ANY(%s)"
+        found = {row['post_id']: row for row in self.db.execute_query(query, (wanted,))}
+        for post_id in wanted:
+            self._post_id_rows[post_id] = found.get(post_id)
+    
+    def forget_post_id(self, post_id: Optional[str]):
+        """Drop a primed post_id (e.g. after it was inserted)"""
+        self._post_id_rows.pop(post_id, None)
+    
     def find_duplicates(self, new_record: Dict) -> Tuple[Optional[Dict], int, str]:
         """
         Find potential duplicates for new record
@@ -84,6 +140,8 @@ class DuplicateDetector:
         Returns:
             Confidence score (0-100)
         """
+        # Runs for every candidate of every record: debug messages below use
+        # lazy %-formatting so they cost nothing when DEBUG is off
         score = 0
         
         # Title matching (40 or 30 points)
@@ -93,13 +151,13 @@ class DuplicateDetector:
         if title1 and title2:
             if title1 == title2:
                 score += 40
-                logger.debug(f"Exact title match: +40 points")
+                logger.debug("Exact title match: +40 points")
             else:
                 # Fuzzy match using Levenshtein distance
                 similarity = fuzz.ratio(title1, title2)
                 if similarity > 85:
                     score += 30
-                    logger.debug(f"Fuzzy title match ({similarity}%): +30 points")
+                    logger.debug("Fuzzy title match (%s%%): +30 points", similarity)
         
         # Organizer matching (30 points)
         org1 = record1.get('organizer_name', '').strip().lower()
@@ -107,12 +165,12 @@ class DuplicateDetector:
         
         if org1 and org2 and org1 == org2:
             score += 30
-            logger.debug(f"Same organizer: +30 points")
+            logger.debug("Same organizer: +30 points")
         
         # Date overlap (20 points)
         if self._dates_overlap(record1, record2):
             score += 20
-            logger.debug(f"Overlapping dates: +20 points")
+            logger.debug("Overlapping dates: +20 points")
         
         # Category matching (10 points)
         cat1 = record1.get('type_id')
@@ -120,14 +178,17 @@ class DuplicateDetector:
         
         if cat1 and cat2 and cat1 == cat2:
             score += 10
-            logger.debug(f"Same category: +10 points")
+            logger.debug("Same category: +10 points")
         
-        logger.debug(f"Total confidence score: {score}")
+        logger.debug("Total confidence score: %s", score)
         return score
     
     def _get_by_post_id(self, post_id: str) -> Optional[Dict]:
         """Get opportunity by post_id"""
-        query = "SELECT * FROM opportunities WHERE post_id = %s LIMIT 1"
+        if post_id in self._post_id_rows:
+            return self._post_id_rows[post_id]
+        
+        query = f"SELECT {', '.join(_MATCH_COLUMNS)} FROM opportunities WHERE post_id = %s LIMIT 1"
         results = self.db.execute_query(query, (post_id,))
         return results[0] if results else None
     
@@ -158,8 +219,9 @@ class DuplicateDetector:
         # We'll get opportunities with same title or same organizer
         # Then filter by fuzzy matching in calculate_confidence
         
-        query = """
-            SELECT o.*, org.name as organizer_name
+        columns = ', '.join(f'o.{column}' for column in _MATCH_COLUMNS)
+        query = f"""
+            SELECT {columns}, org.name as organizer_name
             FROM opportunities o
             LEFT JOIN organizers org ON o.organizer_id = org.id
             WHERE o.title = %s
@@ -175,7 +237,7 @@ class DuplicateDetector:
         
         results = self.db.execute_query(query, tuple(params))
         
-        logger.debug(f"Found {len(results)} candidates for duplicate checking")
+        logger.debug("Found %d candidates for duplicate checking", len(results))
         return results
     
     def _dates_overlap(self, record1: Dict, record2: Dict) -> bool:
@@ -196,27 +258,12 @@ class DuplicateDetector:
         if not deadline1 or not deadline2:
             return False
         
-        # Parse dates if strings
-        if isinstance(deadline1, str):
-            try:
-                deadline1 = datetime.fromisoformat(deadline1).date()
-            except:
-                return False
-        elif isinstance(deadline1, datetime):
-            deadline1 = deadline1.date()
-        
-        if isinstance(deadline2, str):
-            try:
-                deadline2 = datetime.fromisoformat(deadline2).date()
-            except:
-                return False
-        elif isinstance(deadline2, datetime):
-            deadline2 = deadline2.date()
+        deadline1 = _to_date(deadline1)
+        deadline2 = _to_date(deadline2)
         
         # Check if dates are within 30 days of each other
         # (same event might have slightly different deadlines on different accounts)
-        if isinstance(deadline1, date) and isinstance(deadline2, date):
-            diff = abs((deadline1 - deadline2).days)
-            return diff <= 30
+        if deadline1 and deadline2:
+            return abs((deadline1 - deadline2).days) <= 30
         
         return False
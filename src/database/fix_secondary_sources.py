@@ -91,6 +91,8 @@ def fix_secondary_sources(conn, record):
     """
     secondary_sources = record['secondary_sources']
     fixed_count = 0
+    # One timestamp for every source fixed in this record
+    fixed_at = datetime.now().isoformat()
     
     # Fix each source
     for source in secondary_sources:
@@ -99,7 +101,7 @@ def fix_secondary_sources(conn, record):
             # Cannot recover account name, mark as unknown
             source['source_account'] = 'unknown'
             source['account'] = 'unknown'  # Keep both for compatibility
-            source['fixed_at'] = datetime.now().isoformat()
+            source['fixed_at'] = fixed_at
             fixed_count += 1
         elif source.get('source_account') is None:
             # Copy from 'account' if available
@@ -6,6 +6,9 @@ Enhanced with Phase 1 (Expiration) and Phase 2 (Duplicate Detection)
 
 from typing import Dict, List, Optional, Tuple
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
@@ -15,6 +18,19 @@ from .duplicate_detector import DuplicateDetector
 
 logger = setup_logger('inserter')
 
+# insert_batch stops after this many records in a row fail with a database
+# error: at that point the database is almost certainly unreachable, and
+# every further record would only wait for its own failure
+MAX_CONSECUTIVE_ERRORS = 5
+
+@lru_cache(maxsize=1024)
+def _parse_deadline(deadline: str) -> Optional[date]:
+    """Parse an ISO deadline string (cached: records in a batch share deadlines)"""
+    try:
+        return datetime.fromisoformat(deadline).date()
+    except ValueError:
+        return None
+
 class DataInserter:
     """Inserts normalized opportunity data into database"""
     
@@ -27,20 +43,22 @@ class DataInserter:
         """
         self.db = db_client
         self.duplicate_detector = DuplicateDetector(db_client)  # Phase 2
+        # organizer name -> id, so repeated organizers cost no query
+        self._organizer_ids: Dict[str, str] = {}
         logger.info("Data inserter initialized (V2 - Simplified Schema + Phase 1 & 2)")
     
-    def _check_expiration(self, normalized_data: Dict) -> bool:
+    def _check_expiration(self, normalized_data: Dict, current_date: Optional[date] = None) -> bool:
         """
         Check if opportunity is expired based on deadline_date
         
         Args:
             normalized_data: Normalized opportunity data
+            current_date: Date to compare against (today if omitted; batch
+                loops pass it in once instead of reading the clock per record)
             
         Returns:
             True if expired, False otherwise
         """
-        from datetime import datetime, date
-        
         # Get deadline_date from dates dict
         dates = normalized_data.get('dates', {})
         deadline = dates.get('deadline_date')
@@ -51,16 +69,16 @@ class DataInserter:
         
         # Parse deadline to date object if string
         if isinstance(deadline, str):
-            try:
-                deadline = datetime.fromisoformat(deadline).date()
-            except:
+            deadline = _parse_deadline(deadline)
+            if deadline is None:
                 # Invalid date format, treat as active
                 return False
         elif isinstance(deadline, datetime):
             deadline = deadline.date()
         
         # Compare with current date
-        current_date = date.today()
+        if current_date is None:
+            current_date = date.today()
         
         return deadline < current_date
     
@@ -76,7 +94,6 @@ class DataInserter:
         Returns:
             Tuple of (opportunity_id, fields_updated)
         """
-        from datetime import datetime
         import json
         
         updates = {}
@@ -181,6 +198,14 @@ class DataInserter:
         with self.db.get_cursor() as cursor:
             cursor.execute(query, tuple(params))
     
+    def _get_organizer_id(self, name: str) -> str:
+        """Get or create an organizer, reusing IDs already resolved by this inserter"""
+        organizer_id = self._organizer_ids.get(name)
+        if organizer_id is None:
+            organizer_id = self.db.get_or_create_organizer(name)
+            self._organizer_ids[name] = organizer_id
+        return organizer_id
+    
     def insert_opportunity(self, data: Dict) -> tuple[Optional[str], str]:
         """
         Insert or update a single opportunity with all related data
@@ -236,7 +261,7 @@ class DataInserter:
             # STEP 3: Get or create organizer
             organizer_id = None
             if data.get('organizer_name'):
-                organizer_id = self.db.get_or_create_organizer(data['organizer_name'])
+                organizer_id = self._get_organizer_id(data['organizer_name'])
             
             # STEP 4: Insert new opportunity (with status = 'active')
             opportunity_id = self._insert_opportunity_record(data, organizer_id)
@@ -245,6 +270,9 @@ class DataInserter:
                 logger.error(f"Failed to insert opportunity: {data['title']}")
                 return None, 'error'
             
+            # A primed "not found" for this post_id is stale now
+            self.duplicate_detector.forget_post_id(data.get('post_id'))
+            
             # STEP 5: Insert audience relationships
             self._insert_audiences(opportunity_id, data.get('audience_ids', []))
             
@@ -349,7 +377,7 @@ class DataInserter:
         # Get or create organizer if provided
         organizer_id = None
         if data.get('organizer_name'):
-            organizer_id = self.db.get_or_create_organizer(data['organizer_name'])
+            organizer_id = self._get_organizer_id(data['organizer_name'])
         
         query = """
             UPDATE opportunities SET
@@ -421,14 +449,10 @@ class DataInserter:
         if not audience_ids:
             return
         
-        query = """
-            INSERT INTO opportunity_audiences (opportunity_id, audience_id)
-            VALUES (%s, %s)
-            ON CONFLICT DO NOTHING
-        """
-        
-        params_list = [(opportunity_id, audience_id) for audience_id in audience_ids]
-        self.db.execute_many(query, params_list)
+        # One multi-row INSERT (executemany would send a statement per audience)
+        self.db.bulk_insert_audiences(
+            [(opportunity_id, audience_id) for audience_id in audience_ids]
+        )
     
     def insert_batch(self, data_list: List[Dict]) -> Dict[str, int]:
         """
@@ -452,23 +476,39 @@ class DataInserter:
             'database_errors': 0,
         }
         
+        # Resolve existing organizers in one query instead of one per record
+        # (organizers are still only created for records that get inserted)
+        try:
+            self._organizer_ids.update(
+                self.db.get_organizer_ids_by_names([d.get('organizer_name') for d in data_list])
+            )
+            self.duplicate_detector.prime_post_ids([d.get('post_id') for d in data_list])
+        except Exception as e:
+            # Not fatal: the per-record lookups below still work on their own
+            logger.warning(f"[BATCH] Bulk lookups failed, falling back to per-record queries: {e}")
+        
         # Log progress every 10 records
         progress_interval = 10
         
+        consecutive_errors = 0
+        
         for i, data in enumerate(data_list, 1):
+            # Circuit breaker: stop issuing queries against a dead database
+            if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                remaining = stats['total_processed'] - i + 1
+                logger.error(
+                    f"[ABORT] {consecutive_errors} consecutive database errors - "
+                    f"skipping the remaining {remaining} records"
+                )
+                stats['database_errors'] += remaining
+                break
+            
             # Progress logging every 10 records
             if i % progress_interval == 0 or i == 1 or i == stats['total_processed']:
                 logger.info(f"[{i}/{stats['total_processed']}] Processing: {data.get('title', 'Unknown')} ({i/stats['total_processed']*100:.1f}% complete)")
             else:
                 logger.info(f"[{i}/{stats['total_processed']}] Processing: {data.get('title', 'Unknown')}")
             
-            # Check if exists BEFORE processing
-            was_existing = self.db.check_duplicate_opportunity(
-                post_id=data.get('post_id'),
-                title=data.get('title'),
-                registration_url=data.get('registration_url')
-            ) is not None
-            
             result, status_reason = self.insert_opportunity(data)
             
             # Track specific categories
@@ -484,6 +524,8 @@ class DataInserter:
                 stats['invalid_no_registration_date'] += 1
             elif status_reason == 'error':
                 stats['database_errors'] += 1
+            
+            consecutive_errors = consecutive_errors + 1 if status_reason == 'error' else 0
         
         # Calculate totals for summary
         total_saved = stats['newly_inserted'] + stats['updated_existing']
@@ -559,6 +601,7 @@ class DataInserter:
         # PHASE 1: Pre-process all records (in-memory, no DB queries)
         logger.info("[PHASE 1/6] Pre-processing records (validation, expiration check)...")
         valid_records = []
+        today = date.today()
         
         for data in data_list:
             # Check dates (MANDATORY - FIX 1: 2026-05-01)
@@ -567,16 +610,19 @@ class DataInserter:
             
             if not has_registration_date:
                 stats['invalid_no_registration_date'] += 1
-                logger.debug(f"[INVALID] No registration dates: {data.get('title')}")
+                logger.debug("[INVALID] No registration dates: %s", data.get('title'))
                 continue
             
             # Check expiration
-            if self._check_expiration(data):
+            if self._check_expiration(data, today):
                 stats['skipped_expired'] += 1
-                logger.debug(f"[SKIP] Expired: {data.get('title')}")
+                logger.debug("[SKIP] Expired: %s", data.get('title'))
                 continue
             
-            valid_records.append(data)
+            # Shallow copy: the phases below set organizer_id / id on the
+            # record, and the caller retries the same list through the
+            # chunked and one-by-one fallbacks if this run fails
+            valid_records.append(dict(data))
         
         logger.info(f"[PHASE 1/6] ✓ Valid records: {len(valid_records)}/{len(data_list)}")
         
@@ -611,8 +657,20 @@ class DataInserter:
             if r.get('organizer_name')
         ))
         
-        organizer_mapping = self.db.bulk_get_or_create_organizers(organizer_names)
-        logger.info(f"[PHASE 3/6] ✓ Processed {len(organizer_mapping)} organizers")
+        # Only names this inserter hasn't resolved yet go to the database
+        # (the chunked path runs this once per chunk with the same organizers)
+        uncached_names = [name for name in organizer_names if name not in self._organizer_ids]
+        if uncached_names:
+            self._organizer_ids.update(self.db.bulk_get_or_create_organizers(uncached_names))
+        organizer_mapping = {
+            name: self._organizer_ids[name]
+            for name in organizer_names
+            if name in self._organizer_ids
+        }
+        logger.info(
+            f"[PHASE 3/6] ✓ Processed {len(organizer_mapping)} organizers "
+            f"({len(organizer_names) - len(uncached_names)} cached)"
+        )
         
         # Add organizer_id to records
         for record in valid_records:
@@ -672,12 +730,18 @@ class DataInserter:
         if to_update:
             logger.info(f"[PHASE 5/6] Bulk updating {len(to_update)} existing records...")
             try:
-                # Get existing IDs for update records
+                # Get existing IDs for update records (1 query, per-record
+                # lookup only for records whose post_id didn't resolve)
+                existing_ids = self.db.get_opportunity_ids_by_post_ids(
+                    [r['post_id'] for r in to_update if r.get('post_id')]
+                )
                 for record in to_update:
-                    existing_id = self.db.check_duplicate_opportunity(
-                        post_id=record.get('post_id'),
-                        registration_url=record.get('registration_url')
-                    )
+                    existing_id = existing_ids.get(record.get('post_id'))
+                    if not existing_id:
+                        existing_id = self.db.check_duplicate_opportunity(
+                            post_id=record.get('post_id'),
+                            registration_url=record.get('registration_url')
+                        )
                     if existing_id:
                         record['id'] = existing_id
                 
@@ -743,7 +807,7 @@ class DataInserter:
         
         return stats
     
-    def insert_batch_chunked(self, data_list: List[Dict], chunk_size: int = 50) -> Dict[str, int]:
+    def insert_batch_chunked(self, data_list: List[Dict], chunk_size: int = 50, workers: int = 1) -> Dict[str, int]:
         """
         Insert or update a batch of opportunities using CHUNKED BATCH PROCESSING
         
@@ -752,6 +816,7 @@ class DataInserter:
         Args:
             data_list: List of normalized opportunity data
             chunk_size: Number of records per chunk (default: 50)
+            workers: Number of chunks written concurrently (1 = sequential)
             
         Returns:
             Statistics dictionary with detailed breakdown
@@ -770,24 +835,42 @@ class DataInserter:
             'database_errors': 0,
         }
         
-        # Split into chunks
-        chunks = [data_list[i:i+chunk_size] for i in range(0, len(data_list), chunk_size)]
+        # Split into chunks; concurrent chunks are cut so that records sharing
+        # a slug or post_id land in the same one (slug dedup and the post_id
+        # insert/update split only see one chunk)
+        parallel = workers > 1 and len(data_list) > chunk_size
+        if parallel:
+            chunks = self._chunk_by_slug(data_list, chunk_size)
+        else:
+            chunks = [data_list[i:i+chunk_size] for i in range(0, len(data_list), chunk_size)]
         
         logger.info(f"\n{'='*60}")
         logger.info(f"[CHUNKED] Starting chunked batch processing...")
         logger.info(f"[CHUNKED] Total records: {len(data_list)}")
         logger.info(f"[CHUNKED] Chunk size: {chunk_size}")
         logger.info(f"[CHUNKED] Total chunks: {len(chunks)}")
+        logger.info(f"[CHUNKED] Workers: {workers}")
         logger.info(f"{'='*60}\n")
         
-        # Process each chunk
-        for i, chunk in enumerate(chunks, 1):
-            logger.info(f"\n[CHUNK {i}/{len(chunks)}] Processing {len(chunk)} records...")
+        # Process each chunk; with workers > 1, chunks run concurrently, each
+        # worker on its own connection (a psycopg2 connection holds a single
+        # transaction, so it can't be shared between threads)
+        if parallel and len(chunks) > 1:
+            # Create every organizer up front on this connection: two workers
+            # inserting the same new organizer would otherwise collide
+            # (organizers are inserted without ON CONFLICT)
+            organizer_names = list({d.get('organizer_name') for d in data_list if d.get('organizer_name')})
+            uncached_names = [name for name in organizer_names if name not in self._organizer_ids]
+            if uncached_names:
+                self._organizer_ids.update(self.db.bulk_get_or_create_organizers(uncached_names))
             
-            try:
-                # Process chunk using optimized batch method
-                chunk_stats = self.insert_batch_optimized(chunk)
-                
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._process_chunk_on_new_connection, chunks))
+        else:
+            results = [self._run_chunk(self, chunk) for chunk in chunks]
+        
+        for i, (chunk, (chunk_stats, error)) in enumerate(zip(chunks, results), 1):
+            if error is None:
                 # Aggregate stats
                 stats['newly_inserted'] += chunk_stats['newly_inserted']
                 stats['updated_existing'] += chunk_stats['updated_existing']
@@ -798,9 +881,8 @@ class DataInserter:
                 stats['database_errors'] += chunk_stats['database_errors']
                 
                 logger.info(f"[CHUNK {i}/{len(chunks)}] ✓ Complete")
-                
-            except Exception as e:
-                logger.error(f"[CHUNK {i}/{len(chunks)}] ✗ Failed: {e}")
+            else:
+                logger.error(f"[CHUNK {i}/{len(chunks)}] ✗ Failed: {error}")
                 stats['database_errors'] += len(chunk)
                 
                 # Save failed chunk for manual review
@@ -840,6 +922,72 @@ class DataInserter:
         
         return stats
     
+    @staticmethod
+    def _chunk_by_slug(data_list: List[Dict], chunk_size: int) -> List[List[Dict]]:
+        """
+        Split records into chunks of about chunk_size, keeping records that
+        share a slug or a post_id together so concurrent chunks never race
+        on the same opportunity
+        """
+        # Union-find over record indexes: records are linked through any slug
+        # or post_id they have in common (a repost can match on either one)
+        parent = list(range(len(data_list)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        first_seen: Dict[Tuple[str, str], int] = {}
+        for i, record in enumerate(data_list):
+            for key in (('slug', record.get('slug')), ('post_id', record.get('post_id'))):
+                if not key[1]:
+                    continue
+                j = first_seen.setdefault(key, i)
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    # Lower index wins so groups keep first-appearance order
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        groups: Dict[int, List[Dict]] = {}
+        for i, record in enumerate(data_list):
+            groups.setdefault(find(i), []).append(record)
+        
+        chunks = []
+        current: List[Dict] = []
+        for group in groups.values():
+            current.extend(group)
+            if len(current) >= chunk_size:
+                chunks.append(current)
+                current = []
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    @staticmethod
+    def _run_chunk(inserter: 'DataInserter', chunk: List[Dict]) -> Tuple[Optional[Dict[str, int]], Optional[Exception]]:
+        """Run one chunk through insert_batch_optimized, returning (stats, error)"""
+        logger.info(f"[CHUNK] Processing {len(chunk)} records...")
+        try:
+            return inserter.insert_batch_optimized(chunk), None
+        except Exception as e:
+            return None, e
+    
+    def _process_chunk_on_new_connection(self, chunk: List[Dict]) -> Tuple[Optional[Dict[str, int]], Optional[Exception]]:
+        """Run one chunk on a dedicated connection (used by concurrent workers)"""
+        db = DatabaseClient(self.db.database_url)
+        try:
+            db.connect()
+            inserter = DataInserter(db)
+            # Organizers were created before the fan-out; share their ids
+            inserter._organizer_ids.update(self._organizer_ids)
+            return self._run_chunk(inserter, chunk)
+        except Exception as e:
+            return None, e
+        finally:
+            db.close()
+    
     def _save_failed_chunk(self, chunk: List[Dict], chunk_number: int):
         """Save failed chunk for manual review"""
         import json
@@ -33,6 +33,7 @@ print(f"[DEBUG] Attempting to import from extraction.utils.config...")
 
 from extraction.utils.config import config
 from extraction.utils.logger import setup_logger
+from extraction.checkpoint_manager import CheckpointManager
 from database.client import DatabaseClient
 from database.validator import DataValidator
 from database.normalizer import DataNormalizer
@@ -45,8 +46,7 @@ def load_extracted_data(file_path: Path) -> List[Dict]:
     logger.info(f"[LOAD] Loading extracted data from: {file_path}")
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = CheckpointManager.read_results(file_path)
         
         logger.info(f"[SUCCESS] Loaded {len(data)} records")
         return data
@@ -71,6 +71,24 @@ def save_failed_records(failed_records: List[Dict], output_dir: Path):
     
     logger.info(f"[SAVE] Failed records saved to: {output_file}")
 
+def drop_duplicate_posts(records: List[Dict]) -> List[Dict]:
+    """
+    Keep only the first record for each post_id
+    
+    A collab post shows up under every account it was posted with, so it is
+    extracted once per account; inserting it again would only overwrite the
+    row written for the first copy.
+    """
+    seen_post_ids = set()
+    unique_records = []
+    for record in records:
+        post_id = record.get('post_id')
+        if post_id in seen_post_ids:
+            continue
+        seen_post_ids.add(post_id)
+        unique_records.append(record)
+    return unique_records
+
 def main():
     """Main execution function"""
     
@@ -134,13 +152,18 @@ def main():
             logger.error("No valid records to insert!")
             sys.exit(1)
         
+        unique_records = drop_duplicate_posts(valid_records)
+        duplicate_posts = len(valid_records) - len(unique_records)
+        if duplicate_posts:
+            logger.info(f"[DEDUPE] Dropped {duplicate_posts} records with a repeated post_id")
+        
         # Normalize data
         logger.info(f"\n{'='*60}")
         logger.info("[NORMALIZE] Normalizing data...")
         logger.info('='*60)
         
         normalizer = DataNormalizer(audience_mapping, type_mapping)
-        normalized_data = [normalizer.normalize_opportunity(record) for record in valid_records]
+        normalized_data = normalizer.normalize_batch(unique_records, workers=config.NORMALIZE_WORKERS)
         
         logger.info(f"[SUCCESS] Normalized {len(normalized_data)} records")
         
@@ -160,7 +183,7 @@ def main():
             logger.warning("[FALLBACK] Switching to chunked batch processing...")
             
             try:
-                stats = inserter.insert_batch_chunked(normalized_data, chunk_size=50)
+                stats = inserter.insert_batch_chunked(normalized_data, chunk_size=50, workers=config.INSERT_WORKERS)
             except Exception as e2:
                 logger.error(f"[ERROR] Chunked batch failed: {e2}")
                 logger.warning("[FALLBACK] Switching to legacy one-by-one processing...")
@@ -181,12 +204,13 @@ def main():
         logger.info(f"   - ⏭️  Skipped (Expired): {stats['skipped_expired']} records")
         logger.info(f"   - ⏭️  Skipped (No Dates): {stats['skipped_no_dates']} records")
         logger.info(f"   - ⏭️  Skipped (Duplicate Slugs): {stats.get('skipped_duplicate_slugs', 0)} records")
+        logger.info(f"   - ⏭️  Skipped (Duplicate Posts): {duplicate_posts} records")
         logger.info(f"   - ❌ Database Errors: {stats['database_errors']} records")
         logger.info(f"")
         
         # Calculate success rate and verify totals
         total_saved = stats['newly_inserted'] + stats['updated_existing']
-        total_skipped = stats['skipped_expired'] + stats['skipped_no_dates'] + stats.get('skipped_duplicate_slugs', 0)
+        total_skipped = stats['skipped_expired'] + stats['skipped_no_dates'] + stats.get('skipped_duplicate_slugs', 0) + duplicate_posts
         total_accounted = total_saved + total_skipped + stats['database_errors']
         
         success_rate = (total_saved / len(valid_records) * 100) if valid_records else 0
@@ -4,6 +4,7 @@ Normalizes extracted data for database insertion
 """
 
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime
 import sys
@@ -14,6 +15,25 @@ from extraction.utils.logger import setup_logger
 
 logger = setup_logger('normalizer')
 
+# Characters dropped from slugs (everything but a-z, digits, whitespace, hyphen)
+_SLUG_UNSAFE_RE = re.compile(r'[^a-z0-9\s-]')
+
+# Below this many distinct registration dates, process start-up costs more
+# than parsing in-process
+PARALLEL_MIN_DATES = 256
+
+# Mapping for types not in database (built once, not per record)
+TYPE_MAPPING = {
+    'volunteer': 'training',  # Volunteer programs → Training (closest match)
+}
+
+# Mapping for unknown audience codes to existing database codes
+AUDIENCE_MAPPING = {
+    'd1': 'd2',  # Diploma 1 → Diploma 2 (similar level)
+    's2': 'umum',  # S2/Master → General (broader audience)
+    's3': 'umum',  # S3/PhD → General (broader audience)
+}
+
 class DataNormalizer:
     """Normalizes extracted data for database insertion"""
     
@@ -25,8 +45,11 @@ class DataNormalizer:
             audience_mapping: Dict mapping audience codes to UUIDs
             type_mapping: Dict mapping opportunity type codes to UUIDs
         """
-        self.audience_mapping = audience_mapping
-        self.type_mapping = type_mapping
+        # Codes are lowercased once here; record codes are already lowercase
+        # (DataValidator only accepts the lowercase VALID_* values), so the
+        # per-record lookups need no case folding
+        self.audience_mapping = {code.lower(): uuid for code, uuid in audience_mapping.items()}
+        self.type_mapping = {code.lower(): uuid for code, uuid in type_mapping.items()}
         logger.info("Data normalizer initialized (V2 - Simplified Schema)")
     
     def normalize_opportunity(self, data: Dict) -> Dict:
@@ -36,6 +59,65 @@ class DataNormalizer:
         Args:
             data: Raw opportunity data from JSON extraction
             
+        Returns:
+            Normalized data ready for database insertion
+        """
+        return self._build_record(data, self._parse_registration_date(data.get('registration_date')))
+    
+    def normalize_batch(self, records: List[Dict], workers: int = 1) -> List[Dict]:
+        """
+        Normalize a batch of opportunity records
+        
+        Reposts and shared deadlines make registration date strings repeat
+        across a batch, so each distinct string is parsed only once. With
+        workers > 1, large sets of distinct strings are parsed across a
+        process pool (dateparser is CPU-bound, so threads would not help).
+        
+        Args:
+            records: Raw opportunity data from JSON extraction
+            workers: Number of processes for date parsing (1 = in-process)
+            
+        Returns:
+            List of normalized records, in input order
+        """
+        # Non-string values can't be parsed anyway (same result as None)
+        keys = [
+            date_string if isinstance(date_string, str) else None
+            for date_string in (data.get('registration_date') for data in records)
+        ]
+        distinct_keys = list(dict.fromkeys(keys))
+        
+        if workers > 1 and len(distinct_keys) >= PARALLEL_MIN_DATES:
+            # Static method: pickled by name, so no normalizer state is shipped
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = executor.map(DataNormalizer._parse_registration_date, distinct_keys, chunksize=64)
+                parsed_dates = dict(zip(distinct_keys, parsed))
+        else:
+            parsed_dates = {key: self._parse_registration_date(key) for key in distinct_keys}
+        
+        logger.debug(f"Parsed {len(parsed_dates)} distinct registration dates for {len(records)} records")
+        
+        # Each parsed dates dict goes to its first record as-is; only records
+        # repeating a date string get their own copy
+        normalized = []
+        handed_out = set()
+        for data, key in zip(records, keys):
+            dates = parsed_dates[key]
+            if key in handed_out:
+                dates = dict(dates)
+            else:
+                handed_out.add(key)
+            normalized.append(self._build_record(data, dates))
+        return normalized
+    
+    def _build_record(self, data: Dict, dates: Dict[str, Optional[str]]) -> Dict:
+        """
+        Build the normalized record from raw data and its parsed dates
+        
+        Args:
+            data: Raw opportunity data from JSON extraction
+            dates: Result of _parse_registration_date for this record
+            
         Returns:
             Normalized data ready for database insertion
         """
@@ -60,7 +142,7 @@ class DataNormalizer:
             
             # Dates
             'registration_date': data.get('registration_date'),  # Human-readable string
-            'dates': self._parse_registration_date(data.get('registration_date')),
+            'dates': dates,
             
             # Event details (NEW: stored directly, no separate tables)
             'event_type': data.get('event_type'),  # NEW: online/offline/hybrid
@@ -111,16 +193,11 @@ class DataNormalizer:
         slug = title.lower()
         
         # Remove special characters
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
+        slug = _SLUG_UNSAFE_RE.sub('', slug)
         
-        # Replace spaces with hyphens
-        slug = re.sub(r'\s+', '-', slug)
-        
-        # Remove consecutive hyphens
-        slug = re.sub(r'-+', '-', slug)
-        
-        # Trim hyphens from ends
-        slug = slug.strip('-')
+        # Collapse runs of spaces/hyphens into single hyphens, trimmed from
+        # the ends (plain str.split instead of two more regex passes)
+        slug = '-'.join(slug.replace('-', ' ').split())
         
         # Limit length
         if len(slug) > 100:
@@ -157,11 +234,6 @@ class DataNormalizer:
             logger.warning("No opportunity type provided")
             return None
         
-        # Mapping for types not in database
-        TYPE_MAPPING = {
-            'volunteer': 'training',  # Volunteer programs → Training (closest match)
-        }
-        
         # Map to existing type if needed
         mapped_type = TYPE_MAPPING.get(type_code, type_code)
         
@@ -190,13 +262,6 @@ class DataNormalizer:
         if not audience_codes:
             return []
         
-        # Mapping for unknown codes to existing database codes
-        AUDIENCE_MAPPING = {
-            'd1': 'd2',  # Diploma 1 → Diploma 2 (similar level)
-            's2': 'umum',  # S2/Master → General (broader audience)
-            's3': 'umum',  # S3/PhD → General (broader audience)
-        }
-        
         audience_ids = []
         
         for code in audience_codes:
@@ -227,7 +292,8 @@ class DataNormalizer:
         
         return name.strip() if name.strip() else None
     
-    def _parse_registration_date(self, date_string: Optional[str]) -> Dict[str, Optional[str]]:
+    @staticmethod
+    def _parse_registration_date(date_string: Optional[str]) -> Dict[str, Optional[str]]:
         """
         Parse human-readable registration date string to database format
         WITH SMART FALLBACK (FIX 1: Required Dates - 2026-05-01)
@@ -252,18 +318,19 @@ class DataNormalizer:
             }
         
         try:
-            import dateparser
-            from extraction.utils.helpers import extract_deadline_from_registration
+            # Shared cached parser from the extraction helpers (one DateDataParser
+            # for the process instead of dateparser.parse() rebuilding one per call)
+            from extraction.utils.helpers import _parse_date, extract_deadline_from_registration
             
             # SMART FALLBACK: Check for "Hingga X" format first
             if date_string.strip().lower().startswith('hingga'):
                 # "Hingga 5 Mei 2026" → Only deadline, no start date
                 deadline_str = extract_deadline_from_registration(date_string)
                 if deadline_str:
-                    deadline_date = dateparser.parse(deadline_str, languages=['id', 'en'])
+                    deadline_date = _parse_date(deadline_str)
                     if deadline_date:
                         deadline_formatted = deadline_date.strftime('%Y-%m-%d')
-                        logger.debug(f"[SMART FALLBACK] Parsed 'Hingga' format: deadline={deadline_formatted}")
+                        logger.debug("[SMART FALLBACK] Parsed 'Hingga' format: deadline=%s", deadline_formatted)
                         return {
                             'start_date': None,
                             'end_date': deadline_formatted,
@@ -278,8 +345,8 @@ class DataNormalizer:
                 end_str = parts[1].strip() if len(parts) > 1 else parts[0].strip()
                 
                 # Parse both dates
-                start_date = dateparser.parse(start_str, languages=['id', 'en'])
-                end_date = dateparser.parse(end_str, languages=['id', 'en'])
+                start_date = _parse_date(start_str)
+                end_date = _parse_date(end_str)
                 
                 return {
                     'start_date': start_date.strftime('%Y-%m-%d') if start_date else None,
@@ -288,11 +355,11 @@ class DataNormalizer:
                 }
             else:
                 # Single date → Use as deadline
-                parsed_date = dateparser.parse(date_string, languages=['id', 'en'])
+                parsed_date = _parse_date(date_string)
                 
                 if parsed_date:
                     date_str = parsed_date.strftime('%Y-%m-%d')
-                    logger.debug(f"[SMART FALLBACK] Parsed single date as deadline: {date_str}")
+                    logger.debug("[SMART FALLBACK] Parsed single date as deadline: %s", date_str)
                     return {
                         'start_date': None,  # No start date for single date
                         'end_date': date_str,
@@ -339,5 +406,6 @@ class DataNormalizer:
         if data.get('organizer'):
             tags.append(data['organizer'])
         
-        # Remove duplicates and return
-        return list(set(tags))
+        # Remove duplicates and return (first-seen order, stable across runs)
+        return list(dict.fromkeys(tags))
+
@@ -3,6 +3,7 @@ Data Validator
 Validates extracted data before database insertion
 """
 
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 import sys
 from pathlib import Path
@@ -22,13 +23,26 @@ class DataValidator:
     VALID_EVENT_TYPES = ['online', 'offline', 'hybrid']  # Changed from VALID_LOCATION_TYPES
     VALID_FEE_TYPES = ['gratis', 'berbayar']  # Simplified from ['gratis', 'htm', 'range']
     
+    # Frozen hash lookups for the per-record membership checks (the lists
+    # above stay as-is for ordering in error messages)
+    _VALID_TYPES_SET = frozenset(VALID_TYPES)
+    _VALID_AUDIENCES_SET = frozenset(VALID_AUDIENCES)
+    _VALID_EVENT_TYPES_SET = frozenset(VALID_EVENT_TYPES)
+    _VALID_FEE_TYPES_SET = frozenset(VALID_FEE_TYPES)
+    
+    @staticmethod
+    def _is_known(value, valid_set: frozenset) -> bool:
+        """Membership test that treats unhashable AI output (lists, dicts) as unknown"""
+        return isinstance(value, str) and value in valid_set
+    
     @staticmethod
-    def validate_opportunity(data: Dict) -> Tuple[bool, List[str]]:
+    def validate_opportunity(data: Dict, log_errors: bool = True) -> Tuple[bool, List[str]]:
         """
         Validate a single opportunity record (simplified structure)
         
         Args:
             data: Opportunity data dictionary
+            log_errors: Log a warning when the record is invalid
             
         Returns:
             Tuple of (is_valid, list_of_errors)
@@ -45,7 +59,7 @@ class DataValidator:
         # Changed from 'type' to 'category'
         if not data.get('category'):
             errors.append("Missing required field: category")
-        elif data['category'] not in DataValidator.VALID_TYPES:
+        elif not DataValidator._is_known(data['category'], DataValidator._VALID_TYPES_SET):
             errors.append(f"Invalid category: {data['category']}. Must be one of {DataValidator.VALID_TYPES}")
         
         # Validate audiences
@@ -53,16 +67,16 @@ class DataValidator:
             if not isinstance(data['audiences'], list):
                 errors.append("audiences must be a list")
             else:
-                invalid_audiences = [a for a in data['audiences'] if a not in DataValidator.VALID_AUDIENCES]
+                invalid_audiences = [a for a in data['audiences'] if not DataValidator._is_known(a, DataValidator._VALID_AUDIENCES_SET)]
                 if invalid_audiences:
                     errors.append(f"Invalid audience codes: {invalid_audiences}")
         
         # Validate event_type (changed from location_type)
-        if data.get('event_type') and data['event_type'] not in DataValidator.VALID_EVENT_TYPES:
+        if data.get('event_type') and not DataValidator._is_known(data['event_type'], DataValidator._VALID_EVENT_TYPES_SET):
             errors.append(f"Invalid event_type: {data['event_type']}")
         
         # Validate fee_type (simplified)
-        if data.get('fee_type') and data['fee_type'] not in DataValidator.VALID_FEE_TYPES:
+        if data.get('fee_type') and not DataValidator._is_known(data['fee_type'], DataValidator._VALID_FEE_TYPES_SET):
             errors.append(f"Invalid fee_type: {data['fee_type']}")
         
         # Validate registration_date (REQUIRED - FIX 1: 2026-05-01)
@@ -85,7 +99,7 @@ class DataValidator:
         
         is_valid = len(errors) == 0
         
-        if not is_valid:
+        if not is_valid and log_errors:
             logger.warning(f"Validation failed for {data.get('post_id', 'unknown')}: {errors}")
         
         return is_valid, errors
@@ -103,18 +117,27 @@ class DataValidator:
         """
         valid = []
         invalid = []
+        # Error kind ("Invalid category", "Missing required field", ...) -> count,
+        # reported once instead of a warning per invalid record
+        error_counts = Counter()
         
         for data in data_list:
-            is_valid, errors = DataValidator.validate_opportunity(data)
+            is_valid, errors = DataValidator.validate_opportunity(data, log_errors=False)
             
             if is_valid:
                 valid.append(data)
             else:
+                logger.debug("Validation failed for %s: %s", data.get('post_id', 'unknown'), errors)
+                error_counts.update(error.split(':', 1)[0] for error in errors)
                 invalid.append({
                     'data': data,
                     'errors': errors
                 })
         
+        if error_counts:
+            summary = ', '.join(f"{kind} ({count})" for kind, count in error_counts.most_common())
+            logger.warning(f"Validation failed for {len(invalid)} records: {summary}")
+        
         logger.info(f"Validation complete: {len(valid)} valid, {len(invalid)} invalid")
         
         return valid, invalid
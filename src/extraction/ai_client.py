@@ -3,6 +3,7 @@ Unified AI Client with automatic fallback support
 Tries Gemini first, then OpenRouter if Gemini fails
 """
 
+import atexit
 import sys
 from pathlib import Path
 from typing import List, Dict
@@ -10,7 +11,6 @@ from typing import List, Dict
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.extraction.gemini_client import GeminiClient
 from src.extraction.openrouter_client import OpenRouterClient
 from src.extraction.utils.config import config
 from src.extraction.utils.logger import setup_logger
@@ -20,8 +20,6 @@ logger = setup_logger('ai_client')
 class AIClient:
     def __init__(self):
         """Initialize unified AI client with OpenRouter and Gemini"""
-        self.gemini_client = GeminiClient()
-        
         # Initialize OpenRouter only if keys are available
         self.openrouter_client = None
         if config.OPENROUTER_API_KEYS:
@@ -34,11 +32,44 @@ class AIClient:
         else:
             logger.info("[OPENROUTER] No API keys configured")
         
+        # Gemini is created up front only when it is the primary service. As
+        # the fallback it is created on first use: importing the google-genai
+        # SDK takes a noticeable part of startup, and runs where OpenRouter
+        # never fails don't need it at all
+        self._gemini_client = None
+        if not self._openrouter_is_primary():
+            self._gemini_client = self.gemini_client
+        
         # Log primary service configuration
-        if config.PRIMARY_SERVICE == 'openrouter' and self.openrouter_client:
+        if self._openrouter_is_primary():
             logger.info(f"[CONFIG] PRIMARY: OpenRouter Free | FALLBACK: Gemini API")
         else:
             logger.info(f"[CONFIG] PRIMARY: Gemini API | FALLBACK: OpenRouter" if self.openrouter_client else "[CONFIG] Gemini API only")
+        
+        # Release pooled connections however the run ends (including sys.exit)
+        atexit.register(self.close)
+    
+    @property
+    def gemini_client(self):
+        """Gemini client, created on first access"""
+        if self._gemini_client is None:
+            from src.extraction.gemini_client import GeminiClient
+            self._gemini_client = GeminiClient()
+        return self._gemini_client
+    
+    def _openrouter_is_primary(self) -> bool:
+        """True when OpenRouter is configured as the primary service and available"""
+        return config.PRIMARY_SERVICE == 'openrouter' and self.openrouter_client is not None
+    
+    def close(self):
+        """Close HTTP connections held by the underlying clients"""
+        for client in (self._gemini_client, self.openrouter_client):
+            if client is None:
+                continue
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug("Error closing %s: %s", type(client).__name__, e)
     
     def process_batch(self, captions_batch: List[Dict], ocr_texts: Dict[str, tuple] = None, send_images: bool = True) -> List[Dict]:
         """
@@ -64,11 +95,11 @@ class AIClient:
         """
         
         # Determine primary and fallback services based on config
-        if config.PRIMARY_SERVICE == 'openrouter' and self.openrouter_client:
+        if self._openrouter_is_primary():
             primary_name = "OpenRouter"
             primary_client = self.openrouter_client
             fallback_name = "Gemini"
-            fallback_client = self.gemini_client
+            fallback_client = self._gemini_client  # None until first needed
         else:
             primary_name = "Gemini"
             primary_client = self.gemini_client
@@ -94,6 +125,12 @@ class AIClient:
         except Exception as e:
             logger.warning(f"[PRIMARY] ✗ {primary_name} failed with exception: {str(e)[:100]}")
         
+        if fallback_client is None and fallback_name == "Gemini":
+            try:
+                fallback_client = self.gemini_client
+            except Exception as e:
+                logger.error(f"[FALLBACK] Could not initialize Gemini: {e}")
+        
         # If PRIMARY failed and FALLBACK is available
         if fallback_client:
             logger.warning(f"[FALLBACK] {primary_name} failed, trying {fallback_name}...")
@@ -3,6 +3,7 @@ Gemini API Client for data extraction
 """
 
 import json
+import re
 import sys
 import time
 from pathlib import Path
@@ -16,18 +17,32 @@ from google.genai import types
 
 from src.extraction.utils.config import config
 from src.extraction.utils.logger import setup_logger
+from src.extraction.utils.retry import backoff_delay
 
 logger = setup_logger('gemini')
 
+# JSON recovery patterns (compiled once; used only when a response fails to parse)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_MISSING_COMMA_RE = re.compile(r'}\s*{')
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}')
+
 class GeminiClient:
     def __init__(self):
         """Initialize Gemini client with API key rotation support"""
+        # One SDK client per API key: keys rotate before every batch, and a
+        # fresh client would open a new connection (TCP + TLS) each time
+        self._clients: Dict[str, genai.Client] = {}
         self._initialize_client(config.GEMINI_API_KEY)
     
     def _initialize_client(self, api_key: str):
         """Initialize or reinitialize client with given API key"""
-        self.client = genai.Client(api_key=api_key)
-        logger.info(f"Initialized Gemini client with model: {config.GEMINI_MODEL}")
+        client = self._clients.get(api_key)
+        if client is None:
+            client = genai.Client(api_key=api_key)
+            self._clients[api_key] = client
+            logger.info(f"Initialized Gemini client with model: {config.GEMINI_MODEL}")
+        self.client = client
     
     def _parse_json_with_recovery(self, json_text: str) -> List[Dict]:
         """
@@ -39,8 +54,6 @@ class GeminiClient:
         Returns:
             Parsed JSON array or empty list if all strategies fail
         """
-        import re
-        
         # Strategy 1: Direct parse
         try:
             data = json.loads(json_text)
@@ -51,7 +64,7 @@ class GeminiClient:
         
         # Strategy 2: Extract JSON array with regex
         try:
-            json_match = re.search(r'\[.*\]', json_text, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(json_text)
             if json_match:
                 data = json.loads(json_match.group(0))
                 logger.info("[OK] JSON recovered (regex extraction)")
@@ -62,7 +75,7 @@ class GeminiClient:
         # Strategy 3: Fix common JSON formatting issues
         try:
             # Remove trailing commas before closing brackets
-            fixed_text = re.sub(r',(\s*[}\]])', r'\1', json_text)
+            fixed_text = _TRAILING_COMMA_RE.sub(r'\1', json_text)
             
             # Fix unescaped quotes in strings (common issue)
             # This is tricky - only fix quotes that are clearly inside string values
@@ -70,7 +83,7 @@ class GeminiClient:
             # We'll try to escape quotes that appear between ": " and next "
             
             # Fix missing commas between objects
-            fixed_text = re.sub(r'}\s*{', '},{', fixed_text)
+            fixed_text = _MISSING_COMMA_RE.sub('},{', fixed_text)
             
             # Try parsing fixed text
             data = json.loads(fixed_text)
@@ -82,7 +95,7 @@ class GeminiClient:
         # Strategy 4: Extract individual objects and rebuild array
         try:
             # Find all complete JSON objects
-            objects = re.findall(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', json_text)
+            objects = _JSON_OBJECT_RE.findall(json_text)
             if objects:
                 parsed_objects = []
                 for obj_text in objects:
@@ -124,6 +137,15 @@ class GeminiClient:
         logger.error(f"Response preview: {json_text[:500]}...")
         return []
     
+    def close(self):
+        """Close the SDK clients' HTTP connections"""
+        for client in self._clients.values():
+            # Client.close() only exists in newer google-genai releases
+            close = getattr(client, 'close', None)
+            if close:
+                close()
+        self._clients.clear()
+    
     def _rotate_api_key(self):
         """
         Rotate to next API key
@@ -283,7 +305,7 @@ Processing posts:
                         )
                         
                         images_loaded += 1
-                        logger.debug(f"[IMAGE] Loaded {image_filename} ({img.width}x{img.height})")
+                        logger.debug("[IMAGE] Loaded %s (%dx%d)", image_filename, img.width, img.height)
                         
                     except Exception as e:
                         images_failed += 1
@@ -453,8 +475,8 @@ Return JSON array only:
                     # Log error details
                     if is_server_error:
                         # Server overload - wait and retry with optimized backoff
-                        wait_time = min(2 ** attempt, config.MAX_BACKOFF_SECONDS)  # Optimized: max 10s
-                        logger.warning(f"[WARNING] Server error (503/500) - waiting {wait_time}s before retry...")
+                        wait_time = backoff_delay(attempt, config.MAX_BACKOFF_SECONDS)  # Jittered, max 10s
+                        logger.warning(f"[WARNING] Server error (503/500) - waiting {wait_time:.1f}s before retry...")
                         time.sleep(wait_time)
                         logger.info(f"[RETRY] Retrying with key #{config.CURRENT_KEY_INDEX + 1}, model: {config.GEMINI_MODEL} (attempt {attempt}/{max_attempts})")
                         continue
@@ -491,8 +513,8 @@ Return JSON array only:
                     
                     # For other errors, use optimized exponential backoff
                     if attempt < max_attempts:
-                        wait_time = min(2 ** attempt, config.MAX_BACKOFF_SECONDS)  # Optimized: max 10s
-                        logger.warning(f"Retrying in {wait_time}s...")
+                        wait_time = backoff_delay(attempt, config.MAX_BACKOFF_SECONDS)  # Jittered, max 10s
+                        logger.warning(f"Retrying in {wait_time:.1f}s...")
                         time.sleep(wait_time)
                     else:
                         logger.error(f"All {max_attempts} attempts failed")
@@ -4,9 +4,11 @@ Main Data Extraction Pipeline
 
 import json
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -17,10 +19,20 @@ from src.extraction.organizer_validator import OrganizerValidator
 from src.extraction.checkpoint_manager import CheckpointManager
 from src.extraction.utils.config import config
 from src.extraction.utils.logger import setup_logger
-from src.extraction.utils.helpers import extract_urls, extract_phone_numbers, get_timestamp, extract_registration_date_fallback, extract_organizer_fallback
+from src.extraction.utils.helpers import extract_urls, extract_phone_numbers, get_timestamp, extract_registration_date_fallback, extract_organizer_fallback, _keyword_alternation
 
 logger = setup_logger('extractor')
 
+# Registration-URL hints (URL text or the caption just before it), one alternation
+# so each candidate URL/context is scanned once
+_REGISTRATION_URL_HINT_RE = _keyword_alternation([
+    'daftar', 'regist', 'form', 'pendaftaran', 'bit.ly', 'forms.gle', 'linktr.ee', 's.id'
+])
+
+# Decorative emoji stripped from a caption's first line before it is used as a
+# title (all single code points, so one translate() removes them all)
+_TITLE_PREFIX_TRANS = str.maketrans(dict.fromkeys('📢🎉🔥✨⚡🎯📣'))
+
 class DataExtractor:
     def __init__(self):
         """Initialize data extractor"""
@@ -34,13 +46,15 @@ class DataExtractor:
         self.ocr_attempts = 0
         self.ocr_successes = 0
     
-    def extract_all_ocr_texts(self, captions: List[Dict]) -> Dict[str, tuple]:
+    def extract_all_ocr_texts(self, captions: List[Dict], stop: Optional[threading.Event] = None) -> Dict[str, tuple]:
         """
         Extract OCR text from ALL images BEFORE processing with Gemini (Phase A Enhancement)
         This is the key change - OCR happens FIRST, not as fallback
         
         Args:
             captions: List of caption dictionaries with image info
+            stop: Optional event checked between images; once set, the
+                remaining images are skipped (used to abandon a prefetch)
         
         Returns:
             Dictionary mapping post_id to (ocr_text, confidence_score)
@@ -57,6 +71,12 @@ class DataExtractor:
             'avg_confidence': []
         }
         
+        # Resolve full path to images
+        project_root = Path(__file__).parent.parent.parent
+        # FIX: Images are in scraper/instagram_images/, not data/images/
+        image_dir = project_root / 'scraper' / 'instagram_images'
+        
+        pending = []
         for item in captions:
             if 'downloaded_image' not in item:
                 ocr_stats['no_image'] += 1
@@ -64,33 +84,44 @@ class DataExtractor:
             
             ocr_stats['total_images'] += 1
             image_filename = item['downloaded_image']
-            post_id = item['post_id']
-            
-            # Resolve full path to image
-            project_root = Path(__file__).parent.parent.parent
-            # FIX: Images are in scraper/instagram_images/, not data/images/
-            image_path = project_root / 'scraper' / 'instagram_images' / image_filename
+            image_path = image_dir / image_filename
             
             if not image_path.exists():
                 logger.warning(f"[OCR] Image not found: {image_filename}")
                 ocr_stats['failed'] += 1
                 continue
             
+            pending.append((item['post_id'], image_path))
+        
+        def run_ocr(image_path: Path) -> tuple:
+            if stop is not None and stop.is_set():
+                return None, 0
             # Extract with preprocessing and confidence
-            ocr_text, confidence = self.ocr_extractor.extract_with_confidence(
-                str(image_path),
-                timeout=10
-            )
-            
+            return self.ocr_extractor.extract_with_confidence(str(image_path), timeout=10)
+        
+        # Tesseract runs as a subprocess per image, so threads overlap the OCR
+        # work itself (results still come back in caption order)
+        image_paths = [image_path for _, image_path in pending]
+        if config.OCR_WORKERS > 1 and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=config.OCR_WORKERS) as executor:
+                ocr_results = list(executor.map(run_ocr, image_paths))
+        else:
+            ocr_results = map(run_ocr, image_paths)
+        
+        for (post_id, _), (ocr_text, confidence) in zip(pending, ocr_results):
             if ocr_text:
                 ocr_texts[post_id] = (ocr_text, confidence)
                 ocr_stats['successful'] += 1
                 ocr_stats['total_chars'] += len(ocr_text)
                 ocr_stats['avg_confidence'].append(confidence)
-                logger.debug(f"[OCR] {post_id}: {len(ocr_text)} chars, {confidence}% confidence")
+                logger.debug("[OCR] %s: %d chars, %s%% confidence", post_id, len(ocr_text), confidence)
             else:
                 ocr_stats['failed'] += 1
-                logger.debug(f"[OCR] {post_id}: No text extracted")
+                logger.debug("[OCR] %s: No text extracted", post_id)
+        
+        if stop is not None and stop.is_set():
+            logger.info("[OCR] Stopped early, skipped the remaining images")
+            return ocr_texts
         
         # Log summary
         success_rate = (ocr_stats['successful'] / ocr_stats['total_images'] * 100) if ocr_stats['total_images'] > 0 else 0
@@ -106,8 +137,17 @@ class DataExtractor:
         
         return ocr_texts
     
-    def process_account(self, account_name: str, captions: List[Dict]) -> List[Dict]:
-        """Process captions for a single account with error handling"""
+    def process_account(self, account_name: str, captions: List[Dict], ocr_texts: Optional[Dict[str, tuple]] = None) -> List[Dict]:
+        """
+        Process captions for a single account with error handling
+        
+        Args:
+            account_name: Instagram account name
+            captions: Posts for the account
+            ocr_texts: OCR results already extracted for these posts
+                (e.g. prefetched while the previous account ran); extracted
+                here when None
+        """
         
         total_captions = len(captions)
         
@@ -116,12 +156,13 @@ class DataExtractor:
         logger.info('='*60)
         
         # PHASE A CHANGE: Extract OCR text from ALL images FIRST
-        ocr_texts = {}
-        if self.ocr_extractor.available:
-            ocr_texts = self.extract_all_ocr_texts(captions)
-        else:
-            logger.warning("[OCR] OCR not available - continuing without OCR enhancement")
-            logger.warning("[OCR] Install Tesseract OCR for better extraction accuracy")
+        if ocr_texts is None:
+            ocr_texts = {}
+            if self.ocr_extractor.available:
+                ocr_texts = self.extract_all_ocr_texts(captions)
+            else:
+                logger.warning("[OCR] OCR not available - continuing without OCR enhancement")
+                logger.warning("[OCR] Install Tesseract OCR for better extraction accuracy")
         
         all_results = []
         failed_batches = []
@@ -158,44 +199,49 @@ class DataExtractor:
                 
                 if batch_results:
                     # Add metadata to results with robust fallback logic
+                    batch_len = len(batch)
                     for j, result in enumerate(batch_results):
-                        if j >= len(batch):
-                            logger.warning(f"    [WARNING] Result index {j} exceeds batch size {len(batch)}")
+                        if j >= batch_len:
+                            logger.warning(f"    [WARNING] Result index {j} exceeds batch size {batch_len}")
                             continue
-                            
-                        original_caption = batch[j]['caption']
+                        
+                        post = batch[j]
+                        original_caption = post['caption']
                         
                         # Store raw caption for frontend display
                         result['raw_caption'] = original_caption
                         
                         # Get post_id for OCR text lookup
-                        post_id = batch[j]['post_id']
                         ocr_text = None
-                        if post_id in ocr_texts:
-                            ocr_text, ocr_confidence = ocr_texts[post_id]
+                        ocr_entry = ocr_texts.get(post['post_id'])
+                        if ocr_entry is not None:
+                            ocr_text, ocr_confidence = ocr_entry
                         
                         # ROBUST FALLBACK: Title (PHASE C PART 3)
-                        if not result.get('title') or not result.get('title').strip():
+                        title = result.get('title')
+                        if not title or not title.strip():
                             # Try to extract from first line of caption
                             if original_caption:
-                                first_line = original_caption.split('\n')[0].strip()
+                                # partition() stops at the first newline instead of
+                                # splitting the whole caption
+                                first_line = original_caption.partition('\n')[0]
                                 # Remove common prefixes
-                                for prefix in ['📢', '🎉', '🔥', '✨', '⚡', '🎯', '📣']:
-                                    first_line = first_line.replace(prefix, '').strip()
+                                first_line = first_line.translate(_TITLE_PREFIX_TRANS).strip()
                                 
                                 if first_line and len(first_line) >= 5:
                                     # Use first 100 characters as title
                                     result['title'] = first_line[:100]
                                     fallback_stats['title_fallback'] = fallback_stats.get('title_fallback', 0) + 1
-                                    logger.debug(f"[FALLBACK-CAPTION] Extracted title: {result['title'][:50]}...")
+                                    logger.debug("[FALLBACK-CAPTION] Extracted title: %s...", result['title'][:50])
                             
                             # If still no title, try OCR text
-                            if (not result.get('title') or not result.get('title').strip()) and ocr_text:
-                                first_line_ocr = ocr_text.split('\n')[0].strip()
+                            title = result.get('title')
+                            if (not title or not title.strip()) and ocr_text:
+                                first_line_ocr = ocr_text.partition('\n')[0].strip()
                                 if first_line_ocr and len(first_line_ocr) >= 5:
                                     result['title'] = first_line_ocr[:100]
                                     fallback_stats['title_fallback_ocr'] = fallback_stats.get('title_fallback_ocr', 0) + 1
-                                    logger.debug(f"[FALLBACK-OCR] Extracted title: {result['title'][:50]}...")
+                                    logger.debug("[FALLBACK-OCR] Extracted title: %s...", result['title'][:50])
                         
                         # ROBUST FALLBACK: Registration Date
                         if not result.get('registration_date'):
@@ -204,7 +250,7 @@ class DataExtractor:
                             if fallback_date:
                                 result['registration_date'] = fallback_date
                                 fallback_stats['regex_dates'] += 1
-                                logger.debug(f"[FALLBACK-REGEX] Extracted registration_date: {fallback_date}")
+                                logger.debug("[FALLBACK-REGEX] Extracted registration_date: %s", fallback_date)
                             
                             # Step 2: Try OCR text (already extracted)
                             elif ocr_text:
@@ -212,7 +258,7 @@ class DataExtractor:
                                 if ocr_date:
                                     result['registration_date'] = ocr_date
                                     fallback_stats['ocr_dates'] += 1
-                                    logger.debug(f"[FALLBACK-OCR] Extracted registration_date: {ocr_date}")
+                                    logger.debug("[FALLBACK-OCR] Extracted registration_date: %s", ocr_date)
                         
                         # ROBUST FALLBACK: Contact Phone
                         if not result.get('contact'):
@@ -221,7 +267,7 @@ class DataExtractor:
                             if phones:
                                 result['contact'] = phones[0]
                                 fallback_stats['regex_contacts'] += 1
-                                logger.debug(f"[FALLBACK-REGEX] Extracted contact: {phones[0]}")
+                                logger.debug("[FALLBACK-REGEX] Extracted contact: %s", phones[0])
                             
                             # Step 2: Try OCR text (PHASE A NEW)
                             elif ocr_text:
@@ -229,10 +275,11 @@ class DataExtractor:
                                 if phones_ocr:
                                     result['contact'] = phones_ocr[0]
                                     fallback_stats['ocr_contacts'] += 1
-                                    logger.debug(f"[FALLBACK-OCR] Extracted contact: {phones_ocr[0]}")
+                                    logger.debug("[FALLBACK-OCR] Extracted contact: %s", phones_ocr[0])
                         
                         # ROBUST FALLBACK: Organizer (PHASE B: With Validation)
-                        if not result.get('organizer'):
+                        gemini_organizer = result.get('organizer')
+                        if not gemini_organizer:
                             extracted_organizer = None
                             extraction_source = None
                             
@@ -280,13 +327,12 @@ class DataExtractor:
                                     elif extraction_source == 'mention':
                                         fallback_stats['mention_organizers'] = fallback_stats.get('mention_organizers', 0) + 1
                                     
-                                    logger.debug(f"[FALLBACK-{extraction_source.upper()}] Extracted organizer: {validated_organizer} (confidence: {confidence}%)")
+                                    logger.debug("[FALLBACK-%s] Extracted organizer: %s (confidence: %s%%)", extraction_source.upper(), validated_organizer, confidence)
                                 else:
-                                    logger.debug(f"[FALLBACK] Organizer validation failed: '{extracted_organizer}' (confidence: {confidence}%)")
+                                    logger.debug("[FALLBACK] Organizer validation failed: '%s' (confidence: %s%%)", extracted_organizer, confidence)
                         
                         # PHASE B: Validate Gemini-extracted organizer
-                        elif result.get('organizer'):
-                            gemini_organizer = result['organizer']
+                        else:
                             validated_organizer, confidence = self.organizer_validator.validate(
                                 gemini_organizer,
                                 account_name,
@@ -297,7 +343,7 @@ class DataExtractor:
                             if validated_organizer:
                                 result['organizer'] = validated_organizer
                                 result['organizer_confidence'] = confidence
-                                logger.debug(f"[GEMINI-VALIDATED] Organizer: {validated_organizer} (confidence: {confidence}%)")
+                                logger.debug("[GEMINI-VALIDATED] Organizer: %s (confidence: %s%%)", validated_organizer, confidence)
                             else:
                                 # Gemini extracted invalid organizer, remove it
                                 logger.warning(f"[VALIDATION] Removed invalid Gemini organizer: '{gemini_organizer}' (confidence: {confidence}%)")
@@ -310,18 +356,18 @@ class DataExtractor:
                             urls = extract_urls(original_caption)
                             if urls:
                                 # Prioritize registration-related URLs
-                                registration_keywords = ['daftar', 'regist', 'form', 'pendaftaran', 'bit.ly', 'forms.gle', 'linktr.ee', 's.id']
-                                
                                 best_url = None
+                                caption_lower = original_caption.lower()
                                 for url in urls:
                                     url_lower = url.lower()
-                                    if any(kw in url_lower for kw in registration_keywords):
+                                    if _REGISTRATION_URL_HINT_RE.search(url_lower):
                                         best_url = url
                                         break
-                                    url_index = original_caption.lower().find(url.lower())
+                                    url_index = caption_lower.find(url_lower)
                                     if url_index > 0:
-                                        context = original_caption[max(0, url_index-50):url_index].lower()
-                                        if any(kw in context for kw in registration_keywords):
+                                        # Search the 50 chars before the URL in place
+                                        # (pos/endpos) instead of slicing + lowercasing a copy
+                                        if _REGISTRATION_URL_HINT_RE.search(caption_lower, max(0, url_index-50), url_index):
                                             best_url = url
                                             break
                                 
@@ -331,19 +377,16 @@ class DataExtractor:
                                 if best_url:
                                     result['registration_url'] = best_url
                                     fallback_stats['regex_urls'] += 1
-                                    logger.debug(f"[FALLBACK-REGEX] Extracted registration_url: {best_url}")
+                                    logger.debug("[FALLBACK-REGEX] Extracted registration_url: %s", best_url)
                             
                             # Step 2: Try OCR text (PHASE A NEW)
                             elif ocr_text:
                                 urls_ocr = extract_urls(ocr_text)
                                 if urls_ocr:
                                     # Same prioritization logic
-                                    registration_keywords = ['daftar', 'regist', 'form', 'pendaftaran', 'bit.ly', 'forms.gle', 'linktr.ee', 's.id']
-                                    
                                     best_url = None
                                     for url in urls_ocr:
-                                        url_lower = url.lower()
-                                        if any(kw in url_lower for kw in registration_keywords):
+                                        if _REGISTRATION_URL_HINT_RE.search(url.lower()):
                                             best_url = url
                                             break
                                     
@@ -353,7 +396,7 @@ class DataExtractor:
                                     if best_url:
                                         result['registration_url'] = best_url
                                         fallback_stats['ocr_urls'] += 1
-                                        logger.debug(f"[FALLBACK-OCR] Extracted registration_url: {best_url}")
+                                        logger.debug("[FALLBACK-OCR] Extracted registration_url: %s", best_url)
                         
                         # SMART DATE FALLBACK (FIX 1: Required Dates - 2026-05-01)
                         # Apply smart fallback to ensure registration_date is always present
@@ -362,7 +405,7 @@ class DataExtractor:
                         if not registration_date or not registration_date.strip():
                             # No registration_date found, try to generate from deadline if available
                             # This will be handled by normalizer, just log for now
-                            logger.debug(f"[SMART FALLBACK] No registration_date for: {result.get('title', 'Unknown')[:50]}")
+                            logger.debug("[SMART FALLBACK] No registration_date for: %s", result.get('title', 'Unknown')[:50])
                             fallback_stats['no_registration_date'] = fallback_stats.get('no_registration_date', 0) + 1
                         else:
                             # Registration date exists, validate it has proper format
@@ -370,16 +413,21 @@ class DataExtractor:
                             from src.extraction.utils.helpers import extract_deadline_from_registration
                             deadline = extract_deadline_from_registration(registration_date)
                             if deadline:
-                                logger.debug(f"[DATE VALIDATION] registration_date: {registration_date}, deadline: {deadline}")
+                                logger.debug("[DATE VALIDATION] registration_date: %s, deadline: %s", registration_date, deadline)
                         
-                        # Add source metadata
-                        result['source_url'] = batch[j]['url']
-                        result['source_account'] = account_name
-                        result['image_url'] = batch[j].get('image_url')
+                        # Add source metadata in one merge (the dict is resized
+                        # at most once instead of per added key)
+                        source_metadata = {
+                            'source_url': batch[j]['url'],
+                            'source_account': account_name,
+                            'image_url': batch[j].get('image_url'),
+                        }
                         
                         # Add downloaded image filename if exists
                         if 'downloaded_image' in batch[j]:
-                            result['downloaded_image'] = batch[j]['downloaded_image']
+                            source_metadata['downloaded_image'] = batch[j]['downloaded_image']
+                        
+                        result.update(source_metadata)
                     
                     all_results.extend(batch_results)
                     logger.info(f"    [AI] Response received: {len(batch_results)}/{len(batch)} items extracted")
@@ -444,12 +492,24 @@ class DataExtractor:
             logger.info(f"  Fallbacks Applied:  {total_fallbacks} times")
         
         # PHASE B: Organizer Quality Metrics
-        organizers_extracted = sum(1 for r in all_results if r.get('organizer'))
+        # Single pass over the results: count/bucket confidences as we go
+        organizers_extracted = 0
+        confidence_total = 0
+        high_conf = medium_conf = low_conf = 0
+        for r in all_results:
+            confidence = r.get('organizer_confidence', 0)
+            if r.get('organizer'):
+                organizers_extracted += 1
+                confidence_total += confidence
+            if confidence >= 90:
+                high_conf += 1
+            elif confidence >= 60:
+                medium_conf += 1
+            elif confidence >= 30:
+                low_conf += 1
+        
         if organizers_extracted > 0:
-            high_conf = sum(1 for r in all_results if r.get('organizer_confidence', 0) >= 90)
-            medium_conf = sum(1 for r in all_results if 60 <= r.get('organizer_confidence', 0) < 90)
-            low_conf = sum(1 for r in all_results if 30 <= r.get('organizer_confidence', 0) < 60)
-            avg_confidence = sum(r.get('organizer_confidence', 0) for r in all_results if r.get('organizer')) / organizers_extracted
+            avg_confidence = confidence_total / organizers_extracted
             
             logger.info(f"\n[ORGANIZER QUALITY] @{account_name}:")
             logger.info(f"  Organizers Extracted: {organizers_extracted}/{total_captions} ({organizers_extracted/total_captions*100:.1f}%)")
@@ -503,38 +563,61 @@ class DataExtractor:
             logger.info(f"[CONFIG] Model: {config.GEMINI_MODEL} | Batch size: {config.BATCH_SIZE} | Rate limit: {config.DELAY_BETWEEN_REQUESTS}s")
             logger.info(f"{'='*60}\n")
         
-        # Process accounts from start_index
-        for account_index in range(start_index, total_accounts):
-            account_name = accounts_list[account_index]
-            captions = accounts[account_name]
-            
-            try:
-                account_results = self.process_account(account_name, captions)
-                all_results.extend(account_results)
-                
-                # Save checkpoint after each account
-                success = self.checkpoint_manager.save_checkpoint(
-                    account_index=account_index,
-                    account_name=account_name,
-                    results=all_results,
-                    total_accounts=total_accounts,
-                    accounts_list=accounts_list
-                )
-                
-                if success:
-                    logger.info(f"[CHECKPOINT] Progress saved: {len(all_results)} results ({account_index+1}/{total_accounts} accounts)")
-                else:
-                    logger.warning(f"[CHECKPOINT] Failed to save (continuing anyway)")
+        # OCR is local CPU work while AI extraction mostly waits on the network
+        # and rate-limit sleeps, so the next account's OCR runs in the
+        # background while the current account is sent to the AI. Accounts
+        # themselves stay sequential: they share API keys and rate limits, and
+        # the checkpoint records the last completed index.
+        ocr_executor = ThreadPoolExecutor(max_workers=1) if self.ocr_extractor.available else None
+        ocr_stop = threading.Event()
+        next_ocr = None
+        
+        try:
+            # Process accounts from start_index
+            for account_index in range(start_index, total_accounts):
+                account_name = accounts_list[account_index]
+                captions = accounts[account_name]
                 
-                # Small delay between accounts
-                if account_index < total_accounts - 1:
-                    logger.info(f"[WAIT] Pausing 2s before next account...")
-                    time.sleep(2)
+                try:
+                    ocr_future, next_ocr = next_ocr, None
+                    ocr_texts = ocr_future.result() if ocr_future is not None else None
                     
-            except Exception as e:
-                logger.error(f"[ERROR] Failed to process account @{account_name}: {e}")
-                logger.info(f"[CONTINUE] Continuing with next account...")
-                continue
+                    if ocr_executor is not None and account_index < total_accounts - 1:
+                        next_captions = accounts[accounts_list[account_index + 1]]
+                        next_ocr = ocr_executor.submit(self.extract_all_ocr_texts, next_captions, ocr_stop)
+                    
+                    account_results = self.process_account(account_name, captions, ocr_texts)
+                    all_results.extend(account_results)
+                    
+                    # Save checkpoint after each account
+                    success = self.checkpoint_manager.save_checkpoint(
+                        account_index=account_index,
+                        account_name=account_name,
+                        results=all_results,
+                        total_accounts=total_accounts,
+                        accounts_list=accounts_list
+                    )
+                    
+                    if success:
+                        logger.info(f"[CHECKPOINT] Progress saved: {len(all_results)} results ({account_index+1}/{total_accounts} accounts)")
+                    else:
+                        logger.warning(f"[CHECKPOINT] Failed to save (continuing anyway)")
+                    
+                    # Small delay between accounts
+                    if account_index < total_accounts - 1:
+                        logger.info(f"[WAIT] Pausing 2s before next account...")
+                        time.sleep(2)
+                        
+                except Exception as e:
+                    logger.error(f"[ERROR] Failed to process account @{account_name}: {e}")
+                    logger.info(f"[CONTINUE] Continuing with next account...")
+                    continue
+        finally:
+            # Also runs on Ctrl-C: the prefetch thread is not a daemon, so
+            # interpreter exit would otherwise wait for the next account's OCR
+            if ocr_executor is not None:
+                ocr_stop.set()
+                ocr_executor.shutdown(wait=False, cancel_futures=True)
         
         # Cleanup checkpoint on successful completion
         self.checkpoint_manager.cleanup_checkpoint()
@@ -591,8 +674,7 @@ def save_results(results: List[Dict], metrics: Dict = None, partial: bool = Fals
     
     # Save results
     output_file = config.PROCESSED_DIR / f'{prefix}{timestamp}.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    CheckpointManager.write_results(output_file, results)
     
     logger.info(f"[SAVE] Results saved: {output_file}")
     
@@ -665,7 +747,6 @@ def main():
         logger.info(f"  Total Posts:        {total_posts}")
         logger.info(f"  Successfully Extracted: {len(results)}/{total_posts} ({len(results)/total_posts*100:.1f}%)")
         logger.info(f"  Output File:        {output_file.name}")
-        logger.info(f"  Duration:           {extractor.ai_client.gemini_client.total_time:.1f}s" if hasattr(extractor.ai_client.gemini_client, 'total_time') else "")
         logger.info('='*60)
         logger.info(f"\n[NEXT] Database Insertion:")
         logger.info(f"  python src/database/main.py {output_file}\n")
@@ -678,9 +759,9 @@ def main():
         # Try to load from latest checkpoint if no results in memory
         if not results:
             try:
-                checkpoint_files = sorted(config.PROCESSED_DIR.glob('checkpoint_account_*.json'))
-                if checkpoint_files:
-                    latest_checkpoint = checkpoint_files[-1]
+                # Only the last name is needed - max() instead of sorting them all
+                latest_checkpoint = max(config.PROCESSED_DIR.glob('checkpoint_account_*.json'), default=None)
+                if latest_checkpoint:
                     logger.info(f"[RECOVERY] Loading from checkpoint: {latest_checkpoint.name}")
                     with open(latest_checkpoint, 'r', encoding='utf-8') as f:
                         checkpoint_data = json.load(f)
@@ -712,9 +793,9 @@ def main():
         # Try to load from latest checkpoint if no results in memory
         if not results:
             try:
-                checkpoint_files = sorted(config.PROCESSED_DIR.glob('checkpoint_account_*.json'))
-                if checkpoint_files:
-                    latest_checkpoint = checkpoint_files[-1]
+                # Only the last name is needed - max() instead of sorting them all
+                latest_checkpoint = max(config.PROCESSED_DIR.glob('checkpoint_account_*.json'), default=None)
+                if latest_checkpoint:
                     logger.info(f"[RECOVERY] Loading from checkpoint: {latest_checkpoint.name}")
                     with open(latest_checkpoint, 'r', encoding='utf-8') as f:
                         checkpoint_data = json.load(f)
@@ -147,7 +147,7 @@ class OCRExtractor:
             )
             
             if text and text.strip():
-                logger.debug(f"[OCR-PREPROCESS] Extracted {len(text)} chars from {Path(image_path).name}")
+                logger.debug("[OCR-PREPROCESS] Extracted %d chars from %s", len(text), Path(image_path).name)
                 return text.strip()
             
             return None
@@ -215,7 +215,7 @@ class OCRExtractor:
             if texts:
                 full_text = ' '.join(texts)
                 avg_confidence = sum(confidences) // len(confidences) if confidences else 0
-                logger.debug(f"[OCR-CONFIDENCE] {Path(image_path).name}: {avg_confidence}% confidence, {len(full_text)} chars")
+                logger.debug("[OCR-CONFIDENCE] %s: %s%% confidence, %d chars", Path(image_path).name, avg_confidence, len(full_text))
                 return full_text, avg_confidence
             
             return None, 0
@@ -263,10 +263,10 @@ class OCRExtractor:
             )
             
             if text and text.strip():
-                logger.debug(f"OCR extracted {len(text)} characters from {Path(image_path).name}")
+                logger.debug("OCR extracted %d characters from %s", len(text), Path(image_path).name)
                 return text.strip()
             else:
-                logger.debug(f"OCR found no text in {Path(image_path).name}")
+                logger.debug("OCR found no text in %s", Path(image_path).name)
                 return None
                 
         except pytesseract.TesseractNotFoundError:
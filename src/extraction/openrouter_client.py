@@ -3,26 +3,56 @@ OpenRouter API Client for data extraction fallback
 """
 
 import json
+import re
 import sys
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from typing import List, Dict, Optional
 import base64
 
+# orjson is optional: request bodies carry base64 images, which orjson encodes
+# much faster than the stdlib json that requests uses for json=
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.extraction.utils.config import config
 from src.extraction.utils.logger import setup_logger
+from src.extraction.utils.retry import backoff_delay
 
 logger = setup_logger('openrouter')
 
+# JSON recovery patterns (compiled once; used only when a response fails to parse)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_MISSING_COMMA_RE = re.compile(r'}\s*{')
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}')
+
+# HTTP timeouts: (connect, read) in seconds
+_CONNECT_TIMEOUT = 10
+_READ_TIMEOUT = 60
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled session so batches reuse the TCP/TLS connection"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount('https://', adapter)
+    return session
+
 class OpenRouterClient:
     def __init__(self):
         """Initialize OpenRouter client with API key rotation support"""
         self.api_endpoint = "https://openrouter.ai/api/v1/chat/completions"
         self.model = "openrouter/auto"  # Smart auto routing - picks best model for task
+        self.session = _build_session()
         self._initialize_client(config.OPENROUTER_API_KEY)
     
     def _initialize_client(self, api_key: str):
@@ -40,8 +70,6 @@ class OpenRouterClient:
         Returns:
             Parsed JSON array or empty list if all strategies fail
         """
-        import re
-        
         # Strategy 1: Direct parse
         try:
             data = json.loads(json_text)
@@ -52,7 +80,7 @@ class OpenRouterClient:
         
         # Strategy 2: Extract JSON array with regex
         try:
-            json_match = re.search(r'\[.*\]', json_text, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(json_text)
             if json_match:
                 data = json.loads(json_match.group(0))
                 logger.info("[OK] JSON recovered (regex extraction)")
@@ -62,8 +90,8 @@ class OpenRouterClient:
         
         # Strategy 3: Fix common JSON formatting issues
         try:
-            fixed_text = re.sub(r',(\s*[}\]])', r'\1', json_text)
-            fixed_text = re.sub(r'}\s*{', '},{', fixed_text)
+            fixed_text = _TRAILING_COMMA_RE.sub(r'\1', json_text)
+            fixed_text = _MISSING_COMMA_RE.sub('},{', fixed_text)
             data = json.loads(fixed_text)
             logger.info("[OK] JSON recovered (formatting fixes)")
             return data
@@ -72,7 +100,7 @@ class OpenRouterClient:
         
         # Strategy 4: Extract individual objects and rebuild array
         try:
-            objects = re.findall(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', json_text)
+            objects = _JSON_OBJECT_RE.findall(json_text)
             if objects:
                 parsed_objects = []
                 for obj_text in objects:
@@ -112,6 +140,10 @@ class OpenRouterClient:
         logger.error(f"Response preview: {json_text[:500]}...")
         return []
     
+    def close(self):
+        """Close pooled HTTP connections"""
+        self.session.close()
+    
     def _rotate_api_key(self):
         """
         Rotate to next API key
@@ -259,7 +291,7 @@ Return JSON array only:
                             }
                         })
                         images_loaded += 1
-                        logger.debug(f"[IMAGE] Loaded {image_filename}")
+                        logger.debug("[IMAGE] Loaded %s", image_filename)
                     else:
                         images_failed += 1
                 else:
@@ -319,6 +351,9 @@ Return JSON array only:
                 "response_format": {"type": "json_object"}
             }
             
+            # Encode the body once; retries and key rotations resend the same bytes
+            body = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode('utf-8')
+            
             # Call OpenRouter API with retry logic
             response = None
             last_error = None
@@ -337,11 +372,11 @@ Return JSON array only:
                         logger.info(f"[RETRY] Attempt {attempt}/{max_attempts} with key #{config.CURRENT_OPENROUTER_KEY_INDEX + 1}")
                     
                     # Make API call
-                    response = requests.post(
+                    response = self.session.post(
                         self.api_endpoint,
                         headers=headers,
-                        json=payload,
-                        timeout=60
+                        data=body,
+                        timeout=(_CONNECT_TIMEOUT, _READ_TIMEOUT)
                     )
                     
                     # Check response status
@@ -377,8 +412,8 @@ Return JSON array only:
                     # Log error details
                     if is_server_error:
                         # Server overload - wait and retry with optimized backoff
-                        wait_time = min(2 ** attempt, config.MAX_BACKOFF_SECONDS)  # Optimized: max 10s
-                        logger.warning(f"[WARNING] Server error (503/500) - waiting {wait_time}s before retry...")
+                        wait_time = backoff_delay(attempt, config.MAX_BACKOFF_SECONDS)  # Jittered, max 10s
+                        logger.warning(f"[WARNING] Server error (503/500) - waiting {wait_time:.1f}s before retry...")
                         time.sleep(wait_time)
                         continue
                     elif is_quota_error:
@@ -408,8 +443,8 @@ Return JSON array only:
                     
                     # For other errors, use optimized exponential backoff
                     if attempt < max_attempts:
-                        wait_time = min(2 ** attempt, config.MAX_BACKOFF_SECONDS)  # Optimized: max 10s
-                        logger.warning(f"Retrying in {wait_time}s...")
+                        wait_time = backoff_delay(attempt, config.MAX_BACKOFF_SECONDS)  # Jittered, max 10s
+                        logger.warning(f"Retrying in {wait_time:.1f}s...")
                         time.sleep(wait_time)
                     else:
                         logger.error(f"All {max_attempts} attempts failed")
@@ -4,7 +4,6 @@ Organizer Validator
 Validates extracted organizer names and assigns confidence scores
 """
 
-import re
 from typing import Optional, Tuple
 from pathlib import Path
 import sys
@@ -13,9 +12,15 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.extraction.utils.logger import setup_logger
+# Shared compiled @mention pattern and keyword-alternation builder
+from src.extraction.utils.helpers import _MENTION_RE, _keyword_alternation
 
 logger = setup_logger('organizer_validator')
 
+# Words that mark the name right after them as the organizer ("presented by X" /
+# "diselenggarakan oleh X" contain "by X" / "oleh X", so these three cover them)
+_BY_PREFIXES = ('by ', 'dari ', 'oleh ')
+
 
 class OrganizerValidator:
     """
@@ -56,6 +61,13 @@ class OrganizerValidator:
             'organisasi', 'komunitas', 'perkumpulan'
         ]
         
+        # Substring checks against the lists above, one regex pass each
+        self._blacklist_re = _keyword_alternation(self.generic_blacklist)
+        self._source_account_re = _keyword_alternation(self.source_accounts)
+        self._institution_re = _keyword_alternation(self.institution_keywords)
+        # Hash lookup for the per-mention exact checks
+        self._source_account_set = frozenset(self.source_accounts)
+        
         logger.info("[VALIDATOR] Organizer validator initialized")
     
     def validate(
@@ -89,29 +101,29 @@ class OrganizerValidator:
         
         # 1. Length check (too short or too long)
         if len(organizer) < 3:
-            logger.debug(f"[VALIDATOR] Rejected (too short): '{organizer}'")
+            logger.debug("[VALIDATOR] Rejected (too short): '%s'", organizer)
             return None, 0
         
         if len(organizer) > 100:
-            logger.debug(f"[VALIDATOR] Rejected (too long): '{organizer}'")
+            logger.debug("[VALIDATOR] Rejected (too long): '%s'", organizer)
             return None, 0
         
         # 2. Blacklist check (generic phrases)
-        for phrase in self.generic_blacklist:
-            if phrase in organizer_lower:
-                logger.debug(f"[VALIDATOR] Rejected (blacklist): '{organizer}' contains '{phrase}'")
-                return None, 0
+        match = self._blacklist_re.search(organizer_lower)
+        if match:
+            logger.debug("[VALIDATOR] Rejected (blacklist): '%s' contains '%s'", organizer, match.group(0))
+            return None, 0
         
         # 3. Source account check
-        for account in self.source_accounts:
-            if account in organizer_lower:
-                logger.debug(f"[VALIDATOR] Rejected (source account): '{organizer}' contains '{account}'")
-                return None, 0
+        match = self._source_account_re.search(organizer_lower)
+        if match:
+            logger.debug("[VALIDATOR] Rejected (source account): '%s' contains '%s'", organizer, match.group(0))
+            return None, 0
         
         # 4. Single generic word check (only reject truly generic single words)
         # NOTE: Removed 'sekolah', 'kampus', 'universitas' because they can be part of valid names
         if organizer_lower in ['para', 'teman', 'sobat', 'kesempatan', 'kreativitas']:
-            logger.debug(f"[VALIDATOR] Rejected (single generic word): '{organizer}'")
+            logger.debug("[VALIDATOR] Rejected (single generic word): '%s'", organizer)
             return None, 0
         
         # CONFIDENCE SCORING
@@ -121,48 +133,51 @@ class OrganizerValidator:
         # HIGH CONFIDENCE INDICATORS
         
         # Found in Instagram @mention (MOST RELIABLE)
-        mention_pattern = r'@([a-zA-Z0-9._]+)'
-        mentions = re.findall(mention_pattern, caption)
-        
-        # Check if organizer matches any @mention (fuzzy match)
-        for mention in mentions:
+        # Check if organizer matches any @mention (fuzzy match); finditer stops
+        # scanning the caption at the first matching mention
+        for match in _MENTION_RE.finditer(caption):
+            mention = match.group(1)
+            mention_lower = mention.lower()
+            
             # Skip source accounts
-            if mention.lower() in self.source_accounts:
+            if mention_lower in self._source_account_set:
                 continue
             
             # Exact match or close match
-            if mention.lower() in organizer_lower or organizer_lower in mention.lower():
+            if mention_lower in organizer_lower or organizer_lower in mention_lower:
                 confidence = 95
-                logger.debug(f"[VALIDATOR] High confidence (Instagram @mention): '{organizer}' matches @{mention}")
+                logger.debug("[VALIDATOR] High confidence (Instagram @mention): '%s' matches @%s", organizer, mention)
                 break
         
-        # Found with "by/dari/presented by" pattern
+        # Found with "by/dari/presented by" pattern: scan the text once for the
+        # organizer and check what precedes each occurrence, instead of one
+        # full scan per "<prefix> <organizer>" string
         if confidence < 90:
-            by_patterns = [
-                f"by {organizer_lower}",
-                f"dari {organizer_lower}",
-                f"oleh {organizer_lower}",
-                f"presented by {organizer_lower}",
-                f"diselenggarakan oleh {organizer_lower}"
-            ]
-            
             caption_lower = caption.lower()
             if ocr_text:
                 caption_lower += " " + ocr_text.lower()
             
-            if any(pattern in caption_lower for pattern in by_patterns):
-                confidence = 80
-                logger.debug(f"[VALIDATOR] Medium-high confidence (by/dari pattern): '{organizer}'")
+            index = caption_lower.find(organizer_lower)
+            while index != -1:
+                if caption_lower.endswith(_BY_PREFIXES, 0, index):
+                    confidence = 80
+                    logger.debug("[VALIDATOR] Medium-high confidence (by/dari pattern): '%s'", organizer)
+                    break
+                index = caption_lower.find(organizer_lower, index + 1)
         
         # MEDIUM CONFIDENCE INDICATORS
         
         # Contains known institution keywords
-        if any(kw in organizer_lower for kw in self.institution_keywords):
+        if self._institution_re.search(organizer_lower):
             confidence += 15
-            logger.debug(f"[VALIDATOR] Confidence boost (institution keyword): '{organizer}'")
+            logger.debug("[VALIDATOR] Confidence boost (institution keyword): '%s'", organizer)
+        
+        # Case/length features used by several rules below, computed once
+        is_all_upper = organizer.isupper()
+        name_length = len(organizer)
         
         # Has proper capitalization (likely a real name)
-        if organizer[0].isupper() and not organizer.isupper():
+        if organizer[0].isupper() and not is_all_upper:
             confidence += 5
         
         # Contains multiple words (more specific)
@@ -175,16 +190,16 @@ class OrganizerValidator:
         # LOW CONFIDENCE PENALTIES
         
         # Very short name (likely incomplete)
-        if len(organizer) < 5:
+        if name_length < 5:
             confidence -= 20
-            logger.debug(f"[VALIDATOR] Confidence penalty (very short): '{organizer}'")
+            logger.debug("[VALIDATOR] Confidence penalty (very short): '%s'", organizer)
         
         # All lowercase (might be incomplete)
         if organizer.islower():
             confidence -= 10
         
         # All uppercase (might be acronym without context)
-        if organizer.isupper() and len(organizer) < 10:
+        if is_all_upper and name_length < 10:
             confidence -= 5
         
         # Final confidence (clamp to 0-100)
@@ -192,7 +207,7 @@ class OrganizerValidator:
         
         # Reject if confidence too low
         if confidence < 30:
-            logger.debug(f"[VALIDATOR] Rejected (low confidence {confidence}%): '{organizer}'")
+            logger.debug("[VALIDATOR] Rejected (low confidence %s%%): '%s'", confidence, organizer)
             return None, confidence
         
         # Log validation result
@@ -203,7 +218,7 @@ class OrganizerValidator:
         else:
             level = "LOW"
         
-        logger.debug(f"[VALIDATOR] Validated ({level} {confidence}%): '{organizer}'")
+        logger.debug("[VALIDATOR] Validated (%s %s%%): '%s'", level, confidence, organizer)
         
         return organizer, confidence
     
@@ -223,27 +238,25 @@ class OrganizerValidator:
         if ocr_text:
             combined_text += " " + ocr_text
         
-        # Find all @mentions
-        mention_pattern = r'@([a-zA-Z0-9._]+)'
-        mentions = re.findall(mention_pattern, combined_text)
-        
-        # Filter out source accounts
-        valid_mentions = [
-            m for m in mentions 
-            if m.lower() not in self.source_accounts
-        ]
-        
-        if not valid_mentions:
+        # First @mention that isn't a source account (usually the organizer);
+        # scanning stops there instead of collecting every mention
+        mention = next(
+            (
+                m.group(1) for m in _MENTION_RE.finditer(combined_text)
+                if m.group(1).lower() not in self._source_account_set
+            ),
+            None
+        )
+        
+        if mention is None:
             return None
         
-        # Return first valid mention (usually the organizer)
         # Convert @mention to readable name (basic cleanup)
-        mention = valid_mentions[0]
         
         # Remove underscores and dots, capitalize words
         readable_name = mention.replace('_', ' ').replace('.', ' ')
         readable_name = ' '.join(word.capitalize() for word in readable_name.split())
         
-        logger.debug(f"[VALIDATOR] Extracted from @mention: @{mention} → '{readable_name}'")
+        logger.debug("[VALIDATOR] Extracted from @mention: @%s → '%s'", mention, readable_name)
         
         return readable_name
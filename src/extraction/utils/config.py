@@ -55,6 +55,9 @@ class Config:
     MAX_RETRY_ATTEMPTS = int(os.getenv('MAX_RETRY_ATTEMPTS', '3'))  # Reduced from 10
     MAX_BACKOFF_SECONDS = int(os.getenv('MAX_BACKOFF_SECONDS', '10'))  # Reduced from 30
     
+    # OCR
+    OCR_WORKERS = int(os.getenv('OCR_WORKERS', '1'))  # Threads for image OCR (1 = sequential)
+    
     # Paths
     OUTPUT_DIR = Path(os.getenv('OUTPUT_DIR', 'data/raw'))
     PROCESSED_DIR = Path(os.getenv('PROCESSED_DIR', 'data/processed'))
@@ -62,6 +65,15 @@ class Config:
     
     # Database
     DATABASE_URL = os.getenv('DATABASE_URL')
+    # Processes for date parsing (1 = in-process). Defaults to one per CPU:
+    # normalize_batch only starts the pool for large batches anyway
+    NORMALIZE_WORKERS = int(os.getenv('NORMALIZE_WORKERS', str(os.cpu_count() or 1)))
+    # Connections for chunked inserts (1 = sequential). With more than one,
+    # organizers are created before the fan-out and records sharing a slug or
+    # post_id stay in one chunk, but each worker has its own transaction and doesn't see
+    # rows the others haven't committed yet - keep this at 1 for batches where
+    # several accounts repost the same competition
+    INSERT_WORKERS = int(os.getenv('INSERT_WORKERS', '1'))
     
     @classmethod
     def get_next_api_key(cls):
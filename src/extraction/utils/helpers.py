@@ -3,9 +3,470 @@ Helper utility functions for extractor
 """
 
 import re
-from datetime import datetime, timedelta
-from typing import List, Optional
-import dateparser
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from dateparser.date import DateDataParser
+
+# dateparser compiles a large number of ad-hoc patterns per parse; with re's
+# default 512-entry cache those keep evicting each other and get recompiled
+re._MAXCACHE = max(getattr(re, '_MAXCACHE', 0), 10000)
+
+# One parser instance for the whole module - dateparser.parse() builds a new
+# DateDataParser (and reloads locale data) on every call when languages are given.
+# Languages are pinned (no detection across all locales); settings are left at
+# their defaults on purpose: 'en' is tried first, which is where the month-first
+# reading of "1/2/2026" comes from, and the fast paths in _parse_date mirror
+# that. Overriding DATE_ORDER / PREFER_DATES_FROM here would change results.
+_DATE_PARSER = DateDataParser(languages=['id', 'en'])
+
+# ============================================================================
+# PRECOMPILED PATTERNS
+# Compiled once at import so the hot per-caption paths don't pay re's cache
+# lookup on every call (dateparser churns through that cache heavily)
+# ============================================================================
+
+_MONTHS_ID = 'Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember'
+_MONTHS_EN = 'January|February|March|April|May|June|July|August|September|October|November|December'
+# Same 21 names as _MONTHS_ID + _MONTHS_EN, factored on shared prefixes so the
+# engine tries ~12 branches instead of 24 at every digit-space position. No
+# name is a prefix of another, so the factoring cannot change what matches.
+_MONTHS = (
+    'Jan(?:uari|uary)|Feb(?:ruari|ruary)|Ma(?:ret|rch|y)|April|Mei|Ju(?:n[ie]|l[iy])'
+    '|Agustus|August|September|O(?:ktober|ctober)|November|De(?:sember|cember)'
+)
+
+# Fast path for the plain date shapes the fallbacks build themselves
+# ("15 April 2026", "April 15, 2026", "2026-04-15", "15/04/2026") before
+# handing off to dateparser, which resolves locales on every call
+_MONTH_NUMBERS = {
+    'januari': 1, 'january': 1, 'jan': 1,
+    'februari': 2, 'february': 2, 'feb': 2,
+    'maret': 3, 'march': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'mei': 5, 'may': 5,
+    'juni': 6, 'june': 6, 'jun': 6,
+    'juli': 7, 'july': 7, 'jul': 7,
+    'agustus': 8, 'august': 8, 'agu': 8, 'aug': 8,
+    'september': 9, 'sep': 9,
+    'oktober': 10, 'october': 10, 'okt': 10, 'oct': 10,
+    'november': 11, 'nov': 11,
+    'desember': 12, 'december': 12, 'des': 12, 'dec': 12,
+}
+_DAY_MONTH_YEAR_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})')
+_MONTH_DAY_YEAR_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})')
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+# "5 Desember" / "Desember 5" - no year, dateparser fills in the current one
+_DAY_MONTH_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]+)')
+_MONTH_DAY_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})')
+# "15/04/2026", "1.4.2026" - read the way dateparser reads them for id+en
+# (month first when both numbers could be a month), so results don't change
+_NUMERIC_DATE_RE = re.compile(r'(\d{1,2})([/.])(\d{1,2})\2(\d{4})')
+
+# convert_month_to_indonesian: English/abbreviated month name -> Indonesian
+_MONTH_TO_INDONESIAN = {
+    'january': 'Januari', 'jan': 'Januari',
+    'february': 'Februari', 'feb': 'Februari',
+    'march': 'Maret', 'mar': 'Maret',
+    'april': 'April', 'apr': 'April',
+    'may': 'Mei',
+    'june': 'Juni', 'jun': 'Juni',
+    'july': 'Juli', 'jul': 'Juli',
+    'august': 'Agustus', 'aug': 'Agustus', 'agu': 'Agustus',
+    'september': 'September', 'sep': 'September',
+    'october': 'Oktober', 'oct': 'Oktober', 'okt': 'Oktober',
+    'november': 'November', 'nov': 'November',
+    'december': 'Desember', 'dec': 'Desember', 'des': 'Desember',
+}
+
+# Every date pattern below needs at least one digit; text without any can be skipped
+_DIGIT_RE = re.compile(r'\d')
+
+# Longest string handed to dateparser; anything longer is a caption fragment
+# (e.g. a whole "Hingga ..." line from the AI), never a single date
+_MAX_DATE_STRING_LENGTH = 256
+
+# A date needs at least one letter or digit; placeholders such as "-" or "..."
+# never parse, so they are answered without a dateparser call
+_ALNUM_RE = re.compile(r'[^\W_]')
+
+# extract_registration_date_fallback: keywords that indicate REGISTRATION dates (INCLUDE)
+# PHASE C: Added more deadline-specific keywords
+# PHASE E.2: Added user-observed patterns
+_REGISTRATION_KEYWORDS = [
+    'pendaftaran', 'registrasi', 'daftar', 'registration', 'regist',
+    'open submission', 'submission', 'open', 'batas pendaftaran', 
+    'deadline', 'tutup pendaftaran', 'close registration', 'dl:', 'dl ',
+    'tanggal pendaftaran', 'periode pendaftaran',
+    # PHASE C NEW: More deadline keywords
+    'batas', 'batas akhir', 'batas waktu', 'tutup', 'ditutup', 'penutupan',
+    'terakhir', 'akhir', 'closing', 's.d.', 's/d', 'hingga', 'sampai',
+    # PHASE E.2 NEW: User-observed high-confidence patterns
+    'catat tanggal', 'jangan sampai kelewatan', 'jangan lewatkan',
+    'segera daftar', 'buruan daftar', 'daftar sekarang'
+]
+
+# extract_registration_date_fallback: keywords that indicate EVENT dates, NOT registration (EXCLUDE)
+_EVENT_KEYWORDS = [
+    'acara', 'pelaksanaan', 'start belajar', 'start acara', 'mulai acara',
+    'jadwal acara', 'tanggal acara', 'waktu pelaksanaan', 'hari pelaksanaan',
+    'pelaksanaan final', 'final lomba', 'hari h'
+]
+
+# Each keyword list scanned as one alternation: a single regex pass per line
+# instead of one substring test per keyword
+_REGISTRATION_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _REGISTRATION_KEYWORDS)))
+_EVENT_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _EVENT_KEYWORDS)))
+
+# extract_registration_date_fallback: "DL" / "Deadline" patterns
+_DL_PATTERNS = [
+    # "DL: 15 April 2026" or "Deadline: 15 April 2026"
+    re.compile(r'(?:DL|Deadline)[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE),
+    # "DL 15/04/2026" or "Deadline 15/04/2026"
+    re.compile(r'(?:DL|Deadline)[:\s]+(\d{1,2})/(\d{1,2})/(\d{4})', re.IGNORECASE),
+    # "DL: 15-20 April 2026" (range with DL)
+    re.compile(r'(?:DL|Deadline)[:\s]+(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE),
+]
+
+# extract_registration_date_fallback: high-confidence registration phrases,
+# keyed by a literal anchor that must appear in the lowercased line
+_HIGH_CONFIDENCE_PATTERNS = [
+    # "catat tanggal: 1-14 April 2026" or "catat tanggal 1-14 April 2026"
+    ('catat tanggal', re.compile(r'catat tanggal[:\s]+(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+    # "jangan sampai kelewatan: 1-14 April 2026"
+    ('kelewatan', re.compile(r'jangan (?:sampai )?kelewatan[:\s]+(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+    # "catat tanggal: 1 April - 14 April 2026"
+    ('catat tanggal', re.compile(r'catat tanggal[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s*[-–]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+    # "jangan sampai kelewatan: 1 April - 14 April 2026"
+    ('kelewatan', re.compile(r'jangan (?:sampai )?kelewatan[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s*[-–]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+    # PHASE E.3 NEW: Additional high-confidence Indonesian patterns
+    # "sampai tanggal: 15 April 2026"
+    ('sampai tanggal', re.compile(r'sampai tanggal[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+    # "pendaftaran ditutup: 15 April 2026"
+    ('pendaftaran ditutup', re.compile(r'pendaftaran ditutup[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+    # "batas terakhir: 15 April 2026"
+    ('batas terakhir', re.compile(r'batas terakhir[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+    # "terakhir pendaftaran: 15 April 2026"
+    ('terakhir pendaftaran', re.compile(r'terakhir pendaftaran[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+    # "deadline pendaftaran: 15 April 2026"
+    ('deadline pendaftaran', re.compile(r'deadline pendaftaran[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+    # "tutup pendaftaran: 15 April 2026"
+    ('tutup pendaftaran', re.compile(r'tutup pendaftaran[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+    # "batas waktu pendaftaran: 15 April 2026"
+    ('batas waktu pendaftaran', re.compile(r'batas waktu pendaftaran[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE)),
+]
+
+# extract_registration_date_fallback: date ranges
+_RANGE_PATTERNS = [
+    # "Batch 1: April 1–14, 2026" or "Gelombang 1: 1-14 April 2026"
+    re.compile(r'(?:Batch|Gelombang)\s*\d+[:\s]+(\d{1,2})\s*[–\-—]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE),
+    # "Batch 1: 1 April - 14 April 2026"
+    re.compile(r'(?:Batch|Gelombang)\s*\d+[:\s]+(\d{1,2})\s+(' + _MONTHS + r')\s*[–\-—]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE),
+    # "1–30 April 2026" or "1-30 April 2026"
+    re.compile(r'(\d{1,2})\s*[–\-—]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE),
+    # "April 1 - April 30, 2026"
+    re.compile(r'(' + _MONTHS + r')\s+(\d{1,2})\s*[–\-—]\s*(' + _MONTHS + r')\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE),
+    # "27 April - 1 Mei 2026" or "19 Oktober — 5 November 2025"
+    re.compile(r'(\d{1,2})\s+(' + _MONTHS + r')\s*[–\-—]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE),
+    # "1 Januari 2026 - 2 Februari 2026" (full date range)
+    re.compile(r'(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})\s*[–\-—]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE),
+    # "11 Oktober - 16 November 2" (incomplete year - assume 2025/2026)
+    re.compile(r'(\d{1,2})\s+(' + _MONTHS + r')\s*[–\-—]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{1,2})', re.IGNORECASE),
+]
+
+# extract_registration_date_fallback: single dates
+_SINGLE_PATTERNS = [
+    re.compile(r'(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})', re.IGNORECASE),
+    re.compile(r'(' + _MONTHS + r')\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE),
+]
+
+# extract_registration_date_fallback: numeric dates
+_NUMERIC_PATTERNS = [
+    # "01/04/2026" or "1/4/2026" (DD/MM/YYYY - Indonesian format)
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), 'dmy'),
+    # "2026-04-01" (YYYY-MM-DD - ISO format)
+    (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'), 'ymd'),
+    # "01.04.2026" or "1.4.2026" (DD.MM.YYYY)
+    (re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})'), 'dmy'),
+]
+
+# extract_registration_date_fallback: abbreviated dates without year,
+# each with the literal anchors one of which must be in the lowercased line
+_ABBREVIATED_PATTERNS = [
+    # "tgl 1-5 April" or "tanggal 1-5 April"
+    (re.compile(r'(?:tgl|tanggal)\s*(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(' + _MONTHS_ID + r')', re.IGNORECASE), 'range', ('tgl', 'tanggal')),
+    # "s.d. 5 April" or "s/d 5 April" (sampai dengan)
+    (re.compile(r's[./]d[.]?\s*(\d{1,2})\s+(' + _MONTHS_ID + r')', re.IGNORECASE), 'single', ('s.d', 's/d')),
+    # "hingga 5 April"
+    (re.compile(r'hingga\s+(\d{1,2})\s+(' + _MONTHS_ID + r')', re.IGNORECASE), 'single', ('hingga',)),
+]
+
+# extract_organizer_fallback
+_MENTION_RE = re.compile(r'@([a-zA-Z0-9._]+)')
+_LETTER_DIGIT_RE = re.compile(r'([a-z])(\d)')
+_CAMEL_CASE_RE = re.compile(r'([a-z])([A-Z])')
+_BY_PATTERNS = [
+    # "by [Name]" or "oleh [Name]" - must be followed by capital letter (proper noun)
+    re.compile(r'(?:^|\n|\s)(?:by|dari)\s+([A-Z][A-Za-z\s&]+?)(?:\n|$|[.!,])', re.IGNORECASE),
+    # "oleh [Name]" - but NOT "oleh karena"
+    re.compile(r'(?:^|\n|\s)oleh\s+(?!karena)([A-Z][A-Za-z\s&]+?)(?:\n|$|[.!,])', re.IGNORECASE),
+    # "presented by" or "dipersembahkan oleh"
+    re.compile(r'(?:presented by|dipersembahkan oleh)\s+([A-Z][A-Za-z\s&]+?)(?:\n|$|[.!,])', re.IGNORECASE),
+]
+# Hashtag patterns only use explicit ASCII classes, so re.ASCII just skips the
+# Unicode case-folding tables (the date/fee/URL patterns keep Unicode \s and \d
+# for NBSP separators and styled digits)
+_HASHTAG_PATTERNS = [
+    re.compile(r'#([a-zA-Z][a-zA-Z0-9]*(?:[A-Z][a-z]+)+)', re.IGNORECASE | re.ASCII),  # CamelCase: #PareKampungInggris
+    re.compile(r'#([a-z]+(?:kampung|pare|inggris|english|academy|institute|university|college)[a-z]*)', re.IGNORECASE | re.ASCII),  # Lowercase with keywords
+]
+_ORG_PATTERNS = [
+    re.compile(r'((?:MPK|OSIS|BEM|HIMA|UKM)\s+[A-Z][A-Za-z\s&0-9]+?)(?:\s+(?:presents|mengadakan|membuka))', re.IGNORECASE),
+    re.compile(r'((?:Universitas|Institut|Sekolah|SMA|SMK|Pondok Pesantren)\s+[A-Z][A-Za-z\s0-9\-]+?)(?:\s+(?:presents|mengadakan|membuka))', re.IGNORECASE),
+]
+# Both _ORG_PATTERNS end in one of these verbs. Without it the lazy name group
+# runs to the end of every text run from every "SMA"/"BEM" start (quadratic on
+# long school lists), only to fail - so check for the verb first.
+_ORG_CONTEXT_VERB_RE = re.compile(r'presents|mengadakan|membuka', re.IGNORECASE)
+# Substring keyword groups, each compiled into one literal alternation so a
+# check is a single scan instead of one `in` per keyword
+def _keyword_alternation(keywords: List[str]) -> re.Pattern:
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+# Generic phrases that should NOT be organizers
+_ORGANIZER_BLACKLIST_RE = _keyword_alternation([
+    'para expert', 'sekolah yang sama', 'kreativitas', 'adu logika',
+    'inovasi masa depan', 'kesempatan', 'teman-teman', 'sobat',
+    'kreativitas hingga kompetisi', 'pentas raya', 'adu logika dan kecepatan',
+    'infolomba', 'lomba.it',
+    'karena itu', 'oleh karena itu', 'karena', 'itu'  # Caption fragments
+])
+# Mentions that look like institutions (preferred over other mentions)
+_INSTITUTION_MENTION_RE = _keyword_alternation([
+    'smp', 'sma', 'smk', 'sd', 'univ', 'institut', 'poltek',
+    'pesantren', 'ponpes', 'muhajirin', 'its', 'itb', 'ugm'
+])
+# University/institution tags
+_UNIVERSITY_TAG_RE = _keyword_alternation(['univ', 'institut', 'poltek', 'its', 'itb', 'ugm', 'ui'])
+
+# Whole-value matches only, so these are sets (one hash lookup per check)
+_GENERIC_ORGANIZER_WORDS = frozenset({'para', 'sekolah', 'teman', 'sobat', 'kesempatan', 'kreativitas'})
+_EXCLUDED_HASHTAGS = frozenset({
+    'lomba', 'kompetisi', 'beasiswa', 'gratis', 'free', 'indonesia',
+    'jakarta', 'surabaya', 'bandung', 'online', 'offline', 'gapyear',
+    'bahasainggris', 'freecourse', 'training', 'kursus', 'infolomba'
+})
+
+# extract_dates
+_DATE_RANGE_PATTERN_STRINGS = [
+    # Indonesian: "21-31 Maret 2026" or "21 - 31 Maret 2026"
+    r'(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(' + _MONTHS_ID + r')\s+(\d{4})',
+    # English: "April 27 - May 1, 2026"
+    r'(' + _MONTHS_EN + r')\s+(\d{1,2})\s*[-–,]*\s*(' + _MONTHS_EN + r')\s+(\d{1,2}),?\s+(\d{4})',
+    # Mixed: "27 April - 1 Mei 2026"
+    r'(\d{1,2})\s+(' + _MONTHS + r')\s*[-–]\s*(\d{1,2})\s+(' + _MONTHS + r')\s+(\d{4})',
+]
+_DATE_RANGE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in _DATE_RANGE_PATTERN_STRINGS]
+_DATE_RANGE_ANY_RE = re.compile('|'.join(_DATE_RANGE_PATTERN_STRINGS), re.IGNORECASE)
+_SINGLE_DATE_PATTERNS = [
+    # Full month names (Indonesian)
+    re.compile(r'\d{1,2}\s+(?:' + _MONTHS_ID + r')\s+\d{4}', re.IGNORECASE),
+    # Abbreviated month names (Indonesian)
+    re.compile(r'\d{1,2}\s+(?:Jan|Feb|Mar|Apr|Mei|Jun|Jul|Agu|Sep|Okt|Nov|Des)\s+\d{4}', re.IGNORECASE),
+    # English month names
+    re.compile(r'\d{1,2}\s+(?:' + _MONTHS_EN + r')\s+\d{4}', re.IGNORECASE),
+    re.compile(r'(?:' + _MONTHS_EN + r')\s+\d{1,2},?\s+\d{4}', re.IGNORECASE),
+    # Numeric formats
+    re.compile(r'\d{1,2}[/]\d{1,2}[/]\d{2,4}', re.IGNORECASE),
+    re.compile(r'\d{4}[/-]\d{1,2}[/-]\d{1,2}', re.IGNORECASE),
+]
+
+# extract_fee_amount
+# Free-event indicators, one alternation (stops at the first hit)
+_FREE_FEE_RE = re.compile('gratis|free|tanpa biaya|tidak dipungut biaya')
+# Matched against the lowercased text, so no IGNORECASE (per-char case folding)
+# is needed; the captured digits are the same either way.
+# Captions are untrusted input, so the patterns are written to stay linear:
+# number runs are possessive and only tried from their first digit (a match
+# can never need to give digits back), and the keyword patterns are anchored
+# per line with the first keyword locked in atomically, instead of a lazy
+# '.*?' re-scanning the rest of the line from every later keyword
+_FEE_PATTERNS = [
+    # Rp 350.000 or Rp 350,000 or Rp350000
+    (re.compile(r'rp\s*(\d+(?:\.\d{3})*(?:,\d+)?)'), 1),
+    # 350.000 rupiah or 350,000 rupiah
+    (re.compile(r'(?<!\d)(\d++(?:\.\d{3})*+(?:,\d++)?+)\s*+rupiah'), 1),
+    # 10K, 25K (thousands notation)
+    (re.compile(r'(?<!\d)(\d++)\s*+k(?:\s|$|[^a-z])'), 1000),
+    # biaya ... 350.000
+    (re.compile(r'^(?>[^\n]*?biaya)[^\d\n]*+(\d+(?:\.\d{3})*)', re.MULTILINE), 1),
+    # HTM ... 350.000
+    (re.compile(r'^(?>[^\n]*?htm)[^\d\n]*+(\d+(?:\.\d{3})*)', re.MULTILINE), 1),
+]
+_FEE_NUMBER_TRANS = str.maketrans({'.': None, ',': '.'})
+
+# extract_urls
+_URL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'https?://[^\s]+',  # Full URLs with http/https
+    r'bit\.ly/[^\s]+',   # bit.ly short links
+    r'linktr\.ee/[^\s]+', # Linktree
+    r'forms\.gle/[^\s]+', # Google Forms
+    r's\.id/[^\s]+',      # s.id short links
+
+    # PHASE C NEW: WhatsApp links
+    r'wa\.me/[^\s]+',     # wa.me/628123456789
+    r'api\.whatsapp\.com/send\?phone=[^\s]+',  # WhatsApp API links
+    r'chat\.whatsapp\.com/[^\s]+',  # WhatsApp group links
+
+    # PHASE C NEW: More short link services
+    r'tinyurl\.com/[^\s]+',  # TinyURL
+    r'ow\.ly/[^\s]+',        # Ow.ly (Hootsuite)
+    r'rebrand\.ly/[^\s]+',   # Rebrandly
+    r'cutt\.ly/[^\s]+',      # Cutt.ly
+    r'short\.link/[^\s]+',   # Short.link
+    r'tiny\.cc/[^\s]+',      # Tiny.cc
+
+    # PHASE C NEW: Indonesian short links
+    r'lynk\.id/[^\s]+',      # Lynk.id
+    r'shorten\.asia/[^\s]+', # Shorten.asia
+
+    # PHASE C PART 3 STAGE 4: Additional short domains
+    r'uns\.id/[^\s]+',       # UNS (Universitas Sebelas Maret) short links
+    r'fyde\.my/[^\s]+',      # Fyde short links
+    r'[a-z]+\.poli[a-z]*\.[a-z]+/[^\s]+',  # Politeknik links (e.g., jti.polinema.ac.id)
+
+    r'[a-zA-Z0-9-]+\.[a-zA-Z]{2,}/[^\s]*',  # Domain with path (e.g., sahut.co/event)
+)]
+
+# extract_phone_numbers
+_PHONE_PATTERNS = [re.compile(p) for p in (
+    # Standard format with country code
+    r'(?:\+62|0)[\s-]?\d{2,4}[\s-]?\d{3,4}[\s-]?\d{3,4}',
+
+    # PHASE C NEW: WhatsApp format (wa.me/628123456789)
+    r'wa\.me/(\d{10,13})',
+
+    # PHASE C NEW: Without separators (08123456789)
+    r'\b0\d{9,11}\b',
+
+    # PHASE C NEW: With parentheses (0812) 3456-7890
+    r'0\(\d{3}\)[\s-]?\d{4}[\s-]?\d{4}',
+
+    # PHASE C NEW: With dots (0812.3456.7890)
+    r'0\d{3}\.\d{4}\.\d{4}',
+
+    # PHASE C NEW: International format with plus
+    r'\+62[\s-]?\d{2,4}[\s-]?\d{3,4}[\s-]?\d{3,4}',
+)]
+_PHONE_SEPARATORS_RE = re.compile(r'[\s\-\.\(\)]')
+
+# extract_contacts
+_CONTACT_PATTERNS = [re.compile(p) for p in (
+    # CP: Name - phone or CP: Name (phone)
+    r'(?:CP|Contact|Kontak|Narahubung|Info)[\s:]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)[:\s\-\(]*(\+?62|0)[\s-]?(\d{2,4})[\s-]?(\d{3,4})[\s-]?(\d{3,4})',
+    # Name: phone (with capital letter start)
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)[:\s]*(\+?62|0)[\s-]?(\d{2,4})[\s-]?(\d{3,4})[\s-]?(\d{3,4})',
+    # - Name: phone (in lists)
+    r'[\-\•]\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)[:\s]*(\+?62|0)[\s-]?(\d{2,4})[\s-]?(\d{3,4})[\s-]?(\d{3,4})',
+)]
+_CONTACT_SEPARATORS_RE = re.compile(r'[\s-]')
+# Role labels looked for just before a contact's name, first listed wins
+_CONTACT_ROLE_KEYWORDS = ('CP', 'Contact', 'Kontak', 'Narahubung', 'Info')
+
+# categorize_dates: context keywords per date category, checked in this order.
+# One alternation with a named group per category; the lookahead keeps matches
+# overlapping so every category present in the line is reported.
+_DATE_CONTEXT_KEYWORDS = {
+    'registration': ['pendaftaran', 'registrasi', 'daftar', 'registration'],
+    'event': ['pelaksanaan', 'event', 'acara', 'lomba', 'competition'],
+    'deadline': ['deadline', 'batas', 'tutup', 'terakhir'],
+    'announcement': ['pengumuman', 'announcement', 'pemenang'],
+}
+_DATE_CONTEXT_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+    for category, keywords in _DATE_CONTEXT_KEYWORDS.items()
+) + ')')
+
+# sanitize_filename
+_UNSAFE_FILENAME_RE = re.compile(r'[^a-z0-9_-]')
+
+# extract_deadline_from_registration / parse_registration_date_to_dates
+_REG_RANGE_FULL_RE = re.compile(r'(\d{1,2}\s+\w+\s+\d{4})\s*[-–]\s*(\d{1,2}\s+\w+\s+\d{4})')
+_REG_RANGE_SAME_MONTH_RE = re.compile(r'(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(\w+)\s+(\d{4})')
+_REG_HINGGA_RE = re.compile(r'Hingga\s+(.+)', re.IGNORECASE)
+_REG_SD_RE = re.compile(r's[./]d[.]?\s+(.+)', re.IGNORECASE)
+_REG_SINGLE_RE = re.compile(r'(\d{1,2}\s+\w+\s+\d{4})')
+
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a date string, trying cheap exact formats before dateparser
+    
+    Args:
+        date_str: Date string such as "15 April 2026" or "2026-04-15"
+        
+    Returns:
+        datetime or None if the string cannot be parsed
+    """
+    # Relative dates ("besok", "tomorrow") resolve against now, so today is
+    # part of the cache key
+    return _parse_date_cached(date_str, datetime.now().date())
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str, today: date) -> Optional[datetime]:
+    """Memoized worker for _parse_date (captions from the same account repeat the same date strings)"""
+    date_str = date_str.strip()
+    if len(date_str) > _MAX_DATE_STRING_LENGTH or not _ALNUM_RE.search(date_str):
+        return None
+    
+    try:
+        match = _DAY_MONTH_YEAR_RE.fullmatch(date_str)
+        if match:
+            month = _MONTH_NUMBERS.get(match.group(2).lower())
+            if month:
+                return datetime(int(match.group(3)), month, int(match.group(1)))
+        
+        match = _MONTH_DAY_YEAR_RE.fullmatch(date_str)
+        if match:
+            month = _MONTH_NUMBERS.get(match.group(1).lower())
+            if month:
+                return datetime(int(match.group(3)), month, int(match.group(2)))
+        
+        match = _ISO_DATE_RE.fullmatch(date_str)
+        if match:
+            return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        
+        match = _NUMERIC_DATE_RE.fullmatch(date_str)
+        if match:
+            first, second, year = int(match.group(1)), int(match.group(3)), int(match.group(4))
+            # Zero parts get special handling in dateparser - leave those to it
+            if first and second:
+                for month, day in ((first, second), (second, first)):
+                    try:
+                        return datetime(year, month, day)
+                    except ValueError:
+                        continue
+        
+        # Year-less dates (the "s.d. 5 Desember" deadlines) take the year from
+        # the today key, never from the clock - an invalid day such as
+        # 29 Februari in a non-leap year is left to dateparser
+        match = _DAY_MONTH_RE.fullmatch(date_str)
+        if match:
+            month = _MONTH_NUMBERS.get(match.group(2).lower())
+            if month:
+                return datetime(today.year, month, int(match.group(1)))
+        
+        match = _MONTH_DAY_RE.fullmatch(date_str)
+        if match:
+            month = _MONTH_NUMBERS.get(match.group(1).lower())
+            if month:
+                return datetime(today.year, month, int(match.group(2)))
+    except ValueError:
+        # Out-of-range day/month - let dateparser have the final say
+        pass
+    
+    data = _DATE_PARSER.get_date_data(date_str)
+    return data['date_obj'] if data else None
 
 def extract_registration_date_fallback(text: str) -> Optional[str]:
     """
@@ -23,68 +484,50 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
     Returns:
         Human-readable date string in format "DD Month YYYY - DD Month YYYY" or None
     """
-    import dateparser
-    from datetime import datetime, timedelta
-    
-    # Keywords that indicate REGISTRATION dates (INCLUDE)
-    # PHASE C: Added more deadline-specific keywords
-    # PHASE E.2: Added user-observed patterns
-    registration_keywords = [
-        'pendaftaran', 'registrasi', 'daftar', 'registration', 'regist',
-        'open submission', 'submission', 'open', 'batas pendaftaran', 
-        'deadline', 'tutup pendaftaran', 'close registration', 'dl:', 'dl ',
-        'tanggal pendaftaran', 'periode pendaftaran',
-        # PHASE C NEW: More deadline keywords
-        'batas', 'batas akhir', 'batas waktu', 'tutup', 'ditutup', 'penutupan',
-        'terakhir', 'akhir', 'closing', 's.d.', 's/d', 'hingga', 'sampai',
-        # PHASE E.2 NEW: User-observed high-confidence patterns
-        'catat tanggal', 'jangan sampai kelewatan', 'jangan lewatkan',
-        'segera daftar', 'buruan daftar', 'daftar sekarang'
-    ]
-    
-    # Keywords that indicate EVENT dates, NOT registration (EXCLUDE)
-    event_keywords = [
-        'acara', 'pelaksanaan', 'start belajar', 'start acara', 'mulai acara',
-        'jadwal acara', 'tanggal acara', 'waktu pelaksanaan', 'hari pelaksanaan',
-        'pelaksanaan final', 'final lomba', 'hari h'
-    ]
+    # The accepted date window moves with today, so today is part of the cache key
+    return _extract_registration_date_cached(text, datetime.now().date())
+
+
+@lru_cache(maxsize=1024)
+def _extract_registration_date_cached(text: str, today: date) -> Optional[str]:
+    """Memoized worker for extract_registration_date_fallback (reposted captions repeat verbatim)"""
+    # No digit anywhere means no date pattern can match
+    if not _DIGIT_RE.search(text):
+        return None
     
     # Split text into lines for better context
     lines = text.split('\n')
     
-    today = datetime.now().date()
     # More flexible date range: allow dates from 1 year ago to 2 years future
     # This helps catch 2025 dates that might still be relevant
     min_date = today - timedelta(days=365)
     max_future = today + timedelta(days=730)
     
     for line in lines:
+        # Cheap digit scan before lowercasing and keyword checks
+        if not _DIGIT_RE.search(line):
+            continue
+        
         line_lower = line.lower()
         
         # EXCLUDE: Skip if line contains event execution keywords
-        if any(kw in line_lower for kw in event_keywords):
+        if _EVENT_KEYWORDS_RE.search(line_lower):
             continue
         
         # Check for date icons (📅, 📆, 🗓️) - these often indicate registration dates
         has_date_icon = any(icon in line for icon in ['📅', '📆', '🗓️'])
         
         # INCLUDE: Check if line contains registration keywords OR date icon
-        if not (any(kw in line_lower for kw in registration_keywords) or has_date_icon):
+        if not (has_date_icon or _REGISTRATION_KEYWORDS_RE.search(line_lower)):
             continue
         
         # PHASE E.2: HIGH PRIORITY - "DL" or "Deadline" patterns (most reliable)
         # These patterns have highest confidence based on user observation
-        dl_patterns = [
-            # "DL: 15 April 2026" or "Deadline: 15 April 2026"
-            r'(?:DL|Deadline)[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "DL 15/04/2026" or "Deadline 15/04/2026"
-            r'(?:DL|Deadline)[:\s]+(\d{1,2})/(\d{1,2})/(\d{4})',
-            # "DL: 15-20 April 2026" (range with DL)
-            r'(?:DL|Deadline)[:\s]+(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-        ]
-        
+        # Substring gate before any regex work: every DL pattern needs "dl"
+        # in the line ("deadline" contains it as well)
+        dl_patterns = _DL_PATTERNS if 'dl' in line_lower else ()
         for pattern in dl_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+            match = pattern.search(line)
             if match:
                 groups = match.groups()
                 
@@ -92,7 +535,7 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     # "DL: 15 April 2026" format
                     day, month, year = groups
                     date_str = f"{day} {month} {year}"
-                    parsed = dateparser.parse(date_str, languages=['id', 'en'])
+                    parsed = _parse_date(date_str)
                     
                     if parsed:
                         date_obj = parsed.date()
@@ -105,7 +548,7 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     day, month, year = groups
                     try:
                         date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        parsed = dateparser.parse(date_str, languages=['id', 'en'])
+                        parsed = _parse_date(date_str)
                         
                         if parsed:
                             date_obj = parsed.date()
@@ -122,8 +565,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     date1_str = f"{day1} {month} {year}"
                     date2_str = f"{day2} {month} {year}"
                     
-                    parsed1 = dateparser.parse(date1_str, languages=['id', 'en'])
-                    parsed2 = dateparser.parse(date2_str, languages=['id', 'en'])
+                    parsed1 = _parse_date(date1_str)
+                    parsed2 = _parse_date(date2_str)
                     
                     if parsed1 and parsed2:
                         date1 = parsed1.date()
@@ -135,34 +578,10 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
         
         # PHASE E.2: HIGH PRIORITY - "catat tanggal" or "jangan sampai kelewatan" with date range
         # These phrases strongly indicate registration dates
-        high_confidence_phrases = [
-            # "catat tanggal: 1-14 April 2026" or "catat tanggal 1-14 April 2026"
-            r'catat tanggal[:\s]+(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "jangan sampai kelewatan: 1-14 April 2026"
-            r'jangan (?:sampai )?kelewatan[:\s]+(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "catat tanggal: 1 April - 14 April 2026"
-            r'catat tanggal[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s*[-–]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "jangan sampai kelewatan: 1 April - 14 April 2026"
-            r'jangan (?:sampai )?kelewatan[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s*[-–]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # PHASE E.3 NEW: Additional high-confidence Indonesian patterns
-            # "sampai tanggal: 15 April 2026"
-            r'sampai tanggal[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "pendaftaran ditutup: 15 April 2026"
-            r'pendaftaran ditutup[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "batas terakhir: 15 April 2026"
-            r'batas terakhir[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "terakhir pendaftaran: 15 April 2026"
-            r'terakhir pendaftaran[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "deadline pendaftaran: 15 April 2026"
-            r'deadline pendaftaran[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "tutup pendaftaran: 15 April 2026"
-            r'tutup pendaftaran[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "batas waktu pendaftaran: 15 April 2026"
-            r'batas waktu pendaftaran[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-        ]
-        
-        for pattern in high_confidence_phrases:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for anchor, pattern in _HIGH_CONFIDENCE_PATTERNS:
+            if anchor not in line_lower:
+                continue
+            match = pattern.search(line)
             if match:
                 groups = match.groups()
                 
@@ -170,7 +589,7 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     # "sampai tanggal: 15 April 2026" format
                     day, month, year = groups
                     date_str = f"{day} {month} {year}"
-                    parsed = dateparser.parse(date_str, languages=['id', 'en'])
+                    parsed = _parse_date(date_str)
                     
                     if parsed:
                         date_obj = parsed.date()
@@ -184,8 +603,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     date1_str = f"{day1} {month} {year}"
                     date2_str = f"{day2} {month} {year}"
                     
-                    parsed1 = dateparser.parse(date1_str, languages=['id', 'en'])
-                    parsed2 = dateparser.parse(date2_str, languages=['id', 'en'])
+                    parsed1 = _parse_date(date1_str)
+                    parsed2 = _parse_date(date2_str)
                     
                     if parsed1 and parsed2:
                         date1 = parsed1.date()
@@ -201,8 +620,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     date1_str = f"{day1} {month1} {year}"
                     date2_str = f"{day2} {month2} {year}"
                     
-                    parsed1 = dateparser.parse(date1_str, languages=['id', 'en'])
-                    parsed2 = dateparser.parse(date2_str, languages=['id', 'en'])
+                    parsed1 = _parse_date(date1_str)
+                    parsed2 = _parse_date(date2_str)
                     
                     if parsed1 and parsed2:
                         date1 = parsed1.date()
@@ -214,27 +633,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                             return f"{day1} {month1_id} {year} - {day2} {month2_id} {year}"
         
         # Pattern 1: Date ranges with dash (e.g., "1–30 April 2026", "21-31 Maret 2026", "19 Oktober — 5 November 2025")
-        range_patterns = [
-            # PHASE C PART 3 STAGE 4: Batch/Gelombang patterns (must come first for priority)
-            # "Batch 1: April 1–14, 2026" or "Gelombang 1: 1-14 April 2026"
-            r'(?:Batch|Gelombang)\s*\d+[:\s]+(\d{1,2})\s*[–\-—]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "Batch 1: 1 April - 14 April 2026"
-            r'(?:Batch|Gelombang)\s*\d+[:\s]+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s*[–\-—]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            
-            # "1–30 April 2026" or "1-30 April 2026"
-            r'(\d{1,2})\s*[–\-—]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "April 1 - April 30, 2026"
-            r'(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})\s*[–\-—]\s*(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})',
-            # "27 April - 1 Mei 2026" or "19 Oktober — 5 November 2025"
-            r'(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s*[–\-—]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "1 Januari 2026 - 2 Februari 2026" (full date range)
-            r'(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})\s*[–\-—]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            # "11 Oktober - 16 November 2" (incomplete year - assume 2025/2026)
-            r'(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s*[–\-—]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})',
-        ]
-        
-        for pattern in range_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in _RANGE_PATTERNS:
+            match = pattern.search(line)
             if match:
                 groups = match.groups()
                 
@@ -244,8 +644,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     date1_str = f"{day1} {month} {year}"
                     date2_str = f"{day2} {month} {year}"
                     
-                    parsed1 = dateparser.parse(date1_str, languages=['id', 'en'])
-                    parsed2 = dateparser.parse(date2_str, languages=['id', 'en'])
+                    parsed1 = _parse_date(date1_str)
+                    parsed2 = _parse_date(date2_str)
                     
                     if parsed1 and parsed2:
                         date1 = parsed1.date()
@@ -261,8 +661,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     date1_str = f"{day1} {month1} {year}"
                     date2_str = f"{day2} {month2} {year}"
                     
-                    parsed1 = dateparser.parse(date1_str, languages=['id', 'en'])
-                    parsed2 = dateparser.parse(date2_str, languages=['id', 'en'])
+                    parsed1 = _parse_date(date1_str)
+                    parsed2 = _parse_date(date2_str)
                     
                     if parsed1 and parsed2:
                         date1 = parsed1.date()
@@ -278,8 +678,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     date1_str = f"{day1} {month1} {year}"
                     date2_str = f"{day2} {month2} {year}"
                     
-                    parsed1 = dateparser.parse(date1_str, languages=['id', 'en'])
-                    parsed2 = dateparser.parse(date2_str, languages=['id', 'en'])
+                    parsed1 = _parse_date(date1_str)
+                    parsed2 = _parse_date(date2_str)
                     
                     if parsed1 and parsed2:
                         date1 = parsed1.date()
@@ -295,8 +695,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     date1_str = f"{day1} {month1} {year1}"
                     date2_str = f"{day2} {month2} {year2}"
                     
-                    parsed1 = dateparser.parse(date1_str, languages=['id', 'en'])
-                    parsed2 = dateparser.parse(date2_str, languages=['id', 'en'])
+                    parsed1 = _parse_date(date1_str)
+                    parsed2 = _parse_date(date2_str)
                     
                     if parsed1 and parsed2:
                         date1 = parsed1.date()
@@ -310,14 +710,14 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                 elif len(groups) == 5 and len(groups[4]) <= 2:  # Pattern 5: "11 Oktober - 16 November 2" (incomplete year)
                     day1, month1, day2, month2, year_partial = groups
                     # Assume 2025 or 2026 based on current date
-                    current_year = datetime.now().year
+                    current_year = today.year
                     # Try both years
                     for year in [current_year, current_year + 1, current_year - 1]:
                         date1_str = f"{day1} {month1} {year}"
                         date2_str = f"{day2} {month2} {year}"
                         
-                        parsed1 = dateparser.parse(date1_str, languages=['id', 'en'])
-                        parsed2 = dateparser.parse(date2_str, languages=['id', 'en'])
+                        parsed1 = _parse_date(date1_str)
+                        parsed2 = _parse_date(date2_str)
                         
                         if parsed1 and parsed2:
                             date1 = parsed1.date()
@@ -329,13 +729,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                                 return f"{day1} {month1_id} {year} - {day2} {month2_id} {year}"
         
         # Pattern 2: Single dates (e.g., "30 April 2026", "April 30, 2026", "DL: 4 APRIL 2026")
-        single_patterns = [
-            r'(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            r'(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})',
-        ]
-        
-        for pattern in single_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in _SINGLE_PATTERNS:
+            match = pattern.search(line)
             if match:
                 groups = match.groups()
                 
@@ -346,7 +741,7 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                         month, day, year = groups
                     
                     date_str = f"{day} {month} {year}"
-                    parsed = dateparser.parse(date_str, languages=['id', 'en'])
+                    parsed = _parse_date(date_str)
                     
                     if parsed:
                         date_obj = parsed.date()
@@ -356,17 +751,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                             return f"{day} {month_id} {year}"
         
         # PHASE C NEW: Pattern 3 - Numeric date formats
-        numeric_patterns = [
-            # "01/04/2026" or "1/4/2026" (DD/MM/YYYY - Indonesian format)
-            (r'(\d{1,2})/(\d{1,2})/(\d{4})', 'dmy'),
-            # "2026-04-01" (YYYY-MM-DD - ISO format)
-            (r'(\d{4})-(\d{1,2})-(\d{1,2})', 'ymd'),
-            # "01.04.2026" or "1.4.2026" (DD.MM.YYYY)
-            (r'(\d{1,2})\.(\d{1,2})\.(\d{4})', 'dmy'),
-        ]
-        
-        for pattern, format_type in numeric_patterns:
-            match = re.search(pattern, line)
+        for pattern, format_type in _NUMERIC_PATTERNS:
+            match = pattern.search(line)
             if match:
                 groups = match.groups()
                 
@@ -378,7 +764,7 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                         year, month, day = groups
                         date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
                     
-                    parsed = dateparser.parse(date_str, languages=['id', 'en'])
+                    parsed = _parse_date(date_str)
                     
                     if parsed:
                         date_obj = parsed.date()
@@ -393,30 +779,24 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
         
         # PHASE C NEW: Pattern 4 - Abbreviated formats without year
         # These need special handling to infer the year
-        abbreviated_patterns = [
-            # "tgl 1-5 April" or "tanggal 1-5 April"
-            (r'(?:tgl|tanggal)\s*(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)', 'range'),
-            # "s.d. 5 April" or "s/d 5 April" (sampai dengan)
-            (r's[./]d[.]?\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)', 'single'),
-            # "hingga 5 April"
-            (r'hingga\s+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)', 'single'),
-        ]
-        
-        for pattern, pattern_type in abbreviated_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for pattern, pattern_type, anchors in _ABBREVIATED_PATTERNS:
+            if not any(anchor in line_lower for anchor in anchors):
+                continue
+            match = pattern.search(line)
             if match:
                 groups = match.groups()
                 
-                # Infer year based on current date
-                current_year = datetime.now().year
-                current_month = datetime.now().month
+                # Infer year based on current date (the same `today` as the
+                # min/max window, instead of re-reading the clock per match)
+                current_year = today.year
+                current_month = today.month
                 
                 if pattern_type == 'range' and len(groups) == 3:  # "tgl 1-5 April" (range)
                     day1, day2, month = groups
                     
                     # Parse month to number
                     month_str = f"1 {month} {current_year}"
-                    parsed_month = dateparser.parse(month_str, languages=['id', 'en'])
+                    parsed_month = _parse_date(month_str)
                     
                     if parsed_month:
                         target_month = parsed_month.month
@@ -430,8 +810,8 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                         date1_str = f"{day1} {month} {year}"
                         date2_str = f"{day2} {month} {year}"
                         
-                        parsed1 = dateparser.parse(date1_str, languages=['id', 'en'])
-                        parsed2 = dateparser.parse(date2_str, languages=['id', 'en'])
+                        parsed1 = _parse_date(date1_str)
+                        parsed2 = _parse_date(date2_str)
                         
                         if parsed1 and parsed2:
                             date1 = parsed1.date()
@@ -446,7 +826,7 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                     
                     # Parse month to number
                     month_str = f"1 {month} {current_year}"
-                    parsed_month = dateparser.parse(month_str, languages=['id', 'en'])
+                    parsed_month = _parse_date(month_str)
                     
                     if parsed_month:
                         target_month = parsed_month.month
@@ -458,7 +838,7 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
                             year = current_year
                         
                         date_str = f"{day} {month} {year}"
-                        parsed = dateparser.parse(date_str, languages=['id', 'en'])
+                        parsed = _parse_date(date_str)
                         
                         if parsed:
                             date_obj = parsed.date()
@@ -469,9 +849,14 @@ def extract_registration_date_fallback(text: str) -> Optional[str]:
     
     return None
 
+@lru_cache(maxsize=1024)
 def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[str]:
     """
     Extract organizer from multiple sources with validation
+    
+    Memoized: reposted captions and shared OCR footers repeat verbatim, and
+    the result depends only on the text and source account.
+    
     Priority order:
     1. Instagram account tags (@mentions) - most reliable
     2. "by/oleh/dari" patterns
@@ -485,14 +870,8 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
     Returns:
         Organizer name or None
     """
-    # Blacklist: Generic phrases and source accounts that should NOT be organizers
-    blacklist = [
-        'para expert', 'sekolah yang sama', 'kreativitas', 'adu logika', 
-        'inovasi masa depan', 'kesempatan', 'teman-teman', 'sobat',
-        'kreativitas hingga kompetisi', 'pentas raya', 'adu logika dan kecepatan',
-        'infolomba', 'lomba.it', source_account.lower(),
-        'karena itu', 'oleh karena itu', 'karena', 'itu'  # Caption fragments
-    ]
+    # Blacklist: generic phrases (_ORGANIZER_BLACKLIST_RE) plus the source account
+    source_lower = source_account.lower()
     
     def is_valid_organizer(org: str, title: str = '') -> bool:
         """Validate if extracted text is a real organizer"""
@@ -502,7 +881,7 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
         org_lower = org.lower()
         
         # Check blacklist
-        if any(phrase in org_lower for phrase in blacklist):
+        if _ORGANIZER_BLACKLIST_RE.search(org_lower) or source_lower in org_lower:
             return False
         
         # Too long (likely full organizational name)
@@ -510,8 +889,7 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
             return False
         
         # Generic words
-        generic_words = ['para', 'sekolah', 'teman', 'sobat', 'kesempatan', 'kreativitas']
-        if any(word == org_lower for word in generic_words):
+        if org_lower in _GENERIC_ORGANIZER_WORDS:
             return False
         
         # Same as title (likely wrong)
@@ -522,34 +900,33 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
     
     def clean_organizer_name(org: str) -> str:
         """Clean and simplify organizer name"""
-        # Remove excessive whitespace
-        org = " ".join(org.split())
+        # Remove excessive whitespace (one tokenization, reused by the rules below)
+        parts = org.split()
+        org = " ".join(parts)
+        org_lower = org.lower()
         
         # Simplification rules for universities/institutions
-        if 'universitas' in org.lower() or 'institut' in org.lower():
+        if 'universitas' in org_lower or 'institut' in org_lower:
             # "BEM Fakultas X Universitas Y" → "Universitas Y"
             # "Himpunan Mahasiswa X Universitas Y" → "Universitas Y"
-            parts = org.split()
             for i, part in enumerate(parts):
-                if part.lower() in ['universitas', 'institut', 'politeknik']:
+                if part.lower() in ('universitas', 'institut', 'politeknik'):
                     # Take from this word onwards
                     return ' '.join(parts[i:])
         
-        if 'himpunan mahasiswa' in org.lower():
+        if 'himpunan mahasiswa' in org_lower:
             # "Himpunan Mahasiswa Informatika ITERA" → "ITERA"
             # Look for acronym at the end
-            parts = org.split()
             if len(parts) > 2:
                 last_word = parts[-1]
                 # If last word is all caps and short, it's likely an acronym
                 if last_word.isupper() and len(last_word) <= 10:
                     return last_word
         
-        if 'departemen' in org.lower():
+        if 'departemen' in org_lower:
             # "Departemen X Institut Y" → "Institut Y"
-            parts = org.split()
             for i, part in enumerate(parts):
-                if part.lower() in ['institut', 'universitas', 'politeknik']:
+                if part.lower() in ('institut', 'universitas', 'politeknik'):
                     return ' '.join(parts[i:])
         
         # Limit length
@@ -568,14 +945,15 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
         """
         # Remove @ symbol
         tag = tag.lstrip('@').strip()
+        tag_lower = tag.lower()
         
         # Skip if it's the source account
-        if tag.lower() == source_account.lower():
+        if tag_lower == source_lower:
             return None
         
         # Skip common non-organizer accounts
         skip_accounts = ['infolomba', 'lomba.it', 'lomba_id', 'info_lomba']
-        if tag.lower() in skip_accounts:
+        if tag_lower in skip_accounts:
             return None
         
         # Special known mappings
@@ -586,7 +964,6 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
             'almuhajirin3purwakarta': 'Pondok Pesantren Al-Muhajirin 3 Purwakarta',
         }
         
-        tag_lower = tag.lower()
         if tag_lower in known_mappings:
             return known_mappings[tag_lower]
         
@@ -622,7 +999,7 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
             tag_normalized = tag.replace('_', ' ')
             
             # Insert space before numbers if not present
-            tag_normalized = re.sub(r'([a-z])(\d)', r'\1 \2', tag_normalized)
+            tag_normalized = _LETTER_DIGIT_RE.sub(r'\1 \2', tag_normalized)
             
             parts = tag_normalized.split()
             result_parts = []
@@ -643,7 +1020,7 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
             return result
         
         # Pattern 3: University/Institution tags
-        if any(kw in tag_lower for kw in ['univ', 'institut', 'poltek', 'its', 'itb', 'ugm', 'ui']):
+        if _UNIVERSITY_TAG_RE.search(tag_lower):
             # Convert underscores to spaces and capitalize
             return tag.replace('_', ' ').title()
         
@@ -656,16 +1033,16 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
     
     # PRIORITY 1: Instagram account tags (@mentions) - MOST RELIABLE
     # Look for @mentions that are likely organizers
-    mention_pattern = r'@([a-zA-Z0-9._]+)'
-    mentions = re.findall(mention_pattern, text)
+    mentions = _MENTION_RE.findall(text)
     
     if mentions:
         # Filter out source account and common non-organizer accounts
+        # (kept as (mention, lowercased) pairs so each is lowercased once)
         filtered_mentions = []
         for mention in mentions:
             mention_lower = mention.lower()
             # Skip source account
-            if mention_lower == source_account.lower():
+            if mention_lower == source_lower:
                 continue
             # Skip common info accounts
             if mention_lower in ['infolomba', 'lomba.it', 'lomba_id', 'info_lomba']:
@@ -674,69 +1051,43 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
             if mention.count('.') > 1 or (any(c.isdigit() for c in mention) and len(mention) < 8):
                 continue
             
-            filtered_mentions.append(mention)
+            filtered_mentions.append((mention, mention_lower))
         
         # If we have mentions, try to extract organizer from the first one
         if filtered_mentions:
             # Prefer mentions that look like institutions
-            institution_keywords = ['smp', 'sma', 'smk', 'sd', 'univ', 'institut', 'poltek', 
-                                   'pesantren', 'ponpes', 'muhajirin', 'its', 'itb', 'ugm']
-            
             # First, try to find institution mentions
-            for mention in filtered_mentions:
-                mention_lower = mention.lower()
-                if any(kw in mention_lower for kw in institution_keywords):
+            for mention, mention_lower in filtered_mentions:
+                if _INSTITUTION_MENTION_RE.search(mention_lower):
                     organizer = extract_from_instagram_tag(mention)
                     if organizer and is_valid_organizer(organizer):
                         return clean_organizer_name(organizer)
             
             # If no institution found, use first filtered mention
-            organizer = extract_from_instagram_tag(filtered_mentions[0])
+            organizer = extract_from_instagram_tag(filtered_mentions[0][0])
             if organizer and is_valid_organizer(organizer):
                 return clean_organizer_name(organizer)
     
     # PRIORITY 2: "by/oleh/dari" patterns
     # Improved to avoid matching "Oleh karena itu" and similar phrases
-    by_patterns = [
-        # "by [Name]" or "oleh [Name]" - must be followed by capital letter (proper noun)
-        r'(?:^|\n|\s)(?:by|dari)\s+([A-Z][A-Za-z\s&]+?)(?:\n|$|[.!,])',
-        # "oleh [Name]" - but NOT "oleh karena"
-        r'(?:^|\n|\s)oleh\s+(?!karena)([A-Z][A-Za-z\s&]+?)(?:\n|$|[.!,])',
-        # "presented by" or "dipersembahkan oleh"
-        r'(?:presented by|dipersembahkan oleh)\s+([A-Z][A-Za-z\s&]+?)(?:\n|$|[.!,])',
-    ]
-    
-    for pattern in by_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _BY_PATTERNS:
+        match = pattern.search(text)
         if match:
             organizer = match.group(1).strip()
             if is_valid_organizer(organizer):
                 return clean_organizer_name(organizer)
     
     # PRIORITY 3: Hashtags with organization names
-    hashtag_patterns = [
-        r'#([a-zA-Z][a-zA-Z0-9]*(?:[A-Z][a-z]+)+)',  # CamelCase: #PareKampungInggris
-        r'#([a-z]+(?:kampung|pare|inggris|english|academy|institute|university|college)[a-z]*)',  # Lowercase with keywords
-    ]
-    
-    # Filter out common non-organizer hashtags
-    exclude_keywords = [
-        'lomba', 'kompetisi', 'beasiswa', 'gratis', 'free', 'indonesia',
-        'jakarta', 'surabaya', 'bandung', 'online', 'offline', 'gapyear',
-        'bahasainggris', 'freecourse', 'training', 'kursus', 'infolomba'
-    ]
-    
-    for pattern in hashtag_patterns:
-        hashtags = re.findall(pattern, text, re.IGNORECASE)
-        for hashtag in hashtags:
+    # Filter out common non-organizer hashtags (_EXCLUDED_HASHTAGS)
+    # finditer rather than findall: the first usable hashtag returns, so the
+    # rest of the caption need not be matched into a list
+    for pattern in _HASHTAG_PATTERNS:
+        for match in pattern.finditer(text):
+            hashtag = match.group(1)
             hashtag_lower = hashtag.lower()
             
             # Skip if it's in exclude list
-            if hashtag_lower in exclude_keywords:
-                continue
-            
-            # Check if it contains exclude keywords
-            if any(kw == hashtag_lower for kw in exclude_keywords):
+            if hashtag_lower in _EXCLUDED_HASHTAGS:
                 continue
             
             # Special handling for known organizers
@@ -745,19 +1096,15 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
             
             # Convert CamelCase to Title Case with spaces
             # e.g., "PareKampungInggris" -> "Pare Kampung Inggris"
-            spaced = re.sub(r'([a-z])([A-Z])', r'\1 \2', hashtag)
+            spaced = _CAMEL_CASE_RE.sub(r'\1 \2', hashtag)
             if is_valid_organizer(spaced):
                 return clean_organizer_name(spaced.title())
     
     # PRIORITY 4: Organization names in specific contexts
     # e.g., "MPK & OSIS SMA Negeri 63 Jakarta"
-    org_patterns = [
-        r'((?:MPK|OSIS|BEM|HIMA|UKM)\s+[A-Z][A-Za-z\s&0-9]+?)(?:\s+(?:presents|mengadakan|membuka))',
-        r'((?:Universitas|Institut|Sekolah|SMA|SMK|Pondok Pesantren)\s+[A-Z][A-Za-z\s0-9\-]+?)(?:\s+(?:presents|mengadakan|membuka))',
-    ]
-    
+    org_patterns = _ORG_PATTERNS if _ORG_CONTEXT_VERB_RE.search(text) else ()
     for pattern in org_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = pattern.search(text)
         if match:
             organizer = match.group(1).strip()
             if is_valid_organizer(organizer):
@@ -767,23 +1114,7 @@ def extract_organizer_fallback(text: str, source_account: str = '') -> Optional[
 
 def convert_month_to_indonesian(month: str) -> str:
     """Convert month name to Indonesian"""
-    month_mapping = {
-        'january': 'Januari', 'jan': 'Januari',
-        'february': 'Februari', 'feb': 'Februari',
-        'march': 'Maret', 'mar': 'Maret',
-        'april': 'April', 'apr': 'April',
-        'may': 'Mei',
-        'june': 'Juni', 'jun': 'Juni',
-        'july': 'Juli', 'jul': 'Juli',
-        'august': 'Agustus', 'aug': 'Agustus', 'agu': 'Agustus',
-        'september': 'September', 'sep': 'September',
-        'october': 'Oktober', 'oct': 'Oktober', 'okt': 'Oktober',
-        'november': 'November', 'nov': 'November',
-        'december': 'Desember', 'dec': 'Desember', 'des': 'Desember',
-    }
-    
-    month_lower = month.lower()
-    return month_mapping.get(month_lower, month.title())
+    return _MONTH_TO_INDONESIAN.get(month.lower(), month.title())
 
 def extract_dates(text: str) -> List[str]:
     """
@@ -796,6 +1127,10 @@ def extract_dates(text: str) -> List[str]:
     Returns:
         List of ISO format date strings (YYYY-MM-DD)
     """
+    # No digit anywhere means no date pattern can match
+    if not _DIGIT_RE.search(text):
+        return []
+    
     dates = []
     today = datetime.now().date()
     # Allow dates from 30 days ago (to catch recent past dates) to 2 years future
@@ -803,17 +1138,8 @@ def extract_dates(text: str) -> List[str]:
     max_future = today + timedelta(days=730)
     
     # Pattern 1: Date ranges (e.g., "21-31 Maret 2026", "April 27 - May 1, 2026")
-    range_patterns = [
-        # Indonesian: "21-31 Maret 2026" or "21 - 31 Maret 2026"
-        r'(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)\s+(\d{4})',
-        # English: "April 27 - May 1, 2026"
-        r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})\s*[-–,]*\s*(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})',
-        # Mixed: "27 April - 1 Mei 2026"
-        r'(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s*[-–]\s*(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-    ]
-    
-    for pattern in range_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _DATE_RANGE_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             if len(match) == 4:  # Pattern 1: "21-31 Maret 2026"
                 day1, day2, month, year = match
@@ -821,7 +1147,7 @@ def extract_dates(text: str) -> List[str]:
                 date1_str = f"{day1} {month} {year}"
                 date2_str = f"{day2} {month} {year}"
                 for date_str in [date1_str, date2_str]:
-                    parsed = dateparser.parse(date_str, languages=['id', 'en'])
+                    parsed = _parse_date(date_str)
                     if parsed:
                         date_obj = parsed.date()
                         if min_date <= date_obj <= max_future:
@@ -832,7 +1158,7 @@ def extract_dates(text: str) -> List[str]:
                 date1_str = f"{month1} {day1}, {year}"
                 date2_str = f"{month2} {day2}, {year}"
                 for date_str in [date1_str, date2_str]:
-                    parsed = dateparser.parse(date_str, languages=['id', 'en'])
+                    parsed = _parse_date(date_str)
                     if parsed:
                         date_obj = parsed.date()
                         if min_date <= date_obj <= max_future:
@@ -843,41 +1169,33 @@ def extract_dates(text: str) -> List[str]:
                 date1_str = f"{day1} {month1} {year}"
                 date2_str = f"{day2} {month2} {year}"
                 for date_str in [date1_str, date2_str]:
-                    parsed = dateparser.parse(date_str, languages=['id', 'en'])
+                    parsed = _parse_date(date_str)
                     if parsed:
                         date_obj = parsed.date()
                         if min_date <= date_obj <= max_future:
                             dates.append(date_obj.isoformat())
     
     # Pattern 2: Single dates
-    single_date_patterns = [
-        # Full month names (Indonesian)
-        r'\d{1,2}\s+(?:Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)\s+\d{4}',
-        # Abbreviated month names (Indonesian)
-        r'\d{1,2}\s+(?:Jan|Feb|Mar|Apr|Mei|Jun|Jul|Agu|Sep|Okt|Nov|Des)\s+\d{4}',
-        # English month names
-        r'\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}',
-        r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}',
-        # Numeric formats
-        r'\d{1,2}[/]\d{1,2}[/]\d{2,4}',
-        r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',
-    ]
-    
-    for pattern in single_date_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    # Range matches, scanned once for the whole text rather than once per single
+    # date (each repr is wrapped in parentheses, so no date string can match
+    # across the joins)
+    range_matches = '\n'.join(str(m) for m in _DATE_RANGE_ANY_RE.findall(text))
+    
+    for pattern in _SINGLE_DATE_PATTERNS:
+        matches = pattern.findall(text)
         for date_str in matches:
             # Skip if this date is part of a range we already processed
-            if any(date_str in match_str for match_str in [str(m) for m in re.findall(r'|'.join(range_patterns), text, re.IGNORECASE)]):
+            if date_str in range_matches:
                 continue
             
-            parsed = dateparser.parse(date_str, languages=['id', 'en'])
+            parsed = _parse_date(date_str)
             if parsed:
                 date_obj = parsed.date()
                 if min_date <= date_obj <= max_future:
                     dates.append(date_obj.isoformat())
     
-    # Remove duplicates and sort
-    return sorted(list(set(dates)))
+    # Remove duplicates and sort (sorted() already returns a new list)
+    return sorted(set(dates))
 
 def extract_fee_amount(text: str) -> Optional[float]:
     """
@@ -889,44 +1207,29 @@ def extract_fee_amount(text: str) -> Optional[float]:
     Returns:
         Fee amount as float or None
     """
+    # One lowercased copy shared by the free check and every fee pattern
+    text_lower = text.lower()
+    
     # Check for free indicators first
-    free_keywords = ['gratis', 'free', 'tanpa biaya', 'tidak dipungut biaya']
-    for keyword in free_keywords:
-        if keyword in text.lower():
-            return None
+    if _FREE_FEE_RE.search(text_lower):
+        return None
     
-    # Patterns for Indonesian currency
-    patterns = [
-        # Rp 350.000 or Rp 350,000 or Rp350000
-        (r'Rp\s*(\d+(?:\.\d{3})*(?:,\d+)?)', 1),
-        # 350.000 rupiah or 350,000 rupiah
-        (r'(\d+(?:\.\d{3})*(?:,\d+)?)\s*[Rr]upiah', 1),
-        # 10K, 25K (thousands notation)
-        (r'(\d+)\s*[Kk](?:\s|$|[^a-zA-Z])', 1000),
-        # biaya ... 350.000
-        (r'biaya.*?(\d+(?:\.\d{3})*)', 1),
-        # HTM ... 350.000
-        (r'HTM.*?(\d+(?:\.\d{3})*)', 1),
-    ]
-    
-    for pattern, multiplier in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            amount_str = matches[0]
-            try:
-                # Remove dots (thousand separators) and replace comma with dot
-                amount_str = amount_str.replace('.', '').replace(',', '.')
-                amount = float(amount_str)
-                
-                # Apply multiplier (for K notation)
-                if isinstance(multiplier, int) and multiplier > 1:
-                    amount *= multiplier
-                
-                # Sanity check: fee should be between 0 and 100 million IDR
-                if 0 < amount <= 100_000_000:
-                    return amount
-            except (ValueError, AttributeError):
-                continue
+    for pattern, multiplier in _FEE_PATTERNS:
+        # Only the first match is used, so stop scanning once one is found
+        match = pattern.search(text_lower)
+        if match:
+            # Remove dots (thousand separators) and replace comma with dot.
+            # Every pattern captures digits with optional separators, so the
+            # result always parses - no try/except needed
+            amount = float(match.group(1).translate(_FEE_NUMBER_TRANS))
+            
+            # Apply multiplier (for K notation)
+            if multiplier > 1:
+                amount *= multiplier
+            
+            # Sanity check: fee should be between 0 and 100 million IDR
+            if 0 < amount <= 100_000_000:
+                return amount
     
     return None
 
@@ -936,59 +1239,23 @@ def extract_urls(text: str) -> List[str]:
     
     PHASE C PART 2: Enhanced with WhatsApp links and more short link services
     """
-    url_patterns = [
-        r'https?://[^\s]+',  # Full URLs with http/https
-        r'bit\.ly/[^\s]+',   # bit.ly short links
-        r'linktr\.ee/[^\s]+', # Linktree
-        r'forms\.gle/[^\s]+', # Google Forms
-        r's\.id/[^\s]+',      # s.id short links
-        
-        # PHASE C NEW: WhatsApp links
-        r'wa\.me/[^\s]+',     # wa.me/628123456789
-        r'api\.whatsapp\.com/send\?phone=[^\s]+',  # WhatsApp API links
-        r'chat\.whatsapp\.com/[^\s]+',  # WhatsApp group links
-        
-        # PHASE C NEW: More short link services
-        r'tinyurl\.com/[^\s]+',  # TinyURL
-        r'ow\.ly/[^\s]+',        # Ow.ly (Hootsuite)
-        r'rebrand\.ly/[^\s]+',   # Rebrandly
-        r'cutt\.ly/[^\s]+',      # Cutt.ly
-        r'short\.link/[^\s]+',   # Short.link
-        r'tiny\.cc/[^\s]+',      # Tiny.cc
-        
-        # PHASE C NEW: Indonesian short links
-        r'lynk\.id/[^\s]+',      # Lynk.id
-        r'shorten\.asia/[^\s]+', # Shorten.asia
-        
-        # PHASE C PART 3 STAGE 4: Additional short domains
-        r'uns\.id/[^\s]+',       # UNS (Universitas Sebelas Maret) short links
-        r'fyde\.my/[^\s]+',      # Fyde short links
-        r'[a-z]+\.poli[a-z]*\.[a-z]+/[^\s]+',  # Politeknik links (e.g., jti.polinema.ac.id)
-        
-        r'[a-zA-Z0-9-]+\.[a-zA-Z]{2,}/[^\s]*',  # Domain with path (e.g., sahut.co/event)
-    ]
-    
-    urls = []
-    for pattern in url_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
+    # Single pass: clean and de-duplicate (case-insensitively, keeping the
+    # first spelling) as matches stream in, with no intermediate lists
+    seen = set()
+    unique_urls = []
+    for pattern in _URL_PATTERNS:
+        for match in pattern.finditer(text):
             # Clean up URL (remove trailing punctuation)
-            url = match.rstrip('.,;:!?)')
+            url = match.group().rstrip('.,;:!?)')
             
             # Add https:// prefix if missing
             if not url.startswith('http'):
                 url = 'https://' + url
             
-            urls.append(url)
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_urls = []
-    for url in urls:
-        url_lower = url.lower()
-        if url_lower not in seen:
-            seen.add(url_lower)
-            unique_urls.append(url)
+            url_lower = url.lower()
+            if url_lower not in seen:
+                seen.add(url_lower)
+                unique_urls.append(url)
     
     return unique_urls
 
@@ -998,29 +1265,9 @@ def extract_phone_numbers(text: str) -> List[str]:
     
     PHASE C PART 2: Enhanced with WhatsApp links and more formats
     """
-    phone_patterns = [
-        # Standard format with country code
-        r'(?:\+62|0)[\s-]?\d{2,4}[\s-]?\d{3,4}[\s-]?\d{3,4}',
-        
-        # PHASE C NEW: WhatsApp format (wa.me/628123456789)
-        r'wa\.me/(\d{10,13})',
-        
-        # PHASE C NEW: Without separators (08123456789)
-        r'\b0\d{9,11}\b',
-        
-        # PHASE C NEW: With parentheses (0812) 3456-7890
-        r'0\(\d{3}\)[\s-]?\d{4}[\s-]?\d{4}',
-        
-        # PHASE C NEW: With dots (0812.3456.7890)
-        r'0\d{3}\.\d{4}\.\d{4}',
-        
-        # PHASE C NEW: International format with plus
-        r'\+62[\s-]?\d{2,4}[\s-]?\d{3,4}[\s-]?\d{3,4}',
-    ]
-    
     phones = []
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
+    for pattern in _PHONE_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             # Handle tuple results (from capturing groups)
             if isinstance(match, tuple):
@@ -1029,7 +1276,7 @@ def extract_phone_numbers(text: str) -> List[str]:
                 phone = match
             
             # Clean: remove all separators
-            phone = re.sub(r'[\s\-\.\(\)]', '', str(phone))
+            phone = _PHONE_SEPARATORS_RE.sub('', str(phone))
             
             # Remove wa.me/ prefix if present
             phone = phone.replace('wa.me/', '')
@@ -1047,15 +1294,8 @@ def extract_phone_numbers(text: str) -> List[str]:
             if 10 <= len(phone) <= 13:
                 phones.append(phone)
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_phones = []
-    for phone in phones:
-        if phone not in seen:
-            seen.add(phone)
-            unique_phones.append(phone)
-    
-    return unique_phones
+    # Remove duplicates while preserving order (dict keys keep first-seen order)
+    return list(dict.fromkeys(phones))
 
 def extract_contacts(text: str) -> List[dict]:
     """
@@ -1069,19 +1309,8 @@ def extract_contacts(text: str) -> List[dict]:
     """
     contacts = []
     
-    # Patterns for name-phone pairs
-    # Pattern 1: CP/Contact/Narahubung: Name - phone or Name (phone) or Name: phone
-    patterns = [
-        # CP: Name - phone or CP: Name (phone)
-        r'(?:CP|Contact|Kontak|Narahubung|Info)[\s:]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)[:\s\-\(]*(\+?62|0)[\s-]?(\d{2,4})[\s-]?(\d{3,4})[\s-]?(\d{3,4})',
-        # Name: phone (with capital letter start)
-        r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)[:\s]*(\+?62|0)[\s-]?(\d{2,4})[\s-]?(\d{3,4})[\s-]?(\d{3,4})',
-        # - Name: phone (in lists)
-        r'[\-\•]\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)[:\s]*(\+?62|0)[\s-]?(\d{2,4})[\s-]?(\d{3,4})[\s-]?(\d{3,4})',
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
+    for pattern in _CONTACT_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             if len(match) >= 5:
                 name = match[0].strip()
@@ -1093,7 +1322,7 @@ def extract_contacts(text: str) -> List[dict]:
                 full_phone = phone_prefix + phone_number
                 
                 # Normalize phone (remove spaces, dashes)
-                full_phone = re.sub(r'[\s-]', '', full_phone)
+                full_phone = _CONTACT_SEPARATORS_RE.sub('', full_phone)
                 
                 # Convert to international format
                 if full_phone.startswith('0'):
@@ -1107,8 +1336,7 @@ def extract_contacts(text: str) -> List[dict]:
                 if name_idx > 0:
                     before_text = text[max(0, name_idx-50):name_idx].strip()
                     # Look for role keywords
-                    role_keywords = ['CP', 'Contact', 'Kontak', 'Narahubung', 'Info']
-                    for keyword in role_keywords:
+                    for keyword in _CONTACT_ROLE_KEYWORDS:
                         if keyword in before_text:
                             role = keyword
                             break
@@ -1157,25 +1385,31 @@ def categorize_dates(text: str, dates: List[str]) -> dict:
     # Track which dates have been assigned
     assigned_dates = set()
     
+    # Month and day parts of each date, split once rather than once per line
+    # ('2026-04-01' -> ['04', '01'])
+    date_parts = [(date_str, date_str.split('-')[1:]) for date_str in dates]
+    
     for line in lines:
-        line_lower = line.lower()
+        # Every date placed: the remaining lines can't assign anything
+        if len(assigned_dates) == len(date_parts):
+            break
         
         # Find dates mentioned in this line
         line_dates = []
-        for date in dates:
-            if date in assigned_dates:
+        for date_str, parts in date_parts:
+            if date_str in assigned_dates:
                 continue
-            # Check if date appears in line (in various formats)
-            date_parts = date.split('-')  # ['2026', '04', '01']
             # Check for patterns like "1 April", "01 April", "April 1"
-            if any(part in line for part in date_parts[1:]):  # Check month and day
-                line_dates.append(date)
+            if any(part in line for part in parts):  # Check month and day
+                line_dates.append(date_str)
         
         if not line_dates:
             continue
         
-        # Categorize based on keywords
-        if any(kw in line_lower for kw in ['pendaftaran', 'registrasi', 'daftar', 'registration']):
+        # Categorize based on keywords (single pass over the line; only lines
+        # that mention a date get lowercased and scanned)
+        contexts = {m.lastgroup for m in _DATE_CONTEXT_RE.finditer(line.lower())}
+        if 'registration' in contexts:
             if len(line_dates) == 1:
                 if not categorized['registration_end']:
                     categorized['registration_end'] = line_dates[0]
@@ -1188,7 +1422,7 @@ def categorize_dates(text: str, dates: List[str]) -> dict:
                     categorized['registration_end'] = line_dates[1]
                     assigned_dates.add(line_dates[1])
         
-        elif any(kw in line_lower for kw in ['pelaksanaan', 'event', 'acara', 'lomba', 'competition']):
+        elif 'event' in contexts:
             if len(line_dates) == 1:
                 if not categorized['event_start']:
                     categorized['event_start'] = line_dates[0]
@@ -1201,22 +1435,23 @@ def categorize_dates(text: str, dates: List[str]) -> dict:
                     categorized['event_end'] = line_dates[1]
                     assigned_dates.add(line_dates[1])
         
-        elif any(kw in line_lower for kw in ['deadline', 'batas', 'tutup', 'terakhir']):
+        elif 'deadline' in contexts:
             if line_dates and not categorized['registration_end']:
                 categorized['registration_end'] = line_dates[0]
                 assigned_dates.add(line_dates[0])
         
-        elif any(kw in line_lower for kw in ['pengumuman', 'announcement', 'pemenang']):
+        elif 'announcement' in contexts:
             if line_dates and not categorized['announcement_date']:
                 categorized['announcement_date'] = line_dates[0]
                 assigned_dates.add(line_dates[0])
     
-    # If we have unassigned dates and missing categories, make educated guesses
-    unassigned = [d for d in dates if d not in assigned_dates]
-    if unassigned:
-        # If we have dates but no registration_end, use the earliest unassigned
-        if not categorized['registration_end'] and unassigned:
-            categorized['registration_end'] = sorted(unassigned)[0]
+    # If we have unassigned dates and missing categories, make educated guesses:
+    # no registration_end -> use the earliest unassigned date (one running-min
+    # pass, and only when the slot is actually empty)
+    if not categorized['registration_end']:
+        earliest = min((d for d in dates if d not in assigned_dates), default=None)
+        if earliest is not None:
+            categorized['registration_end'] = earliest
     
     return categorized
 
@@ -1226,7 +1461,7 @@ def get_timestamp() -> str:
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename"""
-    return re.sub(r'[^a-z0-9_-]', '_', filename.lower())
+    return _UNSAFE_FILENAME_RE.sub('_', filename.lower())
 
 
 # ============================================================================
@@ -1234,6 +1469,7 @@ def sanitize_filename(filename: str) -> str:
 # Added: 2026-05-01
 # ============================================================================
 
+@lru_cache(maxsize=4096)
 def extract_deadline_from_registration(registration_date: str) -> Optional[str]:
     """
     Extract deadline date from registration date string
@@ -1260,41 +1496,42 @@ def extract_deadline_from_registration(registration_date: str) -> Optional[str]:
     if not registration_date:
         return None
     
-    # Pattern 1: Date range "1 April 2026 - 14 April 2026" or "1-14 April 2026"
-    # Match: DD Month YYYY - DD Month YYYY
-    range_pattern_full = r'(\d{1,2}\s+\w+\s+\d{4})\s*[-–]\s*(\d{1,2}\s+\w+\s+\d{4})'
-    match = re.search(range_pattern_full, registration_date)
-    if match:
-        return match.group(2).strip()  # Return end date
+    # Patterns 1, 2 and 5 all need a digit; without one only the "Hingga" /
+    # "s.d." prefixes can match, so skip the other scans entirely
+    has_digit = _DIGIT_RE.search(registration_date) is not None
     
-    # Pattern 2: Date range "1-14 April 2026" (same month)
-    # Match: DD-DD Month YYYY
-    range_pattern_same_month = r'(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(\w+)\s+(\d{4})'
-    match = re.search(range_pattern_same_month, registration_date)
-    if match:
-        day2, month, year = match.group(2), match.group(3), match.group(4)
-        return f"{day2} {month} {year}"
+    if has_digit:
+        # Pattern 1: Date range "1 April 2026 - 14 April 2026" or "1-14 April 2026"
+        # Match: DD Month YYYY - DD Month YYYY
+        match = _REG_RANGE_FULL_RE.search(registration_date)
+        if match:
+            return match.group(2).strip()  # Return end date
+        
+        # Pattern 2: Date range "1-14 April 2026" (same month)
+        # Match: DD-DD Month YYYY
+        match = _REG_RANGE_SAME_MONTH_RE.search(registration_date)
+        if match:
+            day2, month, year = match.group(2), match.group(3), match.group(4)
+            return f"{day2} {month} {year}"
     
     # Pattern 3: "Hingga X" format
     # Match: Hingga DD Month YYYY
-    hingga_pattern = r'Hingga\s+(.+)'
-    match = re.search(hingga_pattern, registration_date, re.IGNORECASE)
+    match = _REG_HINGGA_RE.search(registration_date)
     if match:
         return match.group(1).strip()
     
     # Pattern 4: "s.d." or "s/d" format (sampai dengan)
     # Match: s.d. DD Month YYYY or s/d DD Month YYYY
-    sd_pattern = r's[./]d[.]?\s+(.+)'
-    match = re.search(sd_pattern, registration_date, re.IGNORECASE)
+    match = _REG_SD_RE.search(registration_date)
     if match:
         return match.group(1).strip()
     
     # Pattern 5: Single date (assume it's the deadline)
     # Match: DD Month YYYY
-    single_pattern = r'(\d{1,2}\s+\w+\s+\d{4})'
-    match = re.search(single_pattern, registration_date)
-    if match:
-        return match.group(1).strip()
+    if has_digit:
+        match = _REG_SINGLE_RE.search(registration_date)
+        if match:
+            return match.group(1).strip()
     
     return None
 
@@ -1353,55 +1590,62 @@ def parse_registration_date_to_dates(registration_date: str) -> dict:
         >>> parse_registration_date_to_dates("14 April 2026")
         {'start_date': None, 'end_date': '2026-04-14'}
     """
-    result = {
-        'start_date': None,
-        'end_date': None
+    # Parsed through _parse_date, whose result depends on today
+    start_date, end_date = _parse_registration_date_cached(registration_date, datetime.now().date())
+    return {
+        'start_date': start_date,
+        'end_date': end_date
     }
+
+
+@lru_cache(maxsize=4096)
+def _parse_registration_date_cached(registration_date: str, today: date) -> Tuple[Optional[str], Optional[str]]:
+    """Memoized worker for parse_registration_date_to_dates (tuple result so cached values stay immutable)"""
+    start_date = None
+    end_date = None
     
     if not registration_date:
-        return result
+        return start_date, end_date
     
     # Pattern 1: Date range "1 April 2026 - 14 April 2026"
-    range_pattern_full = r'(\d{1,2}\s+\w+\s+\d{4})\s*[-–]\s*(\d{1,2}\s+\w+\s+\d{4})'
-    match = re.search(range_pattern_full, registration_date)
+    match = _REG_RANGE_FULL_RE.search(registration_date)
     if match:
         start_str, end_str = match.group(1), match.group(2)
         
         # Parse dates
-        start_parsed = dateparser.parse(start_str, languages=['id', 'en'])
-        end_parsed = dateparser.parse(end_str, languages=['id', 'en'])
+        start_parsed = _parse_date(start_str)
+        end_parsed = _parse_date(end_str)
         
         if start_parsed:
-            result['start_date'] = start_parsed.date().isoformat()
+            start_date = start_parsed.date().isoformat()
         if end_parsed:
-            result['end_date'] = end_parsed.date().isoformat()
+            end_date = end_parsed.date().isoformat()
         
-        return result
+        return start_date, end_date
     
     # Pattern 2: Date range "1-14 April 2026" (same month)
-    range_pattern_same_month = r'(\d{1,2})\s*[-–]\s*(\d{1,2})\s+(\w+)\s+(\d{4})'
-    match = re.search(range_pattern_same_month, registration_date)
+    match = _REG_RANGE_SAME_MONTH_RE.search(registration_date)
     if match:
         day1, day2, month, year = match.groups()
         start_str = f"{day1} {month} {year}"
         end_str = f"{day2} {month} {year}"
         
         # Parse dates
-        start_parsed = dateparser.parse(start_str, languages=['id', 'en'])
-        end_parsed = dateparser.parse(end_str, languages=['id', 'en'])
+        start_parsed = _parse_date(start_str)
+        end_parsed = _parse_date(end_str)
         
         if start_parsed:
-            result['start_date'] = start_parsed.date().isoformat()
+            start_date = start_parsed.date().isoformat()
         if end_parsed:
-            result['end_date'] = end_parsed.date().isoformat()
+            end_date = end_parsed.date().isoformat()
         
-        return result
+        return start_date, end_date
     
     # Pattern 3: "Hingga X" or single date (only end date)
     deadline = extract_deadline_from_registration(registration_date)
     if deadline:
-        deadline_parsed = dateparser.parse(deadline, languages=['id', 'en'])
+        deadline_parsed = _parse_date(deadline)
         if deadline_parsed:
-            result['end_date'] = deadline_parsed.date().isoformat()
+            end_date = deadline_parsed.date().isoformat()
     
-    return result
+    return start_date, end_date
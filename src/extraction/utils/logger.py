@@ -3,11 +3,29 @@ Logging utility for Python extractor
 """
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from datetime import datetime
 
-class ColoredFormatter(logging.Formatter):
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders asctime once per second instead of per record"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, '')
+    
+    def formatTime(self, record, datefmt=None):
+        # Our datefmt has whole-second resolution, so records logged within
+        # the same second share one localtime() + strftime() call
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = super().formatTime(record, datefmt)
+            self._time_cache = (second, formatted)
+        return formatted
+
+class ColoredFormatter(CachedTimeFormatter):
     """Custom formatter with colors"""
     
     COLORS = {
@@ -24,15 +42,19 @@ class ColoredFormatter(logging.Formatter):
         record.levelname = f"{color}{record.levelname}{self.RESET}"
         return super().format(record)
 
-def setup_logger(name='extractor'):
-    """Setup logger with file and console handlers with proper Unicode support"""
-    
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-    
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
+# File records are buffered and written in batches of this many (or sooner on
+# ERROR); logging.shutdown() at exit flushes whatever is left
+FILE_BUFFER_CAPACITY = 256
+
+# Console handler shared by every logger: stdout only needs reconfiguring once,
+# not once per module that calls setup_logger
+_console_handler = None
+
+def _get_console_handler():
+    """Build the shared console handler on first use"""
+    global _console_handler
+    if _console_handler is not None:
+        return _console_handler
     
     # Console handler with UTF-8 encoding for cross-platform Unicode support
     console_handler = logging.StreamHandler(sys.stdout)
@@ -62,6 +84,21 @@ def setup_logger(name='extractor'):
     )
     console_handler.setFormatter(console_formatter)
     
+    _console_handler = console_handler
+    return console_handler
+
+def setup_logger(name='extractor'):
+    """Setup logger with file and console handlers with proper Unicode support"""
+    
+    logger = logging.getLogger(name)
+    
+    # Already configured (handlers are attached once per logger name)
+    if getattr(logger, '_configured', False):
+        return logger
+    
+    logger.setLevel(logging.DEBUG)
+    console_handler = _get_console_handler()
+    
     # File handler with UTF-8 encoding
     log_dir = Path(__file__).parent.parent.parent.parent / 'logs'
     log_dir.mkdir(exist_ok=True)
@@ -69,13 +106,22 @@ def setup_logger(name='extractor'):
     log_file = log_dir / f"{name}_{datetime.now().strftime('%Y-%m-%d')}.log"
     file_handler = logging.FileHandler(log_file, encoding='utf-8', errors='replace')
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
+    file_formatter = CachedTimeFormatter(
         '[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
     
+    # DEBUG goes to the file, so most records land there: buffer them instead
+    # of a write + flush per record
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        FILE_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_file_handler)
+    logger._configured = True
     
     return logger
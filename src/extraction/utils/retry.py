@@ -0,0 +1,25 @@
+"""
+Retry backoff utility
+"""
+
+import random
+
+
+def backoff_delay(attempt: int, cap: float, base: float = 1.0) -> float:
+    """
+    Exponential backoff with jitter for retry attempt N (1-based)
+
+    Half of the delay is fixed and half is random, so clients that failed
+    together (parallel workers, several API keys hitting the same 503) don't
+    all retry at the same instant.
+
+    Args:
+        attempt: Retry attempt number, starting at 1
+        cap: Maximum delay in seconds
+        base: Delay for the first attempt before doubling
+
+    Returns:
+        Seconds to wait before retrying
+    """
+    delay = min(base * 2 ** attempt, cap)
+    return delay / 2 + random.uniform(0, delay / 2)
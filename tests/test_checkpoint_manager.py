@@ -394,6 +394,29 @@ class TestCheckpointManager:
             state = json.load(f)
         
         assert state['accounts_remaining'] == []
+    
+    def test_save_checkpoint_growing_results(self, temp_checkpoint_dir, sample_results, sample_accounts):
+        """Test saving the same list after each account writes every result so far"""
+        manager = CheckpointManager(temp_checkpoint_dir)
+        results = []
+        
+        for index, result in enumerate(sample_results):
+            results.append(result)
+            manager.save_checkpoint(
+                account_index=index,
+                account_name=sample_accounts[index],
+                results=results,
+                total_accounts=5,
+                accounts_list=sample_accounts
+            )
+            
+            with open(manager.results_file, 'r', encoding='utf-8') as f:
+                assert json.load(f) == results
+        
+        checkpoint, loaded = manager.load_checkpoint()
+        
+        assert checkpoint is not None
+        assert loaded == sample_results
 
 
 # Test convenience functions
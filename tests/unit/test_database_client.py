@@ -0,0 +1,83 @@
+"""
+Unit Tests for DatabaseClient
+
+Tests the read-query retry when the database connection is lost
+"""
+import psycopg2
+import pytest
+from database.client import DatabaseClient, READ_RETRY_ATTEMPTS
+
+
+def make_connection(mocker, rows=None, error=None, closed_on_error=1):
+    """Build a fake psycopg2 connection whose cursor returns rows or raises error"""
+    connection = mocker.MagicMock()
+    connection.closed = 0
+    cursor = connection.cursor.return_value
+    if error is not None:
+        def fail(*args, **kwargs):
+            connection.closed = closed_on_error
+            raise error
+        cursor.execute.side_effect = fail
+    cursor.fetchall.return_value = rows or []
+    return connection
+
+
+@pytest.fixture
+def no_sleep(mocker):
+    """Skip the retry backoff"""
+    return mocker.patch('database.client.time.sleep')
+
+
+@pytest.mark.unit
+class TestExecuteQueryRetry:
+    """Tests for execute_query reconnect/retry"""
+    
+    def test_reconnects_after_dropped_connection(self, mocker, no_sleep):
+        """Test a dropped connection is replaced and the query retried"""
+        dropped = make_connection(mocker, error=psycopg2.OperationalError('server closed the connection'))
+        healthy = make_connection(mocker, rows=[{'id': 1}])
+        connect = mocker.patch('database.client.psycopg2.connect', side_effect=[dropped, healthy])
+        
+        client = DatabaseClient('postgresql://example/db')
+        
+        assert client.execute_query('SELECT 1') == [{'id': 1}]
+        assert connect.call_count == 2
+    
+    def test_raises_after_all_attempts_when_still_down(self, mocker, no_sleep):
+        """Test an unreachable database uses up every attempt, then raises the real error"""
+        connect = mocker.patch(
+            'database.client.psycopg2.connect',
+            side_effect=psycopg2.OperationalError('could not connect to server')
+        )
+        
+        client = DatabaseClient('postgresql://example/db')
+        
+        with pytest.raises(psycopg2.OperationalError, match='could not connect'):
+            client.execute_query('SELECT 1')
+        assert connect.call_count == READ_RETRY_ATTEMPTS
+    
+    def test_recovers_when_reconnect_fails_once(self, mocker, no_sleep):
+        """Test a failed reconnect uses up one attempt instead of aborting the retry"""
+        dropped = make_connection(mocker, error=psycopg2.OperationalError('server closed the connection'))
+        healthy = make_connection(mocker, rows=[{'id': 2}])
+        mocker.patch(
+            'database.client.psycopg2.connect',
+            side_effect=[dropped, psycopg2.OperationalError('could not connect to server'), healthy]
+        )
+        
+        client = DatabaseClient('postgresql://example/db')
+        
+        assert client.execute_query('SELECT 1') == [{'id': 2}]
+    
+    def test_does_not_retry_on_open_connection(self, mocker, no_sleep):
+        """Test errors on a live connection (e.g. statement timeout) are not retried"""
+        timed_out = make_connection(
+            mocker, error=psycopg2.OperationalError('canceling statement due to statement timeout'), closed_on_error=0
+        )
+        connect = mocker.patch('database.client.psycopg2.connect', return_value=timed_out)
+        
+        client = DatabaseClient('postgresql://example/db')
+        
+        with pytest.raises(psycopg2.OperationalError, match='statement timeout'):
+            client.execute_query('SELECT 1')
+        assert connect.call_count == 1
@@ -329,3 +329,24 @@ class TestGetByPostId:
         result = duplicate_detector._get_by_post_id('NONEXISTENT')
         
         assert result is None
+    
+    def test_prime_post_ids_single_query(self, duplicate_detector, mock_db_client, sample_extracted_data):
+        """Test priming answers later lookups (hits and misses) from one query"""
+        mock_db_client.execute_query.return_value = [sample_extracted_data]
+        
+        duplicate_detector.prime_post_ids(['TEST_POST_123', 'NONEXISTENT', None])
+        
+        assert duplicate_detector._get_by_post_id('TEST_POST_123')['post_id'] == 'TEST_POST_123'
+        assert duplicate_detector._get_by_post_id('NONEXISTENT') is None
+        assert mock_db_client.execute_query.call_count == 1
+    
+    def test_forget_post_id_queries_again(self, duplicate_detector, mock_db_client, sample_extracted_data):
+        """Test a forgotten post_id is looked up in the database again"""
+        duplicate_detector.prime_post_ids(['TEST_POST_123'])
+        duplicate_detector.forget_post_id('TEST_POST_123')
+        mock_db_client.execute_query.return_value = [sample_extracted_data]
+        
+        result = duplicate_detector._get_by_post_id('TEST_POST_123')
+        
+        assert result['post_id'] == 'TEST_POST_123'
+        assert mock_db_client.execute_query.call_count == 2
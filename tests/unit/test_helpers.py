@@ -8,10 +8,18 @@ Tests regex fallback patterns including:
 - Organizer extraction
 """
 import pytest
+from datetime import date, datetime, timedelta
 from extraction.utils.helpers import (
     extract_registration_date_fallback,
     extract_dates,
-    convert_month_to_indonesian
+    categorize_dates,
+    convert_month_to_indonesian,
+    parse_registration_date_to_dates,
+    extract_fee_amount,
+    extract_organizer_fallback,
+    _extract_registration_date_cached,
+    _parse_date,
+    _parse_date_cached
 )
 
 
@@ -117,6 +125,26 @@ class TestExtractRegistrationDate:
         assert "27" in result
         assert "1" in result
 
+    def test_extract_date_uppercase_deadline(self):
+        """Test anchor prefilter still matches uppercase DL/DEADLINE lines"""
+        text = "DEADLINE: 1-5 Juni 2026"
+
+        result = extract_registration_date_fallback(text)
+
+        assert result is not None
+        assert "1 Juni 2026 - 5 Juni 2026" == result
+    
+    def test_extract_date_repeated_caption_is_cached(self):
+        """Test a repeated caption is served from the cache with the same result"""
+        text = "Pendaftaran dibuka hingga 30 Juni 2026 (repost)"
+        
+        first = extract_registration_date_fallback(text)
+        hits_before = _extract_registration_date_cached.cache_info().hits
+        second = extract_registration_date_fallback(text)
+        
+        assert second == first
+        assert _extract_registration_date_cached.cache_info().hits == hits_before + 1
+
 
 @pytest.mark.unit
 class TestExtractDates:
@@ -148,6 +176,164 @@ class TestExtractDates:
         dates = extract_dates(text)
         
         assert isinstance(dates, list)
+    
+    def test_extract_dates_every_month_name(self):
+        """Test every Indonesian and English month name is recognized"""
+        year = datetime.now().year + 1
+        names = ['Januari', 'January', 'Februari', 'February', 'Maret', 'March',
+                 'April', 'Mei', 'May', 'Juni', 'June', 'Juli', 'July', 'Agustus',
+                 'August', 'September', 'Oktober', 'October', 'November',
+                 'Desember', 'December']
+        
+        for name in names:
+            dates = extract_dates(f"Deadline 15 {name} {year}")
+            assert len(dates) == 1, name
+
+
+@pytest.mark.unit
+class TestParseDate:
+    """Tests for the fast-path date parser"""
+    
+    def test_parse_indonesian_day_month_year(self):
+        """Test Indonesian month names parse without dateparser"""
+        assert _parse_date("5 Mei 2026").date().isoformat() == "2026-05-05"
+        assert _parse_date("17 agustus 2026").date().isoformat() == "2026-08-17"
+    
+    def test_parse_english_month_day_year(self):
+        """Test English 'Month D, YYYY' format"""
+        assert _parse_date("April 27, 2026").date().isoformat() == "2026-04-27"
+    
+    def test_parse_iso(self):
+        """Test ISO format"""
+        assert _parse_date("2026-04-01").date().isoformat() == "2026-04-01"
+
+    def test_parse_placeholder_returns_none(self):
+        """Test empty and punctuation-only placeholders are rejected"""
+        assert _parse_date("") is None
+        assert _parse_date("  ") is None
+        assert _parse_date(" - ") is None
+    
+    def test_parse_numeric_matches_dateparser_order(self):
+        """Test slash/dot dates keep dateparser's month-first reading when ambiguous"""
+        assert _parse_date("15/04/2026").date().isoformat() == "2026-04-15"
+        assert _parse_date("1.4.2026").date().isoformat() == "2026-01-04"
+    
+    def test_parse_invalid_day_returns_none(self):
+        """Test impossible dates still return None"""
+        assert _parse_date("31 April 2026") is None
+    
+    def test_parse_day_month_without_year(self):
+        """Test year-less dates take the current year like dateparser"""
+        year = datetime.now().year
+        assert _parse_date("5 Desember") == datetime(year, 12, 5)
+        assert _parse_date("Mei 17") == datetime(year, 5, 17)
+        assert _parse_date("0 Desember") is None
+    
+    def test_parse_day_month_year_follows_cache_key(self):
+        """Test year-less dates take the year of the today key, not the clock"""
+        assert _parse_date_cached("5 Desember", date(2001, 6, 1)) == datetime(2001, 12, 5)
+        assert _parse_date_cached("5 Desember", date(2002, 6, 1)) == datetime(2002, 12, 5)
+        assert _parse_date_cached("Mei 17", date(2001, 6, 1)) == datetime(2001, 5, 17)
+    
+    def test_parse_overlong_string_returns_none(self):
+        """Test caption-sized input is rejected without reaching dateparser"""
+        assert _parse_date("5 Mei 2026 " + "x" * 300) is None
+    
+    def test_parse_relative_date_not_frozen_across_days(self, monkeypatch):
+        """Test a memoized relative date is resolved again once the day changes"""
+        from extraction.utils import helpers
+        
+        class FakeDatetime(datetime):
+            current = datetime(2001, 1, 1, 9, 0)
+            
+            @classmethod
+            def now(cls, tz=None):
+                return cls.current
+        
+        calls = []
+        
+        def fake_get_date_data(date_str):
+            calls.append(date_str)
+            return {'date_obj': FakeDatetime.current + timedelta(days=1)}
+        
+        monkeypatch.setattr(helpers, 'datetime', FakeDatetime)
+        monkeypatch.setattr(helpers._DATE_PARSER, 'get_date_data', fake_get_date_data)
+        
+        assert _parse_date("besok") == datetime(2001, 1, 2, 9, 0)
+        assert _parse_date("besok") == datetime(2001, 1, 2, 9, 0)
+        assert len(calls) == 1
+        
+        FakeDatetime.current = datetime(2001, 1, 2, 9, 0)
+        assert _parse_date("besok") == datetime(2001, 1, 3, 9, 0)
+        assert len(calls) == 2
+    
+    def test_registration_dates_cached_result_not_shared(self):
+        """Test memoized parsing hands out a fresh dict per call"""
+        first = parse_registration_date_to_dates("1 April 2026 - 14 April 2026")
+        first['start_date'] = 'mutated'
+        
+        second = parse_registration_date_to_dates("1 April 2026 - 14 April 2026")
+        
+        assert second == {'start_date': '2026-04-01', 'end_date': '2026-04-14'}
+
+
+@pytest.mark.unit
+class TestCategorizeDates:
+    """Tests for context-based date categorization"""
+    
+    def test_categorize_by_line_keywords(self):
+        """Test each line's keywords decide the date category"""
+        text = (
+            "Pendaftaran: 01-04 s/d 14-04\n"
+            "Pelaksanaan lomba: 20-05\n"
+            "Pengumuman pemenang: 01-06"
+        )
+        dates = ['2026-04-01', '2026-04-14', '2026-05-20', '2026-06-01']
+        
+        result = categorize_dates(text, dates)
+        
+        assert result['registration_start'] == '2026-04-01'
+        assert result['registration_end'] == '2026-04-14'
+        assert result['event_start'] == '2026-05-20'
+        assert result['announcement_date'] == '2026-06-01'
+    
+    def test_categorize_registration_takes_priority(self):
+        """Test registration keywords win over event keywords on one line"""
+        text = "Pendaftaran lomba ditutup 30-04"
+        
+        result = categorize_dates(text, ['2026-04-30'])
+        
+        assert result['registration_end'] == '2026-04-30'
+        assert result['event_start'] is None
+
+
+@pytest.mark.unit
+class TestFeeExtraction:
+    """Tests for fee amount extraction"""
+    
+    def test_extract_rupiah_with_separators(self):
+        """Test thousand separators and decimal comma are normalized"""
+        assert extract_fee_amount("Biaya pendaftaran Rp 350.000") == 350000.0
+        assert extract_fee_amount("HTM Rp75.000,50 per tim") == 75000.5
+    
+    def test_extract_k_notation(self):
+        """Test K suffix is multiplied to thousands"""
+        assert extract_fee_amount("Cuma 25K aja!") == 25000.0
+    
+    def test_free_event_returns_none(self):
+        """Test free indicators short-circuit extraction"""
+        assert extract_fee_amount("GRATIS! Tanpa biaya pendaftaran") is None
+    
+    def test_extract_fee_keyword_on_later_line(self):
+        """Test a keyword line without digits does not hide a later one"""
+        text = "Biaya: cek di bio\nBiaya pendaftaran 50.000 per orang"
+        
+        assert extract_fee_amount(text) == 50000.0
+    
+    def test_extract_fee_long_runs_without_amount(self):
+        """Test long digit and keyword runs with no fee yield None"""
+        assert extract_fee_amount("1" * 50000) is None
+        assert extract_fee_amount("biaya " * 20000) is None
 
 
 @pytest.mark.unit
@@ -328,3 +514,26 @@ class TestOrganizerExtraction:
         
         # Should extract "Universitas Indonesia"
         assert "Universitas Indonesia" in text
+    
+    def test_extract_organizer_from_hashtag_in_unicode_caption(self):
+        """Test ASCII hashtag matching still works inside emoji/Unicode captions"""
+        text = "Kursus liburan 🎉 — daftar sekarang! #PareKampungInggris"
+        
+        assert extract_organizer_fallback(text, 'infolomba') == "Pare Kampung Inggris"
+    
+    def test_extract_organizer_long_school_list_without_verb(self):
+        """Test a long institution list with no context verb yields no organizer"""
+        text = "Terbuka untuk: " + "SMA " * 3000
+        
+        assert extract_organizer_fallback(text, 'infolomba') is None
+    
+    def test_extract_organizer_repeated_caption_is_cached(self):
+        """Test a repeated caption/account pair is served from the cache"""
+        text = "Lomba esai nasional oleh @bem_universitas_indonesia (repost)"
+        
+        first = extract_organizer_fallback(text, 'infolomba')
+        hits_before = extract_organizer_fallback.cache_info().hits
+        second = extract_organizer_fallback(text, 'infolomba')
+        
+        assert second == first
+        assert extract_organizer_fallback.cache_info().hits == hits_before + 1
@@ -0,0 +1,79 @@
+"""
+Unit Tests for DataInserter
+
+Tests the concurrent chunked insert:
+- Records sharing a slug stay in one chunk
+- Organizers are created once before the fan-out
+"""
+import pytest
+from database.inserter import DataInserter
+
+
+def make_record(slug, organizer_name=None):
+    """Build a minimal normalized record"""
+    return {'slug': slug, 'post_id': f'post-{slug}', 'organizer_name': organizer_name}
+
+
+@pytest.mark.unit
+class TestChunkBySlug:
+    """Tests for _chunk_by_slug"""
+    
+    def test_shared_slug_stays_in_one_chunk(self):
+        """Test reposts of the same opportunity are never split across chunks"""
+        records = [make_record('a'), make_record('b'), make_record('c'), make_record('a'), make_record('d')]
+        
+        chunks = DataInserter._chunk_by_slug(records, chunk_size=2)
+        
+        assert [[r['slug'] for r in chunk] for chunk in chunks] == [['a', 'a'], ['b', 'c'], ['d']]
+    
+    def test_shared_post_id_stays_in_one_chunk(self):
+        """Test records linked through a post_id or a slug are never split"""
+        records = [
+            {'slug': 'a', 'post_id': 'p1'},
+            {'slug': 'b', 'post_id': 'p2'},
+            {'slug': 'c', 'post_id': 'p1'},
+            {'slug': 'b', 'post_id': 'p3'},
+            {'slug': 'd', 'post_id': 'p3'},
+        ]
+        
+        chunks = DataInserter._chunk_by_slug(records, chunk_size=2)
+        
+        assert [[r['slug'] for r in chunk] for chunk in chunks] == [['a', 'c'], ['b', 'b', 'd']]
+    
+    def test_records_without_slug_are_kept(self):
+        """Test records with no slug or post_id still end up in a chunk"""
+        records = [{'title': 'x'}, {'title': 'y'}, {'title': 'z'}]
+        
+        chunks = DataInserter._chunk_by_slug(records, chunk_size=2)
+        
+        assert sum(len(chunk) for chunk in chunks) == 3
+
+
+@pytest.mark.unit
+class TestInsertBatchChunkedParallel:
+    """Tests for insert_batch_chunked with workers > 1"""
+    
+    def test_organizers_created_before_fan_out(self, mocker, mock_db_client):
+        """Test each new organizer is created once and its id reaches every worker"""
+        mock_db_client.database_url = 'postgresql://test'
+        mock_db_client.bulk_get_or_create_organizers.return_value = {'Org A': 'org-1', 'Org B': 'org-2'}
+        mocker.patch('database.inserter.DatabaseClient')
+        
+        seen_ids = []
+        
+        def run_chunk(inserter, chunk):
+            seen_ids.append(dict(inserter._organizer_ids))
+            return {
+                'newly_inserted': len(chunk), 'updated_existing': 0, 'skipped_expired': 0,
+                'skipped_no_dates': 0, 'skipped_duplicate_slugs': 0, 'database_errors': 0,
+            }, None
+        
+        mocker.patch.object(DataInserter, '_run_chunk', side_effect=run_chunk)
+        records = [make_record(str(i), 'Org A' if i % 2 else 'Org B') for i in range(6)]
+        
+        stats = DataInserter(mock_db_client).insert_batch_chunked(records, chunk_size=2, workers=3)
+        
+        mock_db_client.bulk_get_or_create_organizers.assert_called_once()
+        assert len(seen_ids) == 3
+        assert all(ids == {'Org A': 'org-1', 'Org B': 'org-2'} for ids in seen_ids)
+        assert stats['newly_inserted'] == 6
@@ -129,7 +129,15 @@ class TestSlugGeneration:
         normalized = normalizer.normalize_opportunity(data)
         
         assert normalized['slug'] == 'lomba-essay-2026'
-    
+
+    def test_generate_slug_collapses_hyphen_runs(self, normalizer):
+        """Test mixed spaces/hyphens collapse and are trimmed from the ends"""
+        data = {'title': '- LOMBA -- ESSAY\t- 2026 -'}
+
+        normalized = normalizer.normalize_opportunity(data)
+
+        assert normalized['slug'] == 'lomba-essay-2026'
+
     def test_generate_slug_truncates_long_slug(self, normalizer):
         """Test slug truncation for very long titles"""
         data = {'title': 'A' * 150}
@@ -242,6 +250,18 @@ class TestTypeMapping:
         
         assert normalized['type_id'] is None
 
+    def test_normalize_type_mixed_case_database_codes(self, type_mapping, audience_mapping):
+        """Test database codes are matched regardless of their case"""
+        upper_types = {code.upper(): uuid for code, uuid in type_mapping.items()}
+        upper_audiences = {code.upper(): uuid for code, uuid in audience_mapping.items()}
+        normalizer = DataNormalizer(upper_audiences, upper_types)
+        data = {'category': 'competition', 'audiences': ['sma']}
+        
+        normalized = normalizer.normalize_opportunity(data)
+        
+        assert normalized['type_id'] == type_mapping['competition']
+        assert normalized['audience_ids'] == [audience_mapping['sma']]
+
 
 @pytest.mark.unit
 class TestDescriptionNormalization:
@@ -371,6 +391,35 @@ class TestDateParsing:
         assert normalized['dates']['end_date'] is None
         assert normalized['dates']['deadline_date'] is None
 
+    def test_normalize_batch_matches_single(self, normalizer):
+        """Test batch normalization gives the same dates as one-by-one"""
+        records = [
+            {'post_id': '1', 'title': 'A', 'registration_date': '15 April 2026 - 20 April 2026'},
+            {'post_id': '2', 'title': 'B', 'registration_date': '15 April 2026 - 20 April 2026'},
+            {'post_id': '3', 'title': 'C'},
+        ]
+        
+        batch = normalizer.normalize_batch(records)
+        
+        assert [r['post_id'] for r in batch] == ['1', '2', '3']
+        for record, normalized in zip(records, batch):
+            assert normalized['dates'] == normalizer.normalize_opportunity(record)['dates']
+        # Shared parse result must not be the same dict object
+        assert batch[0]['dates'] is not batch[1]['dates']
+
+    def test_normalize_batch_parallel_matches_serial(self, normalizer, monkeypatch):
+        """Test process-pool date parsing gives the same records as in-process"""
+        monkeypatch.setattr('database.normalizer.PARALLEL_MIN_DATES', 1)
+        records = [
+            {'post_id': str(i), 'title': f'Lomba {i}', 'registration_date': f'{i} Mei 2026'}
+            for i in range(1, 6)
+        ] + [{'post_id': '6', 'title': 'Lomba 6', 'registration_date': 'Hingga 5 Mei 2026'}]
+        
+        serial = normalizer.normalize_batch(records)
+        parallel = normalizer.normalize_batch(records, workers=2)
+        
+        assert parallel == serial
+
 
 @pytest.mark.unit
 class TestTagGeneration:
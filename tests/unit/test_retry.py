@@ -0,0 +1,34 @@
+"""
+Unit Tests for Retry Backoff
+
+Tests the jittered exponential backoff used by the API and database clients
+"""
+import pytest
+from extraction.utils.retry import backoff_delay
+
+
+@pytest.mark.unit
+class TestBackoffDelay:
+    """Tests for backoff_delay"""
+    
+    def test_delay_within_jitter_bounds(self):
+        """Test delay stays between half and all of the exponential step"""
+        for attempt in range(1, 4):
+            step = 2 ** attempt
+            for _ in range(50):
+                delay = backoff_delay(attempt, cap=100)
+                assert step / 2 <= delay <= step
+    
+    def test_delay_respects_cap(self):
+        """Test delay never exceeds the cap"""
+        for _ in range(50):
+            assert backoff_delay(10, cap=5) <= 5
+    
+    def test_delay_is_jittered(self):
+        """Test repeated calls don't all return the same delay"""
+        delays = {backoff_delay(3, cap=100) for _ in range(20)}
+        assert len(delays) > 1
+    
+    def test_base_scales_delay(self):
+        """Test base shrinks the delay for fast retries"""
+        assert backoff_delay(1, cap=100, base=0.25) <= 0.5